@@ -0,0 +1,100 @@
+"""
+Benchmark stdlib json against orjson on the app's JSON hot paths
+
+Usage (from backend/):
+    python -m benchmarks.bench_json --iterations 20000
+"""
+
+import argparse
+import json
+import timeit
+
+import orjson
+
+from benchmarks.fakes import ANALYSIS, seed_records
+
+# Body of a POST /leads response, as FastAPI hands it to the response class
+LEAD_RESPONSE = {
+    "success": True,
+    "lead_id": "rec00000001",
+    "qualified_lead": {
+        "name": "Jane Smith",
+        "email": "jane@example.com",
+        "phone": "+1234567890",
+        "company": "Acme Corp",
+        "website": "https://acme.example.com/",
+        "message": "We need a CRM for our 50-person sales team. Budget is $50k. "
+        "Looking to implement within 2 weeks.",
+        "source": "web_form",
+        "score": 87.5,
+        "priority": "hot",
+        "analysis": ANALYSIS,
+        "created_at": "2024-01-01T12:00:00",
+    },
+    "error": None,
+    "processing_time": 0.512,
+    "scoring_path": "llm",
+    "model_tier": "strong",
+    "timing": {
+        "stages": {
+            stage: {"duration_ms": 12.345, "status": "ran"}
+            for stage in ("prompt", "queue", "llm", "parse", "score", "storage")
+        },
+        "total_ms": 512.3,
+    },
+}
+
+GEMINI_REPLY = json.dumps(ANALYSIS)
+MIRROR_FIELDS = json.dumps(seed_records(1)[0]["fields"])
+
+CASES = {
+    "response render": (
+        lambda: json.dumps(LEAD_RESPONSE).encode("utf-8"),
+        lambda: orjson.dumps(LEAD_RESPONSE),
+    ),
+    "gemini reply parse": (
+        lambda: json.loads(GEMINI_REPLY),
+        lambda: orjson.loads(GEMINI_REPLY),
+    ),
+    "airtable fields encode": (
+        lambda: (
+            json.dumps(ANALYSIS["pain_points"]),
+            json.dumps(ANALYSIS["budget_signals"]),
+        ),
+        lambda: (
+            orjson.dumps(ANALYSIS["pain_points"]).decode("utf-8"),
+            orjson.dumps(ANALYSIS["budget_signals"]).decode("utf-8"),
+        ),
+    ),
+    "mirror record decode": (
+        lambda: json.loads(MIRROR_FIELDS),
+        lambda: orjson.loads(MIRROR_FIELDS),
+    ),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark stdlib json against orjson on the app's JSON hot paths"
+    )
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'case':<24} {'json':>10} {'orjson':>10} {'speedup':>8}")
+    for name, (stdlib, fast) in CASES.items():
+        # Best of several runs, in µs per call
+        stdlib_us, fast_us = (
+            min(timeit.repeat(fn, number=args.iterations, repeat=args.repeat))
+            / args.iterations
+            * 1e6
+            for fn in (stdlib, fast)
+        )
+        print(
+            f"{name:<24} {stdlib_us:>8.2f}µs {fast_us:>8.2f}µs "
+            f"{stdlib_us / fast_us:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
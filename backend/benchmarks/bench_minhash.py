@@ -0,0 +1,75 @@
+"""
+Benchmark MinHash index build and query times
+
+Usage (from backend/):
+    python -m benchmarks.bench_minhash --entries 10000 --queries 1000
+"""
+
+import argparse
+import random
+import time
+
+from utils.minhash import MinHashIndex
+
+WORDS = (
+    "we need crm sales team budget approved urgent demo pricing quote "
+    "marketing automation support agents pipeline integration reporting "
+    "growth partner referral campaign onboarding enterprise startup seats "
+    "migrate spreadsheet follow up leads email phone week month quarter"
+).split()
+
+
+def _message(rng: random.Random, length: int = 60) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(length))
+
+
+def _mutate(rng: random.Random, message: str, changes: int = 1) -> str:
+    """Replace a few words, like a templated message with a new name"""
+    words = message.split()
+    for _ in range(changes):
+        words[rng.randrange(len(words))] = rng.choice(WORDS)
+    return " ".join(words)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark MinHash index build and query times"
+    )
+    parser.add_argument("--entries", type=int, default=10000)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--threshold", type=float, default=0.8)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    messages = [_message(rng) for _ in range(args.entries)]
+    index = MinHashIndex(threshold=args.threshold, max_entries=args.entries)
+
+    start = time.perf_counter()
+    for i, message in enumerate(messages):
+        index.add(str(i), message, i)
+    build_seconds = time.perf_counter() - start
+
+    # Half near-duplicates of indexed messages, half fresh messages
+    queries = [
+        _mutate(rng, rng.choice(messages)) if i % 2 == 0 else _message(rng)
+        for i in range(args.queries)
+    ]
+    start = time.perf_counter()
+    matches = sum(1 for query in queries if index.query(query) is not None)
+    query_seconds = time.perf_counter() - start
+
+    print(f"Entries:       {args.entries}")
+    print(
+        f"Build:         {build_seconds:.3f}s "
+        f"({build_seconds / args.entries * 1e6:.1f} µs/entry)"
+    )
+    print(
+        f"Query:         {query_seconds:.3f}s "
+        f"({query_seconds / args.queries * 1e6:.1f} µs/query)"
+    )
+    print(f"Matches:       {matches}/{args.queries} (about half are near-duplicates)")
+
+
+if __name__ == "__main__":
+    main()
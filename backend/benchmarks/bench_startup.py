@@ -0,0 +1,73 @@
+"""
+Benchmark app import and service startup time in fresh interpreters
+
+Usage (from backend/):
+    python -m benchmarks.bench_startup --runs 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+# Each phase runs in a new interpreter and prints its own duration
+PHASES = {
+    "import_main": "import main",
+    "create_services": "import main; main.get_agent(); main.get_lead_writer()",
+    "load_gemini_sdk": "import main; main.get_agent().load_model()",
+}
+
+TIMER = (
+    "import time; _start = time.perf_counter(); {code}; "
+    "print(time.perf_counter() - _start)"
+)
+
+
+def run_phase(code: str, env: Dict[str, str]) -> float:
+    """Seconds a snippet takes in a fresh interpreter"""
+    output = subprocess.run(
+        [sys.executable, "-c", TIMER.format(code=code)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(output.stdout.strip().splitlines()[-1])
+
+
+def main_cli(argv: Optional[List[str]] = None):
+    """Run each startup phase several times and report min/median"""
+    parser = argparse.ArgumentParser(description="Benchmark app startup time")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", help="Optional JSON file for the results")
+    args = parser.parse_args(argv)
+
+    env = dict(os.environ)
+    for name in ("GEMINI_API_KEY", "AIRTABLE_API_KEY", "AIRTABLE_BASE_ID"):
+        env.setdefault(name, "benchmark")
+    # Keep the benchmark from creating a mirror database in the working tree
+    env.setdefault("LEAD_MIRROR_PATH", ":memory:")
+
+    results = {}
+    for phase, code in PHASES.items():
+        samples = [run_phase(code, env) for _ in range(args.runs)]
+        results[phase] = {
+            "min_s": round(min(samples), 3),
+            "median_s": round(statistics.median(samples), 3),
+        }
+        print(
+            f"{phase:<16} min {results[phase]['min_s']:.3f}s  "
+            f"median {results[phase]['median_s']:.3f}s",
+            flush=True,
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,155 @@
+"""
+In-process stand-ins for Gemini and Airtable with configurable latency
+"""
+
+import asyncio
+import itertools
+import json
+import random
+import re
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Dict, List, Tuple
+
+ANALYSIS = {
+    "industry": "Software",
+    "company_size": "Medium",
+    "budget_signals": ["Budget mentioned"],
+    "pain_points": ["Manual follow-ups", "Lost deals"],
+    "urgency_level": "medium",
+    "buying_intent": "evaluating",
+    "recommended_action": "Schedule a demo this week",
+}
+
+# Each lead of a packed prompt starts with a "Lead <index>:" header
+PACKED_LEAD = re.compile(r"\nLead \d+:")
+
+
+class BackendError(Exception):
+    """Injected failure of a fake backend"""
+
+
+@dataclass
+class LatencyProfile:
+    """
+    Response time and failure behaviour of a fake backend
+
+    Each call takes latency_ms plus a uniform random jitter of up to
+    jitter_ms, and fails with probability error_rate.
+    """
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+
+    def delay(self, rng: random.Random) -> float:
+        """Seconds the next call should take"""
+        return (self.latency_ms + rng.uniform(0, self.jitter_ms)) / 1000
+
+    def fails(self, rng: random.Random) -> bool:
+        """Whether the next call should fail"""
+        return rng.random() < self.error_rate
+
+
+class FakeGeminiModel:
+    """
+    Async stand-in for genai.GenerativeModel
+
+    Answers single, packed and streamed prompts with a fixed analysis
+    after the profile's delay.
+    """
+
+    def __init__(self, profile: LatencyProfile, seed: int = 0):
+        """Initialize fake model"""
+        self.profile = profile
+        self.rng = random.Random(seed)
+        self.calls = 0
+        self.errors = 0
+
+    async def generate_content_async(self, prompt: str, stream: bool = False, **_):
+        """Reply to a prompt like the Gemini SDK does"""
+        self.calls += 1
+        await asyncio.sleep(self.profile.delay(self.rng))
+        if self.profile.fails(self.rng):
+            self.errors += 1
+            raise BackendError("Injected Gemini failure")
+
+        lead_count = len(PACKED_LEAD.findall(prompt))
+        if lead_count:
+            text = json.dumps(
+                [{"lead_index": i, **ANALYSIS} for i in range(lead_count)]
+            )
+        else:
+            text = json.dumps(ANALYSIS)
+
+        if not stream:
+            return SimpleNamespace(text=text)
+
+        async def chunks():
+            for i in range(0, len(text), 64):
+                yield SimpleNamespace(text=text[i : i + 64])
+
+        return chunks()
+
+
+class FakeAirtableClient:
+    """
+    Stand-in for AirtableClient writes
+
+    Called from worker threads like the real client, so delays block
+    with time.sleep. Keeps what was written so tests can inspect it.
+    """
+
+    def __init__(self, profile: LatencyProfile, seed: int = 0):
+        """Initialize fake client"""
+        self.profile = profile
+        self.rng = random.Random(seed)
+        self._ids = itertools.count(1)
+        self.batches = 0
+        self.created: Dict[str, Dict] = {}
+        self.updates: List[Tuple[str, Dict]] = []
+        self.errors = 0
+
+    def create_leads(self, leads: List[Dict]) -> List[str]:
+        """Pretend to batch create records"""
+        self._call()
+        self.batches += 1
+        record_ids = [f"rec{next(self._ids):08d}" for _ in leads]
+        self.created.update(zip(record_ids, leads))
+        return record_ids
+
+    def update_lead(self, record_id: str, updates: Dict) -> bool:
+        """Pretend to update a record"""
+        try:
+            self._call()
+        except BackendError:
+            return False
+        self.updates.append((record_id, updates))
+        return True
+
+    def _call(self):
+        """Apply the latency profile to one request"""
+        time.sleep(self.profile.delay(self.rng))
+        if self.profile.fails(self.rng):
+            self.errors += 1
+            raise BackendError("Injected Airtable failure")
+
+
+def seed_records(count: int) -> List[Dict]:
+    """Airtable-shaped records for filling a benchmark mirror"""
+    priorities = ["hot", "warm", "cold"]
+    return [
+        {
+            "id": f"recseed{i:08d}",
+            "createdTime": f"2024-01-01T00:{i // 60 % 60:02d}:{i % 60:02d}.000Z",
+            "fields": {
+                "Name": f"Seed Lead {i}",
+                "Email": f"seed{i}@example.com",
+                "Message": "Seeded lead for benchmarking",
+                "Score": float(i % 100),
+                "Priority": priorities[i % 3],
+            },
+        }
+        for i in range(count)
+    ]
@@ -0,0 +1,262 @@
+"""
+Load test of the API request path against in-process fake backends
+
+Usage (from backend/):
+    python -m benchmarks.load_test --concurrency 1,8,32 --requests 200
+    python -m benchmarks.load_test --gemini-latency 800 --gemini-jitter 400 \\
+        --gemini-error-rate 0.02 --output results.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional, cast
+
+import httpx
+
+import main
+from benchmarks.fakes import (
+    FakeAirtableClient,
+    FakeGeminiModel,
+    LatencyProfile,
+    seed_records,
+)
+from services.scheduler import QualificationScheduler
+
+ENDPOINTS = ["leads", "leads_stream", "leads_batch", "list_leads"]
+CREDENTIALS = ("GEMINI_API_KEY", "AIRTABLE_API_KEY", "AIRTABLE_BASE_ID")
+BATCH_SIZE = 10
+
+
+def lead_payload() -> Dict:
+    """A unique lead, so no request is answered from a cache"""
+    token = uuid.uuid4().hex
+    return {
+        "name": f"Bench {token[:8]}",
+        "email": f"bench-{token}@example.com",
+        "message": f"Looking at CRM options for our team, reference {token}.",
+        "source": "web_form",
+    }
+
+
+async def _post_lead(client: httpx.AsyncClient) -> httpx.Response:
+    return await client.post("/leads", json=lead_payload())
+
+
+async def _post_lead_stream(client: httpx.AsyncClient) -> httpx.Response:
+    response = await client.post("/leads/stream", json=lead_payload())
+    if "event: result" not in response.text:
+        response.status_code = 599
+    return response
+
+
+async def _post_batch(client: httpx.AsyncClient) -> httpx.Response:
+    return await client.post(
+        "/leads/batch", json=[lead_payload() for _ in range(BATCH_SIZE)]
+    )
+
+
+async def _list_leads(client: httpx.AsyncClient) -> httpx.Response:
+    return await client.get("/leads", params={"priority": "hot", "limit": 50})
+
+
+REQUESTS: Dict[str, Callable] = {
+    "leads": _post_lead,
+    "leads_stream": _post_lead_stream,
+    "leads_batch": _post_batch,
+    "list_leads": _list_leads,
+}
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, min(len(ordered), math.ceil(pct / 100 * len(ordered))))
+    return ordered[rank - 1]
+
+
+async def run_level(
+    client: httpx.AsyncClient, endpoint: str, concurrency: int, total: int
+) -> Dict:
+    """
+    Send `total` requests to one endpoint with `concurrency` in flight
+
+    Returns:
+        Dict with throughput, error count and latency percentiles
+    """
+    send = REQUESTS[endpoint]
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            start = time.perf_counter()
+            try:
+                response = await send(client)
+                failed = response.status_code >= 400
+            except Exception:  # pylint: disable=broad-except
+                failed = True
+            latencies.append(time.perf_counter() - start)
+            errors += failed
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "endpoint": endpoint,
+        "concurrency": concurrency,
+        "requests": total,
+        "errors": errors,
+        "duration_s": round(elapsed, 3),
+        "rps": round(total / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+def install_fakes(
+    gemini: LatencyProfile,
+    airtable: LatencyProfile,
+    seed_count: int,
+    warm: bool,
+):
+    """
+    Point main.app at the fake backends
+
+    Args:
+        gemini: Latency profile of the fake Gemini model
+        airtable: Latency profile of the fake Airtable writes
+        seed_count: Records to pre-load into the read mirror
+        warm: Keep the heuristic, near-duplicate and dedupe short-cuts
+            enabled; by default every lead takes the full Gemini path
+    """
+    # Services refuse to start without credentials; the fakes never use them
+    for name in CREDENTIALS:
+        if not getattr(main.settings, name):
+            setattr(main.settings, name, "benchmark")
+    # Before the Airtable client exists, so it never opens leads_mirror.db
+    main.settings.LEAD_MIRROR_PATH = ":memory:"
+
+    main.agent.model = FakeGeminiModel(gemini)
+    # The fake has no quota, so the scheduler must not throttle it
+    main.agent.scheduler = QualificationScheduler(rpm_limit=10**9, tpm_limit=10**12)
+
+    fake_airtable = FakeAirtableClient(airtable)
+    main.lead_writer.client = fake_airtable
+    main.airtable.update_lead = fake_airtable.update_lead
+
+    main.airtable.mirror.replace_all(seed_records(seed_count))
+
+    if not warm:
+        main.settings.HEURISTIC_ENABLED = False
+        main.settings.NEAR_DUPLICATE_ENABLED = False
+        main.settings.DEDUPE_WINDOW_HOURS = 0
+
+
+async def run_benchmark(
+    endpoints: List[str],
+    concurrency_levels: List[int],
+    requests_per_level: int,
+) -> List[Dict]:
+    """Run every endpoint at every concurrency level against main.app"""
+    # httpx types its ASGI app more narrowly than FastAPI's signature
+    transport = httpx.ASGITransport(app=cast(Any, main.app))
+    results = []
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://benchmark", timeout=None
+    ) as client:
+        for endpoint in endpoints:
+            for concurrency in concurrency_levels:
+                result = await run_level(
+                    client, endpoint, concurrency, requests_per_level
+                )
+                results.append(result)
+                print(
+                    f"{endpoint:<13} c={concurrency:<4} "
+                    f"{result['rps']:>9.1f} req/s  "
+                    f"p50 {result['p50_ms']:>8.1f}ms  "
+                    f"p95 {result['p95_ms']:>8.1f}ms  "
+                    f"p99 {result['p99_ms']:>8.1f}ms  "
+                    f"errors {result['errors']}",
+                    flush=True,
+                )
+    await main.lead_writer.stop()
+    return results
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(description="Load test the lead API")
+    parser.add_argument(
+        "--endpoints",
+        default=",".join(ENDPOINTS),
+        help=f"Comma-separated subset of: {', '.join(ENDPOINTS)}",
+    )
+    parser.add_argument("--concurrency", default="1,8,32")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--gemini-latency", type=float, default=500.0, help="ms")
+    parser.add_argument("--gemini-jitter", type=float, default=250.0, help="ms")
+    parser.add_argument("--gemini-error-rate", type=float, default=0.0)
+    parser.add_argument("--airtable-latency", type=float, default=150.0, help="ms")
+    parser.add_argument("--airtable-jitter", type=float, default=50.0, help="ms")
+    parser.add_argument("--airtable-error-rate", type=float, default=0.0)
+    parser.add_argument("--seed-records", type=int, default=5000)
+    parser.add_argument(
+        "--warm",
+        action="store_true",
+        help="Keep heuristic, near-duplicate and dedupe short-cuts enabled",
+    )
+    parser.add_argument("--output", default="benchmark_results.json")
+    return parser.parse_args(argv)
+
+
+def main_cli(argv: Optional[List[str]] = None):
+    """Run the load test and write results to a JSON file"""
+    args = parse_args(argv)
+    endpoints = [name for name in args.endpoints.split(",") if name]
+    unknown = set(endpoints) - set(ENDPOINTS)
+    if unknown:
+        raise SystemExit(f"Unknown endpoints: {', '.join(sorted(unknown))}")
+
+    gemini = LatencyProfile(
+        args.gemini_latency, args.gemini_jitter, args.gemini_error_rate
+    )
+    airtable = LatencyProfile(
+        args.airtable_latency, args.airtable_jitter, args.airtable_error_rate
+    )
+    install_fakes(gemini, airtable, args.seed_records, args.warm)
+
+    concurrency_levels = [int(level) for level in args.concurrency.split(",")]
+    results = asyncio.run(run_benchmark(endpoints, concurrency_levels, args.requests))
+
+    report = {
+        "config": {
+            "requests_per_level": args.requests,
+            "concurrency": concurrency_levels,
+            "gemini": vars(gemini),
+            "airtable": vars(airtable),
+            "seed_records": args.seed_records,
+            "warm": args.warm,
+        },
+        "results": results,
+        "backend_errors": {
+            "gemini": main.agent.model.errors,
+            "airtable": main.lead_writer.client.errors,
+        },
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"📄 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main_cli()
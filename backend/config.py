@@ -2,6 +2,7 @@
 Configuration management
 """
 from functools import lru_cache
+from typing import Optional, TypeVar
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -9,10 +10,11 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class Settings(BaseSettings):
     """Application settings from environment variables"""
 
-    # API Keys
-    GEMINI_API_KEY: str
-    AIRTABLE_API_KEY: str
-    AIRTABLE_BASE_ID: str
+    # API Keys (checked when the services using them are created, so the
+    # app can be imported without credentials)
+    GEMINI_API_KEY: str = ""
+    AIRTABLE_API_KEY: str = ""
+    AIRTABLE_BASE_ID: str = ""
     AIRTABLE_TABLE_NAME: str = "Leads"
 
     # API Config
@@ -20,6 +22,110 @@ class Settings(BaseSettings):
     API_PORT: int = 8000
     DEBUG: bool = True
 
+    # Gemini Config
+    GEMINI_MAX_CONCURRENCY: int = 32
+    GEMINI_PACK_SIZE: int = 5
+    # Ask for schema-constrained JSON replies (validated into AIAnalysis)
+    GEMINI_STRUCTURED_OUTPUT: bool = True
+
+    # Gemini model tiers: referrals, long messages (GEMINI_STRONG_MIN_WORDS+)
+    # and leads with budget or decision-maker signals use the strong model,
+    # other leads the fast one. The strong tier falls back to the fast one
+    # past GEMINI_STRONG_RPM_LIMIT requests/minute. Costs (per 1K tokens)
+    # feed the per-tier spend metric
+    GEMINI_ROUTING_ENABLED: bool = True
+    GEMINI_STRONG_MODEL: str = "models/gemini-flash-latest"
+    GEMINI_FAST_MODEL: str = "models/gemini-flash-lite-latest"
+    GEMINI_STRONG_MIN_WORDS: int = 60
+    GEMINI_STRONG_RPM_LIMIT: int = 300
+    GEMINI_STRONG_COST_PER_1K_TOKENS: float = 0.0003
+    GEMINI_FAST_COST_PER_1K_TOKENS: float = 0.0001
+
+    # Gemini quota budgets (per worker) and max time a request may queue
+    GEMINI_RPM_LIMIT: int = 1000
+    GEMINI_TPM_LIMIT: int = 1000000
+    GEMINI_QUEUE_TIMEOUT: float = 30.0
+
+    # Gemini call deadline (seconds) and request hedging: once
+    # GEMINI_HEDGE_MIN_SAMPLES latencies are known, a call still running past
+    # the observed GEMINI_HEDGE_PERCENTILE gets one backup request. Backups are
+    # capped at GEMINI_HEDGE_BUDGET of calls and only use spare quota
+    GEMINI_TIMEOUT_SECONDS: float = 30.0
+    GEMINI_HEDGE_ENABLED: bool = False
+    GEMINI_HEDGE_PERCENTILE: float = 95.0
+    GEMINI_HEDGE_BUDGET: float = 0.05
+    GEMINI_HEDGE_MIN_SAMPLES: int = 20
+
+    # Qualification Cache (empty path keeps the cache in memory only)
+    QUALIFICATION_CACHE_SIZE: int = 10000
+    QUALIFICATION_CACHE_TTL: float = 86400.0
+    QUALIFICATION_CACHE_PATH: str = ""
+
+    # Airtable Rate Limiting (Airtable allows 5 requests/second per base)
+    AIRTABLE_RATE_LIMIT: float = 5.0
+    AIRTABLE_BURST: int = 5
+    AIRTABLE_MAX_RETRIES: int = 5
+    AIRTABLE_BACKOFF_BASE: float = 0.5
+    AIRTABLE_BACKOFF_MAX: float = 30.0
+    # Seconds to connect and to wait for a response, so a hung request
+    # (or /health probe thread) gives up instead of blocking forever
+    AIRTABLE_CONNECT_TIMEOUT: int = 5
+    AIRTABLE_READ_TIMEOUT: int = 30
+
+    # Airtable Write Buffer
+    AIRTABLE_BATCH_SIZE: int = 10
+    AIRTABLE_FLUSH_INTERVAL: float = 0.25
+
+    # Batch Qualification
+    LEADS_BATCH_CONCURRENCY: int = 32
+    LEADS_BATCH_MAX_SIZE: int = 1000
+
+    # Local read replica of the leads table (intervals in seconds)
+    LEAD_MIRROR_PATH: str = "leads_mirror.db"
+    LEAD_MIRROR_SYNC_INTERVAL: float = 30.0
+    STATS_RECONCILE_INTERVAL: float = 300.0
+
+    # Near-duplicate messages (MinHash Jaccard estimate) reuse a recent analysis
+    NEAR_DUPLICATE_ENABLED: bool = True
+    NEAR_DUPLICATE_THRESHOLD: float = 0.8
+    NEAR_DUPLICATE_MAX_ENTRIES: int = 10000
+
+    # Heuristic pre-scorer: confident scores at or outside these bounds skip Gemini
+    HEURISTIC_ENABLED: bool = True
+    HEURISTIC_MIN_CONFIDENCE: float = 0.7
+    HEURISTIC_LOW_SCORE: float = 35.0
+    HEURISTIC_HIGH_SCORE: float = 85.0
+
+    # Repeat submissions inside the window reuse the existing record (0 disables)
+    DEDUPE_WINDOW_HOURS: float = 24.0
+    DEDUPE_SIMILARITY_THRESHOLD: float = 0.8
+
+    # Background dependency probes served by /health (seconds unless noted)
+    HEALTH_PROBE_INTERVAL: float = 15.0
+    HEALTH_PROBE_TIMEOUT: float = 5.0
+    HEALTH_STALE_AFTER: float = 60.0
+    HEALTH_SLOW_MS: float = 2000.0
+    HEALTH_PROBE_WINDOW: int = 20
+    # Answer /health with 503 while Gemini or Airtable is down (otherwise 200 degraded)
+    HEALTH_FAIL_ON_DEPENDENCY_DOWN: bool = False
+
+    # Gemini circuit breaker: opens when the failure share of the last
+    # CIRCUIT_WINDOW calls reaches CIRCUIT_FAILURE_RATE (calls slower than
+    # CIRCUIT_SLOW_CALL_SECONDS count as failures), fails fast to the
+    # heuristic scorer for CIRCUIT_OPEN_SECONDS, then lets
+    # CIRCUIT_HALF_OPEN_PROBES calls test recovery
+    CIRCUIT_ENABLED: bool = True
+    CIRCUIT_FAILURE_RATE: float = 0.5
+    CIRCUIT_MIN_CALLS: int = 10
+    CIRCUIT_WINDOW: int = 20
+    CIRCUIT_SLOW_CALL_SECONDS: float = 15.0
+    CIRCUIT_OPEN_SECONDS: float = 30.0
+    CIRCUIT_HALF_OPEN_PROBES: int = 3
+
+    # JSON backend for responses, Gemini replies and Airtable fields:
+    # "json" (stdlib) or "orjson" (needs the orjson package)
+    JSON_BACKEND: str = "json"
+
     # Lead Scoring Thresholds
     HIGH_SCORE_THRESHOLD: float = 80.0
     MEDIUM_SCORE_THRESHOLD: float = 60.0
@@ -34,3 +140,11 @@ class Settings(BaseSettings):
 def get_settings() -> Settings:
     """Get cached settings instance"""
     return Settings()
+
+
+T = TypeVar("T")
+
+
+def default(value: Optional[T], fallback: T) -> T:
+    """An explicit argument, or the configured default when it is None"""
+    return fallback if value is None else value
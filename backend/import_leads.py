@@ -0,0 +1,333 @@
+"""
+Bulk import of historical leads from CSV, JSON or NDJSON files
+
+Usage (from backend/):
+    python import_leads.py ../demo/sample_leads.json
+    python import_leads.py leads.csv --chunk-size 500
+    python import_leads.py leads.ndjson --restart
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import os
+import sys
+import time
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
+
+from pydantic import ValidationError
+
+from models.schemas import LeadInput
+from services.ai_agent import LeadQualificationAgent
+from services.airtable_client import AIRTABLE_MAX_BATCH, AirtableClient
+from services.lead_records import build_lead_data, build_qualified_lead
+
+logger = logging.getLogger(__name__)
+
+READ_SIZE = 64 * 1024
+_decoder = json.JSONDecoder()
+
+
+def detect_format(path: str) -> str:
+    """Input format from the file extension (csv, ndjson or json)"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".ndjson", ".jsonl"):
+        return "ndjson"
+    return "json"
+
+
+def iter_rows(stream: TextIO, fmt: str) -> Iterator[Optional[Dict]]:
+    """
+    Stream rows from an open file without loading it whole
+
+    Args:
+        stream: Open text file
+        fmt: csv, ndjson or json (a top-level array of objects)
+
+    Yields:
+        One dict per row, or None for an NDJSON line that is not valid JSON
+    """
+    if fmt == "csv":
+        for row in csv.DictReader(stream):
+            # Empty CSV cells mean "not provided"
+            yield {key: value for key, value in row.items() if value not in ("", None)}
+    elif fmt == "ndjson":
+        for line in stream:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                yield None
+    else:
+        yield from iter_json_array(stream)
+
+
+def iter_json_array(stream: TextIO) -> Iterator[Dict]:
+    """
+    Decode the elements of a top-level JSON array incrementally
+
+    Reads fixed-size chunks and decodes one element at a time with
+    raw_decode, so memory stays proportional to the largest element.
+    """
+    buffer = ""
+    pos = 0
+    started = False
+    eof = False
+
+    while True:
+        # Skip whitespace and separators between elements
+        while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+            pos += 1
+
+        if pos < len(buffer):
+            if not started:
+                if buffer[pos] != "[":
+                    raise ValueError("Expected a JSON array of leads")
+                started = True
+                pos += 1
+                continue
+            if buffer[pos] == "]":
+                return
+            try:
+                element, end = _decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                yield element
+                pos = end
+                continue
+
+        if eof:
+            if started:
+                raise ValueError("Unterminated JSON array")
+            return
+
+        chunk = stream.read(READ_SIZE)
+        eof = not chunk
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+
+class Checkpoint:
+    """
+    Progress of an import, persisted after every Airtable batch
+
+    Rows are consumed in file order and only recorded once their leads
+    are written, so resuming skips exactly the rows that are already in
+    Airtable.
+    """
+
+    def __init__(self, path: str, source: str):
+        """Load the checkpoint if one exists for this source file"""
+        self.path = path
+        self.source = os.path.abspath(source)
+        self.rows_done = 0
+        self.imported = 0
+        self.invalid = 0
+
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("source") == self.source:
+                self.rows_done = state["rows_done"]
+                self.imported = state["imported"]
+                self.invalid = state["invalid"]
+
+    def save(self):
+        """Write the checkpoint atomically"""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "source": self.source,
+                    "rows_done": self.rows_done,
+                    "imported": self.imported,
+                    "invalid": self.invalid,
+                },
+                f,
+            )
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        """Remove the checkpoint once the import has finished"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class LeadImporter:
+    """
+    Qualifies and writes leads chunk by chunk
+
+    Each chunk is validated and qualified concurrently through the agent
+    (which packs leads into shared Gemini requests), then written with
+    Airtable batch creates. The checkpoint advances after every batch, so
+    a failure part-way through a chunk never re-creates written leads.
+    """
+
+    def __init__(self, agent, airtable, checkpoint: Checkpoint, chunk_size: int):
+        """Initialize importer"""
+        self.agent = agent
+        self.airtable = airtable
+        self.checkpoint = checkpoint
+        self.chunk_size = chunk_size
+        self.rows_seen = 0
+        self.started_at = time.monotonic()
+
+    async def run(self, rows: Iterator[Optional[Dict]]):
+        """
+        Import all rows after the checkpoint
+
+        Raises:
+            Exception: If an Airtable write fails; the checkpoint still
+                points at the start of the failed batch
+        """
+        chunk: List[Tuple[int, Optional[Dict]]] = []
+        for row_number, row in enumerate(rows, start=1):
+            if row_number <= self.checkpoint.rows_done:
+                continue
+            chunk.append((row_number, row))
+            if len(chunk) >= self.chunk_size:
+                await self._import_chunk(chunk)
+                chunk = []
+
+        if chunk:
+            await self._import_chunk(chunk)
+
+    async def _import_chunk(self, chunk: List[Tuple[int, Optional[Dict]]]):
+        """Validate, qualify and write one chunk, checkpointing each batch"""
+        row_numbers: List[int] = []
+        leads: List[LeadInput] = []
+        invalid_rows: List[int] = []
+        for row_number, row in chunk:
+            if row is None:
+                invalid_rows.append(row_number)
+                logger.warning("Skipping malformed row %s", row_number)
+                continue
+            try:
+                leads.append(LeadInput.model_validate(row))
+                row_numbers.append(row_number)
+            except ValidationError as e:
+                invalid_rows.append(row_number)
+                logger.warning(
+                    "Skipping invalid row %s: %s", row_number, _first_error(e)
+                )
+
+        if leads:
+            results = await self.agent.qualify_leads(leads)
+            lead_data = [
+                build_lead_data(build_qualified_lead(lead, result))
+                for lead, result in zip(leads, results)
+            ]
+            for start in range(0, len(lead_data), AIRTABLE_MAX_BATCH):
+                batch = lead_data[start : start + AIRTABLE_MAX_BATCH]
+                await asyncio.to_thread(self.airtable.create_leads, batch)
+                self._advance(
+                    row_numbers[start + len(batch) - 1], len(batch), invalid_rows
+                )
+
+        # Trailing invalid rows after the last written batch
+        self._advance(chunk[-1][0], 0, invalid_rows)
+        self.rows_seen += len(chunk)
+        self.report()
+
+    def _advance(self, rows_done: int, imported: int, invalid_rows: List[int]):
+        """Record rows up to `rows_done` as handled and save the checkpoint"""
+        self.checkpoint.invalid += sum(
+            1 for row in invalid_rows if self.checkpoint.rows_done < row <= rows_done
+        )
+        self.checkpoint.imported += imported
+        self.checkpoint.rows_done = rows_done
+        self.checkpoint.save()
+
+    def report(self, final: bool = False):
+        """Print progress and throughput"""
+        elapsed = time.monotonic() - self.started_at
+        rate = self.rows_seen / elapsed if elapsed else 0.0
+        print(
+            f"{'✅ Done' if final else '📥 Progress'}: "
+            f"{self.checkpoint.rows_done} rows | "
+            f"{self.checkpoint.imported} imported | "
+            f"{self.checkpoint.invalid} invalid | "
+            f"{rate:.1f} rows/s",
+            flush=True,
+        )
+
+
+def _first_error(error: ValidationError) -> str:
+    """Short description of the first validation error"""
+    detail = error.errors()[0]
+    location = ".".join(str(part) for part in detail["loc"])
+    return f"{location}: {detail['msg']}"
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Qualify and import a file of leads into Airtable"
+    )
+    parser.add_argument("path", help="CSV, JSON array or NDJSON file of leads")
+    parser.add_argument(
+        "--format",
+        choices=["csv", "json", "ndjson"],
+        help="Input format (default: from the file extension)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=200,
+        help="Rows qualified and written per checkpointed chunk",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        help="Checkpoint file (default: <path>.checkpoint)",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore an existing checkpoint and import from the first row",
+    )
+    return parser.parse_args(argv)
+
+
+async def main(argv: Optional[List[str]] = None) -> int:
+    """Run an import and return the process exit code"""
+    args = parse_args(argv)
+    checkpoint_path = args.checkpoint or f"{args.path}.checkpoint"
+    if args.restart and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+    checkpoint = Checkpoint(checkpoint_path, args.path)
+    if checkpoint.rows_done:
+        print(f"⏩ Resuming after row {checkpoint.rows_done}")
+
+    agent = LeadQualificationAgent()
+    importer = LeadImporter(agent, AirtableClient(), checkpoint, args.chunk_size)
+
+    with open(args.path, encoding="utf-8", newline="") as stream:
+        try:
+            await importer.run(
+                iter_rows(stream, args.format or detect_format(args.path))
+            )
+        except Exception as e:
+            print(
+                f"❌ Import stopped: {e}. Re-run the same command to resume "
+                f"after row {checkpoint.rows_done}.",
+                file=sys.stderr,
+            )
+            return 1
+        finally:
+            await agent.scheduler.stop()
+
+    importer.report(final=True)
+    checkpoint.clear()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
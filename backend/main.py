@@ -2,20 +2,46 @@
 FastAPI main application
 """
 
+import asyncio
 import time
 from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
 
 from config import get_settings
-from models.schemas import HealthCheck, LeadInput, LeadResponse, QualifiedLead
+from models.schemas import (
+    BatchLeadResponse,
+    HealthCheck,
+    LeadInput,
+    LeadPriority,
+    LeadResponse,
+    TimingBreakdown,
+)
 from services.ai_agent import LeadQualificationAgent
-from services.airtable_client import AirtableClient
+from services.airtable_client import AirtableClient, airtable_timestamp
+from services.dedupe import DuplicateIndex
+from services.health import HealthProber
+from services.lead_records import build_lead_data, build_qualified_lead
+from services.lead_writer import LeadWriteBuffer
+from services.metrics import (
+    count_scoring_path,
+    current_request_timings,
+    registry,
+    time_stage,
+)
+from services.server_timing import ServerTimingMiddleware
+from utils import fast_json
 
 
 settings = get_settings()
 
+# JSONResponse, or ORJSONResponse with JSON_BACKEND=orjson
+ResponseClass = fast_json.response_class()
+
 
 # Lifespan context manager
 @asynccontextmanager
@@ -23,9 +49,46 @@ async def lifespan(_: FastAPI):  # El guion bajo indica "ignora este valor"
     """Startup and shutdown events"""
     # Startup
     print("🚀 Starting AI Lead Agent...")
+    agent = get_agent()
+    airtable = get_airtable()
+    lead_writer = get_lead_writer()
+    await lead_writer.start()
+    background_tasks = [
+        asyncio.create_task(get_health().run()),
+        # Load the Gemini SDK off the event loop instead of blocking startup
+        asyncio.create_task(asyncio.to_thread(agent.load_model)),
+    ]
+    if airtable.configured:
+        background_tasks += [
+            asyncio.create_task(
+                _run_periodically(airtable.reconcile, settings.STATS_RECONCILE_INTERVAL)
+            ),
+            asyncio.create_task(
+                _run_periodically(
+                    airtable.sync_mirror,
+                    settings.LEAD_MIRROR_SYNC_INTERVAL,
+                    # The startup reconcile already brings the mirror up to date
+                    initial_delay=settings.LEAD_MIRROR_SYNC_INTERVAL,
+                )
+            ),
+        ]
+    else:
+        print("⚠️ Airtable credentials not set, skipping stats and mirror sync")
     yield
     # Shutdown
     print("👋 Shutting down AI Lead Agent...")
+    for task in background_tasks:
+        task.cancel()
+    await lead_writer.stop()
+    await agent.scheduler.stop()
+
+
+async def _run_periodically(job: Callable, interval: float, initial_delay: float = 0):
+    """Run a blocking maintenance job in a thread every `interval` seconds"""
+    await asyncio.sleep(initial_delay)
+    while True:
+        await asyncio.to_thread(job)
+        await asyncio.sleep(interval)
 
 
 # Initialize FastAPI app
@@ -34,6 +97,7 @@ app = FastAPI(
     description="Intelligent lead scoring and qualification using Google Gemini",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ResponseClass,
 )
 
 # CORS middleware
@@ -43,11 +107,67 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
+app.add_middleware(ServerTimingMiddleware)
+
+# Services are created on first use (or at startup by lifespan), so
+# importing this module stays cheap and needs no credentials
+_SERVICE_FACTORIES: Dict[str, Callable[[], Any]] = {
+    "agent": LeadQualificationAgent,
+    "airtable": AirtableClient,
+    "lead_writer": lambda: LeadWriteBuffer(get_airtable()),
+    "dedupe": DuplicateIndex,
+    # Probes look the services up when they run, so creating the prober
+    # does not create them
+    "health": lambda: HealthProber(
+        {
+            "gemini": lambda: get_agent().probe(),
+            "airtable": lambda: get_airtable().probe(),
+        }
+    ),
+}
+
+
+def _service(name: str) -> Any:
+    """Return a module-level service, creating it on first use"""
+    instance = globals().get(name)
+    if instance is None:
+        instance = _SERVICE_FACTORIES[name]()
+        globals()[name] = instance
+    return instance
+
+
+def __getattr__(name: str) -> Any:
+    """Create services on first attribute access (e.g. main.agent)"""
+    if name in _SERVICE_FACTORIES:
+        return _service(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_agent() -> LeadQualificationAgent:
+    """Lead qualification agent"""
+    return _service("agent")
+
 
-# Initialize services
-agent = LeadQualificationAgent()
-airtable = AirtableClient()
+def get_airtable() -> AirtableClient:
+    """Airtable client"""
+    return _service("airtable")
+
+
+def get_lead_writer() -> LeadWriteBuffer:
+    """Airtable write-behind buffer"""
+    return _service("lead_writer")
+
+
+def get_dedupe() -> DuplicateIndex:
+    """Duplicate-lead index"""
+    return _service("dedupe")
+
+
+def get_health() -> HealthProber:
+    """Dependency health prober"""
+    return _service("health")
 
 
 @app.get("/", response_model=HealthCheck)
@@ -62,18 +182,36 @@ async def root():
     )
 
 
-@app.get("/health", response_model=HealthCheck)
+@app.get(
+    "/health",
+    response_model=HealthCheck,
+    responses={503: {"model": HealthCheck, "description": "The worker is unhealthy"}},
+)
 async def health_check():
-    """Detailed health check"""
-    return HealthCheck(
-        status="healthy",
+    """
+    Detailed health check
+
+    Serves the latest background probe results without contacting
+    Gemini or Airtable, so frequent polling stays cheap. A down
+    dependency reports degraded with 200, since every worker shares it
+    and restarting them would not help; 503 is kept for failures of this
+    worker (or any down dependency with HEALTH_FAIL_ON_DEPENDENCY_DOWN).
+    """
+    snapshot = get_health().snapshot()
+    dependencies = snapshot["dependencies"]
+    health = HealthCheck(
+        status=snapshot["status"],
         services={
             "api": "running",
             "ai_agent": "operational",
-            "gemini_api": "connected",
-            "airtable": "connected",
+            "gemini_api": dependencies["gemini"]["status"],
+            "airtable": dependencies["airtable"]["status"],
         },
+        dependencies=dependencies,
     )
+    if health.status == "unhealthy":
+        return ResponseClass(status_code=503, content=health.model_dump(mode="json"))
+    return health
 
 
 @app.post("/leads", response_model=LeadResponse)
@@ -90,76 +228,335 @@ async def qualify_lead(lead: LeadInput):
     start_time = time.time()
 
     try:
-        # Qualify lead with AI
-        result = await agent.qualify_lead(lead)
-
-        # Build qualified lead object
-
-        qualified_lead = QualifiedLead(
-            name=lead.name,
-            email=lead.email,
-            phone=lead.phone,
-            company=lead.company,
-            website=str(lead.website) if lead.website else None,
-            message=lead.message,
-            source=lead.source,
-            score=result["score"],
-            priority=result["priority"],
-            analysis=result["analysis"],
-        )
-
-        # Save to Airtable
-        lead_data = {
-            "name": qualified_lead.name,
-            "email": qualified_lead.email,
-            "phone": qualified_lead.phone,
-            "company": qualified_lead.company,
-            "website": qualified_lead.website,
-            "message": qualified_lead.message,
-            "source": qualified_lead.source.value,
-            "score": qualified_lead.score,
-            "priority": qualified_lead.priority.value,
-            "analysis": {
-                "industry": qualified_lead.analysis.industry,
-                "company_size": qualified_lead.analysis.company_size,
-                "urgency_level": qualified_lead.analysis.urgency_level,
-                "buying_intent": qualified_lead.analysis.buying_intent,
-                "pain_points": qualified_lead.analysis.pain_points,
-                "budget_signals": qualified_lead.analysis.budget_signals,
-                "recommended_action": (qualified_lead.analysis.recommended_action),
-            },
-        }
+        # Repeat submissions attach to the lead already saved
+        duplicate = await _attach_duplicate(lead, start_time)
+        if duplicate is not None:
+            return duplicate
 
-        record_id = airtable.create_lead(lead_data)
-
-        processing_time = time.time() - start_time
+        # Qualify lead with AI
+        result = await get_agent().qualify_lead(lead)
 
-        return LeadResponse(
-            success=True,
-            lead_id=record_id,
-            qualified_lead=qualified_lead,
-            processing_time=processing_time,
-        )
+        return await _save_lead(lead, result, start_time)
 
     except Exception as e:
-        processing_time = time.time() - start_time
         raise HTTPException(
             status_code=500,
             detail=f"Lead qualification failed: {str(e)}",
         ) from e
 
 
+@app.post("/leads/stream")
+async def qualify_lead_stream(lead: LeadInput):
+    """
+    Qualify a new lead, streaming progress as Server-Sent Events
+
+    Events:
+        field: {"field": ..., "value": ...} as each analysis field is parsed
+        result: the full LeadResponse once scored and saved
+        error: {"detail": ...} if qualification fails
+    """
+
+    async def events():
+        start_time = time.time()
+        result: Optional[Dict] = None
+        try:
+            duplicate = await _attach_duplicate(lead, start_time)
+            if duplicate is not None:
+                yield _sse("result", duplicate.model_dump(mode="json"))
+                return
+
+            async for kind, data in get_agent().stream_lead(lead):
+                if kind == "field":
+                    field, value = data
+                    yield _sse("field", {"field": field, "value": value})
+                else:
+                    result = data
+            if result is None:
+                raise RuntimeError("analysis stream ended without a result")
+
+            response = await _save_lead(lead, result, start_time)
+            yield _sse("result", response.model_dump(mode="json"))
+
+        except Exception as e:
+            yield _sse("error", {"detail": f"Lead qualification failed: {str(e)}"})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _sse(event: str, data: Dict) -> str:
+    """Format one Server-Sent Event"""
+    return f"event: {event}\ndata: {fast_json.dumps(data)}\n\n"
+
+
+@app.post("/leads/batch", response_model=BatchLeadResponse)
+async def qualify_leads_batch(leads: List[LeadInput]):
+    """
+    Qualify a burst of leads concurrently
+
+    Args:
+        leads: List of lead information
+
+    Returns:
+        BatchLeadResponse with one result per lead, in input order
+    """
+    if len(leads) > settings.LEADS_BATCH_MAX_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch too large: max {settings.LEADS_BATCH_MAX_SIZE} leads",
+        )
+
+    start_time = time.time()
+    semaphore = asyncio.Semaphore(settings.LEADS_BATCH_CONCURRENCY)
+
+    async def save(lead: LeadInput, result: Dict) -> LeadResponse:
+        try:
+            # Concurrent saves are grouped by the write buffer
+            return await _save_lead(lead, result, start_time, with_timing=False)
+
+        except Exception as e:
+            return LeadResponse(
+                success=False,
+                error=f"Lead qualification failed: {str(e)}",
+                processing_time=time.time() - start_time,
+            )
+
+    async def process(pack: List[LeadInput]) -> List[LeadResponse]:
+        try:
+            # Each pack shares one Gemini request
+            async with semaphore:
+                results = await get_agent().qualify_leads(pack)
+
+        except Exception as e:
+            return [
+                LeadResponse(
+                    success=False,
+                    error=f"Lead qualification failed: {str(e)}",
+                    processing_time=time.time() - start_time,
+                )
+                for _ in pack
+            ]
+
+        return list(await asyncio.gather(*(save(l, r) for l, r in zip(pack, results))))
+
+    pack_size = max(1, settings.GEMINI_PACK_SIZE)
+    packs = [leads[i : i + pack_size] for i in range(0, len(leads), pack_size)]
+    pack_responses = await asyncio.gather(*(process(pack) for pack in packs))
+    results = [response for pack in pack_responses for response in pack]
+    succeeded = sum(1 for r in results if r.success)
+
+    return BatchLeadResponse(
+        success=succeeded == len(results),
+        total=len(results),
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        results=results,
+        processing_time=time.time() - start_time,
+    )
+
+
+async def _attach_duplicate(
+    lead: LeadInput, start_time: float
+) -> Optional[LeadResponse]:
+    """
+    Attach a repeat submission to its existing record
+
+    Inside the dedupe window, a lead whose email matches a recent one
+    with an unchanged message is not re-qualified: the existing record is
+    updated and its earlier result returned.
+
+    Returns:
+        LeadResponse for the existing record, or None to qualify normally
+    """
+    if settings.DEDUPE_WINDOW_HOURS <= 0:
+        return None
+
+    duplicate = get_dedupe().find(lead)
+    if duplicate is None:
+        return None
+
+    updates = {"Message": lead.message}
+    if lead.phone:
+        updates["Phone"] = lead.phone
+    if lead.company:
+        updates["Company"] = lead.company
+    if lead.website:
+        updates["Website"] = str(lead.website)
+
+    with time_stage("storage"):
+        updated = await asyncio.to_thread(
+            get_airtable().update_lead, duplicate.record_id, updates
+        )
+    if not updated:
+        return None
+
+    count_scoring_path("duplicate")
+
+    return LeadResponse(
+        success=True,
+        lead_id=duplicate.record_id,
+        qualified_lead=build_qualified_lead(lead, duplicate.result),
+        processing_time=time.time() - start_time,
+        scoring_path="duplicate",
+        timing=_timing_breakdown("duplicate"),
+    )
+
+
+def _timing_breakdown(scoring_path: Optional[str]) -> Optional[TimingBreakdown]:
+    """Stage timings collected so far for the current request"""
+    timings = current_request_timings()
+    if timings is None:
+        return None
+    return TimingBreakdown.model_validate(timings.breakdown(scoring_path))
+
+
+async def _save_lead(
+    lead: LeadInput, result: Dict, start_time: float, with_timing: bool = True
+) -> LeadResponse:
+    """
+    Build the qualified lead, save it to Airtable and wrap the response
+
+    Batch requests pass with_timing=False: their stage timings are shared
+    by every lead in the request and only reported in Server-Timing.
+    """
+    # Build qualified lead object
+    qualified_lead = build_qualified_lead(lead, result)
+
+    # Save to Airtable
+    lead_data = build_lead_data(qualified_lead)
+
+    # Queued for the next Airtable batch create
+    with time_stage("storage"):
+        record_id = await get_lead_writer().create_lead(lead_data)
+    get_dedupe().remember(lead, record_id, result)
+
+    processing_time = time.time() - start_time
+
+    return LeadResponse(
+        success=True,
+        lead_id=record_id,
+        qualified_lead=qualified_lead,
+        processing_time=processing_time,
+        scoring_path=result.get("scoring_path"),
+        model_tier=result.get("model_tier"),
+        timing=_timing_breakdown(result.get("scoring_path")) if with_timing else None,
+    )
+
+
 @app.get("/test")
 async def test_endpoint():
     """Simple test endpoint"""
     return {"message": "Test endpoint working", "status": "ok"}
 
 
+@app.get("/leads")
+async def list_leads(
+    priority: Optional[LeadPriority] = None,
+    min_score: Optional[float] = Query(None, ge=0, le=100),
+    max_score: Optional[float] = Query(None, ge=0, le=100),
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    stream: bool = False,
+):
+    """
+    List leads, newest first
+
+    Returns one page plus an opaque `next_cursor` to pass back for the
+    following page. With `stream=true` the whole filtered listing is sent
+    as NDJSON (one lead per line), fetched `limit` records at a time.
+    """
+    filters = {
+        "priority": priority.value if priority else None,
+        "min_score": min_score,
+        "max_score": max_score,
+        "created_after": airtable_timestamp(created_after) if created_after else None,
+        "created_before": (
+            airtable_timestamp(created_before) if created_before else None
+        ),
+    }
+
+    if stream:
+
+        def ndjson():
+            for record in get_airtable().iter_leads(page_size=limit, **filters):
+                yield fast_json.dumps(record) + "\n"
+
+        return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+    try:
+        leads, next_cursor = get_airtable().list_leads_page(
+            cursor=cursor, limit=limit, **filters
+        )
+        return {
+            "success": True,
+            "count": len(leads),
+            "leads": leads,
+            "next_cursor": next_cursor,
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to list leads: {str(e)}",
+        ) from e
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Per-stage latency histograms and error counters in Prometheus format"""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/cache/stats")
+async def get_cache_stats():
+    """Get qualification cache hit/miss counters"""
+    return {
+        "success": True,
+        "stats": get_agent().cache.stats(),
+    }
+
+
+@app.get("/dedupe/stats")
+async def get_dedupe_stats():
+    """Get duplicate-lead index size and hit counter"""
+    return {
+        "success": True,
+        "stats": get_dedupe().stats(),
+    }
+
+
+@app.get("/scheduler/stats")
+async def get_scheduler_stats():
+    """Get Gemini quota scheduler queue depth and budget usage"""
+    return {
+        "success": True,
+        "stats": get_agent().scheduler.stats(),
+    }
+
+
+@app.get("/airtable/stats")
+async def get_airtable_stats():
+    """Get Airtable rate limiter and write buffer metrics"""
+    return {
+        "success": True,
+        "stats": {
+            **get_airtable().rate_limiter.metrics(),
+            "pending_writes": get_lead_writer().pending,
+        },
+    }
+
+
 @app.get("/leads/stats")
 async def get_stats():
-    """Get lead statistics from Airtable"""
+    """Get lead statistics from the running aggregates"""
     try:
-        stats = airtable.get_stats()
+        stats = get_airtable().get_stats()
         return {
             "success": True,
             "stats": stats,
@@ -175,7 +572,7 @@ async def get_stats():
 async def get_lead(record_id: str):
     """Get a specific lead by ID"""
     try:
-        lead = airtable.get_lead(record_id)
+        lead = await asyncio.to_thread(get_airtable().get_lead, record_id)
         if not lead:
             raise HTTPException(status_code=404, detail="Lead not found")
         return {
@@ -4,20 +4,28 @@ Models package
 
 from .schemas import (
     AIAnalysis,
+    BatchLeadResponse,
+    DependencyHealth,
     HealthCheck,
     LeadInput,
     LeadPriority,
     LeadResponse,
     LeadSource,
     QualifiedLead,
+    StageTiming,
+    TimingBreakdown,
 )
 
 __all__ = [
     "AIAnalysis",
+    "BatchLeadResponse",
+    "DependencyHealth",
     "HealthCheck",
     "LeadInput",
     "LeadPriority",
     "LeadResponse",
     "LeadSource",
     "QualifiedLead",
+    "StageTiming",
+    "TimingBreakdown",
 ]
@@ -4,9 +4,9 @@ Data models and schemas
 
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel, EmailStr, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, HttpUrl
 
 
 class LeadSource(str, Enum):
@@ -74,14 +74,58 @@ class QualifiedLead(BaseModel):
     status: str = "new"
 
 
+class StageTiming(BaseModel):
+    """Time spent in one qualification stage"""
+
+    duration_ms: float = 0.0
+    status: str = "ran"  # ran, cached, skipped or fallback
+
+
+class TimingBreakdown(BaseModel):
+    """Where the time of one request went"""
+
+    stages: Dict[str, StageTiming]
+    total_ms: float
+
+
 class LeadResponse(BaseModel):
     """API response for lead submission"""
 
+    # Allow the model_tier field name
+    model_config = ConfigDict(protected_namespaces=())
+
     success: bool
     lead_id: Optional[str] = None
     qualified_lead: Optional[QualifiedLead] = None
     error: Optional[str] = None
     processing_time: float
+    # heuristic, cache, near_duplicate, duplicate, llm, circuit_open or fallback
+    scoring_path: Optional[str] = None
+    # Gemini model tier (fast or strong) for llm results
+    model_tier: Optional[str] = None
+    timing: Optional[TimingBreakdown] = None
+
+
+class BatchLeadResponse(BaseModel):
+    """API response for batch lead submission"""
+
+    success: bool
+    total: int
+    succeeded: int
+    failed: int
+    results: List[LeadResponse]
+    processing_time: float
+
+
+class DependencyHealth(BaseModel):
+    """Latest probe results for one external dependency"""
+
+    status: str  # up, slow, down, stale or unknown
+    last_latency_ms: Optional[float] = None
+    error_rate: float = 0.0
+    staleness_seconds: Optional[float] = None
+    last_checked: Optional[datetime] = None
+    last_error: Optional[str] = None
 
 
 class HealthCheck(BaseModel):
@@ -90,3 +134,4 @@ class HealthCheck(BaseModel):
     status: str
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     services: dict
+    dependencies: Optional[Dict[str, DependencyHealth]] = None
@@ -2,6 +2,18 @@
 Services package
 """
 
-from .ai_agent import LeadQualificationAgent
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .ai_agent import LeadQualificationAgent
 
 __all__ = ["LeadQualificationAgent"]
+
+
+def __getattr__(name):
+    # Resolved lazily so importing one service does not load them all
+    if name == "LeadQualificationAgent":
+        from .ai_agent import LeadQualificationAgent
+
+        return LeadQualificationAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,14 +2,43 @@
 AI Agent for lead qualification using Google Gemini
 """
 
+import asyncio
 import json
 import logging
-from typing import Dict
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-import google.generativeai as genai
+from pydantic import ValidationError
 
 from config import get_settings
 from models.schemas import AIAnalysis, LeadInput, LeadPriority
+from services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from services.hedging import HedgePolicy, hedged
+from services.heuristics import HeuristicScorer
+from services.model_router import ModelRouter, ModelTier
+from services.metrics import (
+    FALLBACKS,
+    GEMINI_TIMEOUTS,
+    PARSE_ATTEMPTS,
+    PARSE_FAILURES,
+    PARSE_REPAIRS,
+    count_scoring_path,
+    observe_stage,
+    time_stage,
+)
+from services.qualification_cache import QualificationCache
+from services.scheduler import (
+    PRIORITY_DEFAULT,
+    QualificationScheduler,
+    estimate_tokens,
+    lead_priority,
+)
+from utils import fast_json
+from utils.gemini_schema import response_schema
+from utils.minhash import MinHashIndex
+from utils.partial_json import IncrementalObjectParser
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -17,6 +46,53 @@ logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
+ANALYSIS_SCHEMA = """{
+  "industry": "Primary industry of the company (or 'Unknown')",
+  "company_size": "Estimated size: Startup/Small/Medium/Large/Enterprise",
+  "budget_signals": [
+    "List of 0-3 signals indicating budget/buying power"
+  ],
+  "pain_points": [
+    "List of 2-4 business pain points mentioned or implied"
+  ],
+  "urgency_level": "high/medium/low based on language and context",
+  "buying_intent": "ready_to_buy/evaluating/exploring/just_browsing",
+  "recommended_action": "Specific next step for sales team (one sentence)"
+}"""
+
+# Minimal safe structure used when a reply cannot be parsed
+PARSE_FAILURE_ANALYSIS = {
+    "industry": "Unknown",
+    "company_size": "Unknown",
+    "budget_signals": [],
+    "pain_points": ["Analysis failed - manual review needed"],
+    "urgency_level": "medium",
+    "buying_intent": "exploring",
+    "recommended_action": "Manual review required",
+}
+
+# Structured output schemas, so Gemini replies with bare, valid JSON
+ANALYSIS_RESPONSE_SCHEMA = response_schema(AIAnalysis)
+PACKED_RESPONSE_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "lead_index": {"type": "integer"},
+            **ANALYSIS_RESPONSE_SCHEMA["properties"],
+        },
+        "required": ["lead_index", *ANALYSIS_RESPONSE_SCHEMA["required"]],
+    },
+}
+
+ANALYSIS_GUIDELINES = """Important:
+- Be realistic with company_size estimation
+- Identify REAL pain points from the message
+- urgency_level: "high" only if explicit urgency keywords present
+- buying_intent: Consider actual purchase signals
+- recommended_action: Be specific and actionable
+"""
+
 
 class LeadQualificationAgent:
     """
@@ -32,10 +108,74 @@ class LeadQualificationAgent:
 
     def __init__(self):
         """Initialize Gemini AI"""
-        genai.configure(api_key=settings.GEMINI_API_KEY)
-        self.model = genai.GenerativeModel("models/gemini-flash-latest")
+        if not settings.GEMINI_API_KEY:
+            raise RuntimeError("GEMINI_API_KEY must be set")
+
+        # Gemini model per tier name, created on first use
+        self._models: Dict[str, Any] = {}
+        self._model_lock = threading.Lock()
+        # Caps in-flight Gemini requests per worker
+        self._semaphore = asyncio.Semaphore(settings.GEMINI_MAX_CONCURRENCY)
+        self.cache = QualificationCache()
+        self.scheduler = QualificationScheduler()
+        self.heuristics = HeuristicScorer()
+        self.breaker = CircuitBreaker("gemini")
+        self.hedging = HedgePolicy()
+        self.router = ModelRouter()
+        self.near_duplicates = MinHashIndex(
+            threshold=settings.NEAR_DUPLICATE_THRESHOLD,
+            max_entries=settings.NEAR_DUPLICATE_MAX_ENTRIES,
+        )
         logger.info("✅ AI Agent initialized with Gemini")
 
+    @property
+    def model(self):
+        """Gemini model of the default (strongest) tier, loaded on first use"""
+        return self.model_for(self.router.default_tier)
+
+    @model.setter
+    def model(self, model):
+        """Use one model object for every tier"""
+        for tier in self.router.tiers:
+            self._models[tier.name] = model
+
+    def model_for(self, tier: ModelTier):
+        """Gemini model of a tier, loaded on first use"""
+        if tier.name not in self._models:
+            self.load_model()
+        return self._models[tier.name]
+
+    def load_model(self):
+        """
+        Import the Gemini SDK and create the model of every tier
+
+        Importing google.generativeai takes most of a second, so it is
+        deferred until needed; the app calls this in a background thread
+        at startup so the first request does not pay for it.
+        """
+        with self._model_lock:
+            missing = [t for t in self.router.tiers if t.name not in self._models]
+            if missing:
+                import google.generativeai as genai
+
+                genai.configure(api_key=settings.GEMINI_API_KEY)
+                for tier in missing:
+                    self._models[tier.name] = genai.GenerativeModel(tier.model_name)
+
+    def probe(self):
+        """
+        Check that Gemini is reachable and the model is served
+
+        Fetches the model's metadata, which costs no generation quota.
+
+        Raises:
+            Exception: If the API cannot be reached or rejects the key
+        """
+        self.load_model()
+        import google.generativeai as genai
+
+        genai.get_model(self.router.default_tier.model_name)
+
     async def qualify_lead(self, lead: LeadInput) -> Dict:
         """
         Qualify lead using AI analysis
@@ -46,125 +186,584 @@ class LeadQualificationAgent:
         Returns:
             Dict with score, priority, and analysis
         """
+        cache_key = self.cache.make_key(lead)
+        local = self._local_result(lead, cache_key)
+        if local is not None:
+            return local
+
+        return await self._analyze_lead(lead, cache_key)
+
+    def _local_result(self, lead: LeadInput, cache_key: str) -> Optional[Dict]:
+        """
+        Answer a lead without Gemini when possible
+
+        Tries the qualification cache first, then the near-duplicate index
+        (an analysis of a recent lead with an almost identical message),
+        then the heuristic pre-scorer.
+        A heuristic score is only trusted when its confidence clears
+        HEURISTIC_MIN_CONFIDENCE and the score is clearly low or high;
+        ambiguous leads return None and go to Gemini.
+        """
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.info("⚡ Cached analysis reused for lead: %s", lead.name)
+            return self._build_result(lead, cached, "cache")
+
+        if settings.NEAR_DUPLICATE_ENABLED:
+            match = self.near_duplicates.query(lead.message)
+            if match is not None:
+                analysis_data, similarity = match
+                logger.info(
+                    "⚡ Near-duplicate analysis reused for lead: %s (similarity %.2f)",
+                    lead.name,
+                    similarity,
+                )
+                return self._build_result(lead, analysis_data, "near_duplicate")
+
+        if not settings.HEURISTIC_ENABLED:
+            return None
+
+        heuristic = self.heuristics.analyze(lead)
+        if heuristic.confidence < settings.HEURISTIC_MIN_CONFIDENCE:
+            return None
+
+        score = self._calculate_score(heuristic.analysis)
+        if settings.HEURISTIC_LOW_SCORE < score < settings.HEURISTIC_HIGH_SCORE:
+            return None
+
+        logger.info(
+            "⚡ Heuristic score used for lead: %s (confidence %.2f)",
+            lead.name,
+            heuristic.confidence,
+        )
+        return self._build_result(lead, heuristic.analysis, "heuristic")
+
+    async def _analyze_lead(self, lead: LeadInput, cache_key: str) -> Dict:
+        """Run the Gemini analysis for a single lead"""
         try:
             logger.info("🤖 Analyzing lead: %s", lead.name)
 
             # Build analysis prompt
-            prompt = self._build_prompt(lead)
+            with time_stage("prompt"):
+                prompt = self._build_prompt(lead)
 
             # Call Gemini
-            response = self.model.generate_content(prompt)
+            priority = lead_priority(lead)
+            response_text, tier = await self._generate(
+                prompt,
+                priority,
+                self.router.route(lead),
+                self._generation_config(ANALYSIS_RESPONSE_SCHEMA),
+            )
 
             # Parse response
-            analysis_data = self._parse_response(response.text)
+            analysis_data = await self._read_analysis(response_text, priority, tier)
 
-            # Calculate score and priority
-            score = self._calculate_score(analysis_data)
-            priority = self._determine_priority(score)
+            # Only cache analyses that actually parsed
+            if analysis_data != PARSE_FAILURE_ANALYSIS:
+                self._remember(lead, cache_key, analysis_data)
 
-            # Build AI Analysis object
-            analysis = AIAnalysis(
-                industry=analysis_data.get("industry"),
-                company_size=analysis_data.get("company_size"),
-                budget_signals=analysis_data.get("budget_signals", []),
-                pain_points=analysis_data.get("pain_points", []),
-                urgency_level=analysis_data.get("urgency_level", "medium"),
-                buying_intent=analysis_data.get("buying_intent", "exploring"),
-                recommended_action=analysis_data.get(
-                    "recommended_action", "Follow up within 24 hours"
-                ),
-            )
+            return self._build_result(lead, analysis_data, "llm", tier.name)
 
-            logger.info(
-                "✅ Lead qualified: %s (Score: %s, Priority: %s)",
-                lead.name,
-                score,
-                priority,
+        except CircuitOpenError:
+            return self._circuit_open_result(lead)
+
+        except Exception as e:
+            logger.error("❌ AI analysis failed: %s", str(e))
+            return self._fallback_result()
+
+    async def stream_lead(self, lead: LeadInput) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Qualify lead while streaming analysis fields as Gemini produces them
+
+        Args:
+            lead: Input lead data
+
+        Yields:
+            ("field", (key, value)) for each analysis field as soon as it is
+            complete in the streamed reply, then ("result", result dict)
+            with score, priority, and analysis
+        """
+        cache_key = self.cache.make_key(lead)
+        local = self._local_result(lead, cache_key)
+        if local is not None:
+            for field in local["analysis"].model_dump().items():
+                yield "field", field
+            yield "result", local
+            return
+
+        try:
+            logger.info("🤖 Streaming analysis for lead: %s", lead.name)
+            parser = IncrementalObjectParser()
+            chunks = []
+
+            with time_stage("prompt"):
+                prompt = self._build_prompt(lead)
+
+            async with self._model_call(
+                prompt, lead_priority(lead), self.router.route(lead)
+            ) as (model, tier):
+                response = await model.generate_content_async(
+                    prompt,
+                    stream=True,
+                    generation_config=self._generation_config(ANALYSIS_RESPONSE_SCHEMA),
+                )
+                async for chunk in response:
+                    chunks.append(chunk.text)
+                    for field in parser.feed(chunk.text):
+                        yield "field", field
+
+            analysis_data = await self._read_analysis(
+                "".join(chunks), lead_priority(lead), tier
             )
+            if analysis_data != PARSE_FAILURE_ANALYSIS:
+                self._remember(lead, cache_key, analysis_data)
+            result = self._build_result(lead, analysis_data, "llm", tier.name)
 
-            return {"score": score, "priority": priority, "analysis": analysis}
+        except CircuitOpenError:
+            result = self._circuit_open_result(lead)
+            for field in result["analysis"].model_dump().items():
+                yield "field", field
 
         except Exception as e:
             logger.error("❌ AI analysis failed: %s", str(e))
-            # Return default safe values
-            return {
-                "score": 50.0,
-                "priority": LeadPriority.WARM,
-                "analysis": AIAnalysis(
-                    recommended_action=("Manual review required - AI analysis failed")
+            result = self._fallback_result()
+
+        yield "result", result
+
+    async def qualify_leads(self, leads: List[LeadInput]) -> List[Dict]:
+        """
+        Qualify several leads, packing them into shared Gemini requests
+
+        Up to GEMINI_PACK_SIZE leads go into one prompt so the instruction
+        block and schema are sent once per pack. Leads whose entry in the
+        returned array is missing or malformed are re-qualified one by one.
+        Cached and confidently pre-scored leads are answered directly and
+        never packed.
+
+        Args:
+            leads: Input leads
+
+        Returns:
+            List of dicts with score, priority, and analysis, in input order
+        """
+        results: Dict[int, Dict] = {}
+        misses = []
+
+        for index, lead in enumerate(leads):
+            local = self._local_result(lead, self.cache.make_key(lead))
+            if local is not None:
+                results[index] = local
+            else:
+                misses.append(index)
+
+        pack_size = max(1, settings.GEMINI_PACK_SIZE)
+        packs = [misses[i : i + pack_size] for i in range(0, len(misses), pack_size)]
+
+        pack_results = await asyncio.gather(
+            *(self._qualify_pack([leads[i] for i in pack]) for pack in packs)
+        )
+        for pack, pack_result in zip(packs, pack_results):
+            for index, result in zip(pack, pack_result):
+                results[index] = result
+
+        return [results[index] for index in range(len(leads))]
+
+    async def _qualify_pack(self, leads: List[LeadInput]) -> List[Dict]:
+        """Qualify one pack of leads with a single Gemini call"""
+        cache_keys = [self.cache.make_key(lead) for lead in leads]
+        if len(leads) == 1:
+            return [await self._analyze_lead(leads[0], cache_keys[0])]
+
+        try:
+            logger.info("🤖 Analyzing %s leads in one request", len(leads))
+            with time_stage("prompt"):
+                prompt = self._build_packed_prompt(leads)
+            response_text, tier = await self._generate(
+                prompt,
+                min(lead_priority(lead) for lead in leads),
+                self.router.route_pack(leads),
+                self._generation_config(PACKED_RESPONSE_SCHEMA),
+            )
+            with time_stage("parse"):
+                entries = self._parse_packed_response(response_text, len(leads))
+
+        except Exception as e:
+            logger.error("❌ Packed AI analysis failed: %s", str(e))
+            entries = [None] * len(leads)
+
+        async def resolve(lead: LeadInput, key: str, entry: Optional[Dict]) -> Dict:
+            if entry is None:
+                # Malformed or missing entry - fall back to a per-lead call
+                return await self._analyze_lead(lead, key)
+            self._remember(lead, key, entry)
+            return self._build_result(lead, entry, "llm", tier.name)
+
+        return list(
+            await asyncio.gather(
+                *(
+                    resolve(lead, key, entry)
+                    for lead, key, entry in zip(leads, cache_keys, entries)
+                )
+            )
+        )
+
+    def _remember(self, lead: LeadInput, cache_key: str, analysis_data: Dict):
+        """Make a fresh analysis reusable for exact and near-duplicate leads"""
+        self.cache.set(cache_key, analysis_data)
+        if settings.NEAR_DUPLICATE_ENABLED:
+            self.near_duplicates.add(cache_key, lead.message, analysis_data)
+
+    def _build_result(
+        self,
+        lead: LeadInput,
+        analysis_data: Dict,
+        scoring_path: str,
+        model_tier: Optional[str] = None,
+    ) -> Dict:
+        """
+        Score parsed analysis data and build the qualification result
+
+        Args:
+            lead: Input lead data
+            analysis_data: Parsed analysis fields
+            scoring_path: What produced the analysis
+                (llm, cache, near_duplicate, heuristic, circuit_open)
+            model_tier: Model tier that answered, for llm results
+        """
+        # Calculate score and priority
+        with time_stage("score"):
+            score = self._calculate_score(analysis_data)
+            priority = self._determine_priority(score)
+        count_scoring_path(scoring_path)
+
+        # Build AI Analysis object
+        analysis = AIAnalysis(
+            industry=analysis_data.get("industry"),
+            company_size=analysis_data.get("company_size"),
+            budget_signals=analysis_data.get("budget_signals", []),
+            pain_points=analysis_data.get("pain_points", []),
+            urgency_level=analysis_data.get("urgency_level", "medium"),
+            buying_intent=analysis_data.get("buying_intent", "exploring"),
+            recommended_action=analysis_data.get(
+                "recommended_action", "Follow up within 24 hours"
+            ),
+        )
+
+        logger.info(
+            "✅ Lead qualified: %s (Score: %s, Priority: %s)",
+            lead.name,
+            score,
+            priority,
+        )
+
+        return {
+            "score": score,
+            "priority": priority,
+            "analysis": analysis,
+            "scoring_path": scoring_path,
+            "model_tier": model_tier,
+        }
+
+    def _fallback_result(self) -> Dict:
+        """Default safe values used when the AI analysis fails"""
+        FALLBACKS.inc()
+        count_scoring_path("fallback")
+        return {
+            "score": 50.0,
+            "priority": LeadPriority.WARM,
+            "analysis": AIAnalysis(
+                recommended_action=("Manual review required - AI analysis failed")
+            ),
+            "scoring_path": "fallback",
+        }
+
+    def _circuit_open_result(self, lead: LeadInput) -> Dict:
+        """Score a lead with the heuristic scorer while Gemini's circuit is open"""
+        logger.warning(
+            "⚡ Gemini circuit open, heuristic score used for: %s", lead.name
+        )
+        return self._build_result(
+            lead, self.heuristics.analyze(lead).analysis, "circuit_open"
+        )
+
+    async def _generate(
+        self,
+        prompt: str,
+        priority: int = PRIORITY_DEFAULT,
+        wanted_tier: Optional[str] = None,
+        generation_config: Optional[Dict] = None,
+    ) -> Tuple[str, ModelTier]:
+        """
+        Call Gemini without blocking the event loop
+
+        Waits for the scheduler to admit the request within the RPM/TPM
+        budget, then uses the SDK's native async client, bounded by the
+        configured concurrency cap so a burst of leads cannot exhaust the
+        worker. The call goes through the circuit breaker, which rejects it
+        before it queues while Gemini is failing.
+
+        The call must finish within GEMINI_TIMEOUT_SECONDS. With hedging
+        enabled, a call still running past the observed latency percentile
+        gets one backup request (within the hedge budget and spare quota)
+        and the first reply wins.
+
+        The request goes to the wanted model tier, or the next tier down if
+        that tier is over its budget.
+
+        Returns:
+            Reply text and the tier that produced it
+
+        Raises:
+            CircuitOpenError: If the Gemini circuit is open
+            asyncio.TimeoutError: If no reply arrives before the deadline
+        """
+        tokens = estimate_tokens(prompt)
+        async with self._model_call(prompt, priority, wanted_tier) as (model, tier):
+            response = await hedged(
+                lambda: model.generate_content_async(
+                    prompt, generation_config=generation_config
                 ),
-            }
+                self.hedging,
+                lambda: self.scheduler.try_acquire(tokens),
+            )
+        return response.text, tier
+
+    @asynccontextmanager
+    async def _model_call(
+        self, prompt: str, priority: int, wanted_tier: Optional[str] = None
+    ) -> AsyncIterator[Tuple[Any, ModelTier]]:
+        """
+        Admit one Gemini call and yield the model to make it with
+
+        Shared setup for every Gemini request: the circuit breaker
+        pre-check, scheduler admission, the concurrency cap, tier selection,
+        and the llm stage timed under the breaker and the call deadline.
+        The tier's latency is recorded once the call succeeds.
+
+        Args:
+            prompt: Prompt about to be sent (sizes the token estimate)
+            priority: Scheduler priority of the request
+            wanted_tier: Preferred model tier, or the router's default
+
+        Yields:
+            Tuple of (model, tier)
+
+        Raises:
+            CircuitOpenError: If the Gemini circuit is open
+            asyncio.TimeoutError: If the call runs past the deadline
+        """
+        if not self.breaker.available():
+            raise CircuitOpenError("gemini circuit is open")
+        tokens = estimate_tokens(prompt)
+        queued_at = time.perf_counter()
+        await self.scheduler.acquire(priority, tokens)
+
+        async with self._semaphore:
+            observe_stage("queue", time.perf_counter() - queued_at)
+            tier = self.router.select(
+                wanted_tier or self.router.default_tier.name, tokens
+            )
+            started = time.perf_counter()
+            with time_stage("llm"), self.breaker.call():
+                async with self._deadline():
+                    yield self.model_for(tier), tier
+            self.router.record(tier, time.perf_counter() - started, tokens)
+
+    @asynccontextmanager
+    async def _deadline(self) -> AsyncIterator[None]:
+        """Abandon a Gemini call that runs past GEMINI_TIMEOUT_SECONDS"""
+        try:
+            async with asyncio.timeout(settings.GEMINI_TIMEOUT_SECONDS):
+                yield
+        except TimeoutError:
+            GEMINI_TIMEOUTS.inc()
+            logger.warning(
+                "⏱️ Gemini call timed out after %ss", settings.GEMINI_TIMEOUT_SECONDS
+            )
+            raise
 
     def _build_prompt(self, lead: LeadInput) -> str:
         """Build analysis prompt for Gemini"""
         return f"""You are a lead qualification expert. Analyze this lead and provide structured insights.
 
 Lead Information:
-- Name: {lead.name}
+{self._format_lead(lead)}
+
+Analyze and provide a JSON response with:
+{ANALYSIS_SCHEMA}
+
+{ANALYSIS_GUIDELINES}
+Respond ONLY with valid JSON, no explanation or markdown.
+"""
+
+    def _build_packed_prompt(self, leads: List[LeadInput]) -> str:
+        """Build one analysis prompt covering several leads"""
+        lead_blocks = "\n\n".join(
+            f"Lead {index}:\n{self._format_lead(lead)}"
+            for index, lead in enumerate(leads)
+        )
+        return f"""You are a lead qualification expert. Analyze each of the {len(leads)} leads below and provide structured insights.
+
+{lead_blocks}
+
+Analyze each lead independently and provide a JSON array with exactly {len(leads)} objects, in the same order as the leads.
+Each object has a "lead_index" field with the lead number, plus:
+{ANALYSIS_SCHEMA}
+
+{ANALYSIS_GUIDELINES}
+Respond ONLY with a valid JSON array, no explanation or markdown.
+"""
+
+    def _format_lead(self, lead: LeadInput) -> str:
+        """Format lead information for a prompt"""
+        return f"""- Name: {lead.name}
 - Email: {lead.email}
 - Company: {lead.company or 'Not provided'}
 - Website: {lead.website or 'Not provided'}
 - Message: {lead.message}
-- Source: {lead.source}
+- Source: {lead.source}"""
 
-Analyze and provide a JSON response with:
-{{
-  "industry": "Primary industry of the company (or 'Unknown')",
-  "company_size": "Estimated size: Startup/Small/Medium/Large/Enterprise",
-  "budget_signals": [
-    "List of 0-3 signals indicating budget/buying power"
-  ],
-  "pain_points": [
-    "List of 2-4 business pain points mentioned or implied"
-  ],
-  "urgency_level": "high/medium/low based on language and context",
-  "buying_intent": "ready_to_buy/evaluating/exploring/just_browsing",
-  "recommended_action": "Specific next step for sales team (one sentence)"
-}}
+    def _generation_config(self, schema: Dict) -> Optional[Dict]:
+        """Generation config asking for JSON that matches a schema"""
+        if not settings.GEMINI_STRUCTURED_OUTPUT:
+            return None
+        return {"response_mime_type": "application/json", "response_schema": schema}
 
-Important:
-- Be realistic with company_size estimation
-- Identify REAL pain points from the message
-- urgency_level: "high" only if explicit urgency keywords present
-- buying_intent: Consider actual purchase signals
-- recommended_action: Be specific and actionable
+    async def _read_analysis(
+        self, response_text: str, priority: int, tier: ModelTier
+    ) -> Dict:
+        """
+        Turn a single-lead reply into analysis data
 
-Respond ONLY with valid JSON, no explanation or markdown.
+        Structured replies are validated straight into AIAnalysis. A reply
+        that fails validation is sent back to Gemini once to be repaired;
+        if the repair fails too, the manual-review analysis is returned.
+        Without structured output the reply is parsed leniently.
+        """
+        if not settings.GEMINI_STRUCTURED_OUTPUT:
+            with time_stage("parse"):
+                return self._parse_response(response_text)
+
+        PARSE_ATTEMPTS.inc()
+        with time_stage("parse"):
+            try:
+                return self._validate_analysis(response_text)
+            except ValidationError as e:
+                error = e
+
+        PARSE_REPAIRS.inc()
+        logger.warning("🔧 Malformed AI reply, asking Gemini to repair it")
+        repaired_text, _ = await self._generate(
+            self._build_repair_prompt(response_text, error),
+            priority,
+            tier.name,
+            self._generation_config(ANALYSIS_RESPONSE_SCHEMA),
+        )
+
+        with time_stage("parse"):
+            try:
+                return self._validate_analysis(repaired_text)
+            except ValidationError as e:
+                PARSE_FAILURES.inc()
+                logger.error("Failed to parse repaired AI response: %s", str(e))
+                return dict(PARSE_FAILURE_ANALYSIS)
+
+    def _validate_analysis(self, response_text: str) -> Dict:
+        """
+        Validate a structured reply into analysis data
+
+        Raises:
+            ValidationError: If the reply is not a valid AIAnalysis object
+        """
+        return AIAnalysis.model_validate_json(response_text).model_dump()
+
+    def _build_repair_prompt(self, response_text: str, error: ValidationError) -> str:
+        """Build a prompt asking Gemini to fix a malformed analysis"""
+        return f"""Your previous reply was supposed to be a JSON object with:
+{ANALYSIS_SCHEMA}
+
+It failed validation with these errors:
+{error}
+
+Previous reply:
+{response_text}
+
+Respond ONLY with the corrected JSON object, no explanation or markdown.
 """
 
     def _parse_response(self, response_text: str) -> Dict:
         """Parse Gemini response to dict"""
+        PARSE_ATTEMPTS.inc()
         try:
-            # Clean response
-            cleaned = response_text.strip()
-
-            # Remove markdown code blocks if present
-            if cleaned.startswith("```json"):
-                cleaned = cleaned[7:]
-            if cleaned.startswith("```"):
-                cleaned = cleaned[3:]
-            if cleaned.endswith("```"):
-                cleaned = cleaned[:-3]
-
-            cleaned = cleaned.strip()
-
             # Parse JSON
-            return json.loads(cleaned)
+            return fast_json.loads(self._strip_fences(response_text))
 
         except json.JSONDecodeError as e:
+            PARSE_FAILURES.inc()
             logger.error("Failed to parse AI response: %s", str(e))
             logger.error("Response was: %s", response_text)
 
             # Return minimal safe structure
-            return {
-                "industry": "Unknown",
-                "company_size": "Unknown",
-                "budget_signals": [],
-                "pain_points": ["Analysis failed - manual review needed"],
-                "urgency_level": "medium",
-                "buying_intent": "exploring",
-                "recommended_action": "Manual review required",
-            }
+            return dict(PARSE_FAILURE_ANALYSIS)
+
+    def _parse_packed_response(
+        self, response_text: str, count: int
+    ) -> List[Optional[Dict]]:
+        """
+        Parse a packed Gemini response into one analysis per lead
+
+        Returns:
+            List of analysis dicts in lead order, None for entries that
+            are missing or malformed
+        """
+        entries: List[Optional[Dict]] = [None] * count
+
+        PARSE_ATTEMPTS.inc()
+        try:
+            data = fast_json.loads(self._strip_fences(response_text))
+        except json.JSONDecodeError as e:
+            PARSE_FAILURES.inc()
+            logger.error("Failed to parse packed AI response: %s", str(e))
+            return entries
+
+        if not isinstance(data, list):
+            PARSE_FAILURES.inc()
+            logger.error("Packed AI response is not a JSON array")
+            return entries
+
+        for position, entry in enumerate(data):
+            if not isinstance(entry, dict):
+                continue
+
+            index = entry.pop("lead_index", position)
+            if not isinstance(index, int) or not 0 <= index < count:
+                continue
+
+            try:
+                AIAnalysis.model_validate(entry)
+            except ValidationError:
+                logger.warning("Malformed analysis for packed lead %s", index)
+                continue
+
+            entries[index] = entry
+
+        return entries
+
+    def _strip_fences(self, response_text: str) -> str:
+        """Remove markdown code fences around a JSON reply"""
+        # Clean response
+        cleaned = response_text.strip()
+
+        # Remove markdown code blocks if present
+        if cleaned.startswith("```json"):
+            cleaned = cleaned[7:]
+        if cleaned.startswith("```"):
+            cleaned = cleaned[3:]
+        if cleaned.endswith("```"):
+            cleaned = cleaned[:-3]
+
+        return cleaned.strip()
 
     def _calculate_score(self, analysis: Dict) -> float:
         """
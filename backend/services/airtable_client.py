@@ -2,30 +2,97 @@
 Airtable client for lead management
 """
 
-import json
 import logging
-from datetime import datetime
-from typing import Dict, Optional
-
-from pyairtable import Api
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
 
 from config import get_settings
+from services.lead_mirror import LeadMirror
+from services.lead_stats import LeadStats
+from services.metrics import count_airtable_error
+from services.rate_limit import RateLimitedAdapter, TokenBucket
+from utils import fast_json
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Airtable accepts at most 10 records per batch request
+AIRTABLE_MAX_BATCH = 10
+
+
+def airtable_timestamp(moment: datetime) -> str:
+    """Format a datetime like Airtable's createdTime (UTC, naive = UTC)"""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
 
 class AirtableClient:
     """Client for interacting with Airtable"""
 
     def __init__(self):
         """Initialize Airtable client"""
-        self.api = Api(settings.AIRTABLE_API_KEY)
-        self.table = self.api.table(
-            settings.AIRTABLE_BASE_ID, settings.AIRTABLE_TABLE_NAME
+        self.rate_limiter = RateLimitedAdapter(
+            TokenBucket(settings.AIRTABLE_RATE_LIMIT, settings.AIRTABLE_BURST),
+            max_retries=settings.AIRTABLE_MAX_RETRIES,
+            backoff_base=settings.AIRTABLE_BACKOFF_BASE,
+            backoff_max=settings.AIRTABLE_BACKOFF_MAX,
         )
+        self._table = None
+        self._table_lock = threading.Lock()
+        self.stats = LeadStats()
+        self.mirror = LeadMirror(settings.LEAD_MIRROR_PATH)
         logger.info("✅ Airtable client initialized")
 
+    @property
+    def configured(self) -> bool:
+        """Whether Airtable credentials are set"""
+        return bool(settings.AIRTABLE_API_KEY and settings.AIRTABLE_BASE_ID)
+
+    @property
+    def table(self):
+        """
+        Airtable table, connected on first use
+
+        Raises:
+            RuntimeError: If Airtable credentials are not set
+        """
+        if not self.configured:
+            raise RuntimeError("AIRTABLE_API_KEY and AIRTABLE_BASE_ID must be set")
+        if self._table is None:
+            with self._table_lock:
+                if self._table is None:
+                    # Deferred: importing pyairtable is slow and only needed
+                    # once we actually talk to Airtable
+                    from pyairtable import Api
+
+                    # Retries are handled by our adapter so every attempt is paced
+                    api = Api(
+                        settings.AIRTABLE_API_KEY,
+                        timeout=(
+                            settings.AIRTABLE_CONNECT_TIMEOUT,
+                            settings.AIRTABLE_READ_TIMEOUT,
+                        ),
+                        retry_strategy=None,
+                    )
+                    api.session.mount("https://", self.rate_limiter)
+                    self._table = api.table(
+                        settings.AIRTABLE_BASE_ID, settings.AIRTABLE_TABLE_NAME
+                    )
+        return self._table
+
+    def probe(self):
+        """
+        Check that the leads table is reachable
+
+        Reads a single record's name, the cheapest authenticated request.
+
+        Raises:
+            Exception: If Airtable cannot be reached or rejects the request
+        """
+        self.table.first(fields=["Name"])
+
     def create_lead(self, lead_data: Dict) -> Optional[str]:
         """
         Create a new lead in Airtable
@@ -37,38 +104,9 @@ class AirtableClient:
             Record ID if successful, None otherwise
         """
         try:
-            # Prepare fields for Airtable
-            fields = {
-                "Name": lead_data["name"],
-                "Email": lead_data["email"],
-                "Phone": lead_data.get("phone", ""),
-                "Company": lead_data.get("company", ""),
-                "Website": lead_data.get("website", ""),
-                "Message": lead_data["message"],
-                "Source": lead_data["source"],
-                "Score": float(lead_data["score"]),
-                "Priority": lead_data["priority"],
-                "Status": "new",
-                # Don't send Created At - Airtable auto-creates it
-            }
-
-            # Add AI analysis fields
-            analysis = lead_data.get("analysis", {})
-            if analysis:
-                fields["Industry"] = analysis.get("industry", "")
-                fields["Company Size"] = analysis.get("company_size", "")
-                fields["Urgency Level"] = analysis.get("urgency_level", "medium")
-                fields["Buying Intent"] = analysis.get("buying_intent", "")
-                fields["Recommended Action"] = analysis.get("recommended_action", "")
-
-                # Store arrays as JSON strings
-                if analysis.get("pain_points"):
-                    fields["Pain Points"] = json.dumps(analysis["pain_points"])
-                if analysis.get("budget_signals"):
-                    fields["Budget Signals"] = json.dumps(analysis["budget_signals"])
-
             # Create record
-            record = self.table.create(fields)
+            record = self.table.create(self._build_fields(lead_data))
+            self._apply_records([record])
 
             logger.info(
                 "✅ Lead created in Airtable: %s (ID: %s)",
@@ -79,9 +117,79 @@ class AirtableClient:
             return record["id"]
 
         except Exception as e:
+            count_airtable_error("create")
             logger.error("❌ Failed to create lead in Airtable: %s", str(e))
             return None
 
+    def create_leads(self, leads: List[Dict]) -> List[str]:
+        """
+        Create several leads using Airtable batch requests
+
+        Rate-limited and transient failures are retried by the client's
+        adapter; a failure that persists is raised rather than swallowed so
+        callers never lose a lead silently.
+
+        Args:
+            leads: List of lead information dicts
+
+        Returns:
+            Record IDs in input order
+
+        Raises:
+            requests.HTTPError: If a batch still fails after retries
+        """
+        record_ids: List[str] = []
+
+        for start in range(0, len(leads), AIRTABLE_MAX_BATCH):
+            chunk = leads[start : start + AIRTABLE_MAX_BATCH]
+            try:
+                records = self.table.batch_create(
+                    [self._build_fields(lead_data) for lead_data in chunk]
+                )
+            except Exception as e:
+                count_airtable_error("batch_create")
+                logger.error("❌ Failed to batch create leads in Airtable: %s", str(e))
+                raise
+
+            self._apply_records(records)
+            record_ids.extend(record["id"] for record in records)
+            logger.info("✅ %s leads created in Airtable", len(records))
+
+        return record_ids
+
+    def _build_fields(self, lead_data: Dict) -> Dict:
+        """Map lead data to Airtable fields"""
+        fields = {
+            "Name": lead_data["name"],
+            "Email": lead_data["email"],
+            "Phone": lead_data.get("phone", ""),
+            "Company": lead_data.get("company", ""),
+            "Website": lead_data.get("website", ""),
+            "Message": lead_data["message"],
+            "Source": lead_data["source"],
+            "Score": float(lead_data["score"]),
+            "Priority": lead_data["priority"],
+            "Status": "new",
+            # Don't send Created At - Airtable auto-creates it
+        }
+
+        # Add AI analysis fields
+        analysis = lead_data.get("analysis", {})
+        if analysis:
+            fields["Industry"] = analysis.get("industry", "")
+            fields["Company Size"] = analysis.get("company_size", "")
+            fields["Urgency Level"] = analysis.get("urgency_level", "medium")
+            fields["Buying Intent"] = analysis.get("buying_intent", "")
+            fields["Recommended Action"] = analysis.get("recommended_action", "")
+
+            # Store arrays as JSON strings
+            if analysis.get("pain_points"):
+                fields["Pain Points"] = fast_json.dumps(analysis["pain_points"])
+            if analysis.get("budget_signals"):
+                fields["Budget Signals"] = fast_json.dumps(analysis["budget_signals"])
+
+        return fields
+
     def update_lead(self, record_id: str, updates: Dict) -> bool:
         """
         Update an existing lead
@@ -94,11 +202,13 @@ class AirtableClient:
             True if successful, False otherwise
         """
         try:
-            self.table.update(record_id, updates)
+            record = self.table.update(record_id, updates)
+            self._apply_records([record])
             logger.info("✅ Lead updated in Airtable: %s", record_id)
             return True
 
         except Exception as e:
+            count_airtable_error("update")
             logger.error("❌ Failed to update lead in Airtable: %s", str(e))
             return False
 
@@ -106,6 +216,9 @@ class AirtableClient:
         """
         Get a lead by record ID
 
+        Served from the local mirror; Airtable is only asked for records
+        the mirror has not seen yet.
+
         Args:
             record_id: Airtable record ID
 
@@ -113,16 +226,20 @@ class AirtableClient:
             Lead data if found, None otherwise
         """
         try:
-            record = self.table.get(record_id)
+            record = self.mirror.get(record_id)
+            if record is None:
+                record = self.table.get(record_id)
+                self.mirror.upsert([record])
             return record["fields"]
 
         except Exception as e:
+            count_airtable_error("get")
             logger.error("❌ Failed to get lead from Airtable: %s", str(e))
             return None
 
     def list_leads(self, priority: Optional[str] = None, limit: int = 100) -> list:
         """
-        List leads with optional filtering
+        List leads with optional filtering, served from the local mirror
 
         Args:
             priority: Filter by priority (hot, warm, cold)
@@ -132,68 +249,117 @@ class AirtableClient:
             List of lead records
         """
         try:
-            formula = None
-            if priority:
-                formula = f"{{Priority}} = '{priority}'"
+            records = self.mirror.list(priority=priority, limit=limit)
 
-            records = self.table.all(
-                formula=formula, max_records=limit, sort=["-Created At"]
-            )
-
-            logger.info("✅ Retrieved %s leads from Airtable", len(records))
+            logger.info("✅ Retrieved %s leads from mirror", len(records))
             return records
 
         except Exception as e:
-            logger.error("❌ Failed to list leads from Airtable: %s", str(e))
+            count_airtable_error("list")
+            logger.error("❌ Failed to list leads from mirror: %s", str(e))
             return []
 
+    def list_leads_page(
+        self, cursor: Optional[str] = None, limit: int = 50, **filters
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Get one cursor-paginated page of leads from the local mirror
+
+        Args:
+            cursor: Opaque cursor from a previous page
+            limit: Maximum number of records to return
+            **filters: priority, min_score, max_score, created_after,
+                created_before
+
+        Returns:
+            Tuple of (records, next_cursor)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        return self.mirror.page(cursor=cursor, limit=limit, **filters)
+
+    def iter_leads(self, page_size: int = 100, **filters) -> Iterator[Dict]:
+        """
+        Iterate over matching leads without loading them all at once
+
+        Args:
+            page_size: Records fetched per page
+            **filters: Same filters as list_leads_page()
+
+        Yields:
+            Lead records, newest first
+        """
+        for page in self.mirror.iter_pages(page_size=page_size, **filters):
+            yield from page
+
     def get_stats(self) -> Dict:
         """
         Get lead statistics
 
+        Served from running aggregates without an Airtable request. The
+        aggregates are rebuilt periodically by reconcile_stats().
+
         Returns:
             Dictionary with stats
         """
+        return self.stats.snapshot()
+
+    def sync_mirror(self) -> int:
+        """
+        Pull records modified in Airtable since the last sync
+
+        Falls back to a full reconcile() when the mirror has never synced.
+
+        Returns:
+            Number of changed records synced, -1 on failure
+        """
+        watermark = self.mirror.get_watermark()
+        if watermark is None:
+            # Never synced - take a full snapshot instead
+            return 0 if self.reconcile() else -1
+
         try:
-            all_leads = self.table.all()
-
-            stats = {
-                "total": len(all_leads),
-                "hot": 0,
-                "warm": 0,
-                "cold": 0,
-                "avg_score": 0.0,
-            }
-
-            if all_leads:
-                scores = []
-                for record in all_leads:
-                    fields = record["fields"]
-                    priority = fields.get("Priority", "").lower()
-
-                    if priority == "hot":
-                        stats["hot"] += 1
-                    elif priority == "warm":
-                        stats["warm"] += 1
-                    elif priority == "cold":
-                        stats["cold"] += 1
-
-                    score = fields.get("Score")
-                    if score:
-                        scores.append(score)
-
-                if scores:
-                    stats["avg_score"] = sum(scores) / len(scores)
-
-            logger.info("✅ Retrieved stats from Airtable")
-            return stats
+            started_at = airtable_timestamp(datetime.utcnow())
+            formula = f"IS_AFTER(LAST_MODIFIED_TIME(), DATETIME_PARSE('{watermark}'))"
+            records = self.table.all(formula=formula)
+            self._apply_records(records)
+            self.mirror.set_watermark(started_at)
+
+            if records:
+                logger.info("✅ Synced %s changed leads from Airtable", len(records))
+            return len(records)
 
         except Exception as e:
-            logger.error("❌ Failed to get stats from Airtable: %s", str(e))
-            return {
-                "total": 0,
-                "hot": 0,
-                "warm": 0,
-                "cold": 0,
-                "avg_score": 0,
-            }
+            count_airtable_error("sync")
+            logger.error("❌ Failed to sync lead mirror: %s", str(e))
+            return -1
+
+    def reconcile(self) -> bool:
+        """
+        Rebuild the mirror and running statistics from a full table scan
+
+        Corrects drift from records edited or deleted outside this service.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            started_at = airtable_timestamp(datetime.utcnow())
+            records = self.table.all()
+            self.mirror.replace_all(records)
+            self.stats.reset(records)
+            self.mirror.set_watermark(started_at)
+            logger.info("✅ Reconciled %s leads with Airtable", len(records))
+            return True
+
+        except Exception as e:
+            count_airtable_error("reconcile")
+            logger.error("❌ Failed to reconcile leads with Airtable: %s", str(e))
+            return False
+
+    def _apply_records(self, records: Sequence[Mapping[str, Any]]):
+        """Write-through created, updated or synced records"""
+        self.mirror.upsert(records)
+        for record in records:
+            self.stats.record(record["id"], record["fields"])
@@ -0,0 +1,184 @@
+"""
+Circuit breaker that stops calling a failing dependency
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Iterator, Optional
+
+from config import default, get_settings
+from services.metrics import registry
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency while its circuit is open"""
+
+
+class CircuitBreaker:
+    """
+    Tracks recent call outcomes and fails fast while a dependency is unhealthy
+
+    Closed: calls go through and their outcomes fill a rolling window.
+    Once the window holds at least `min_calls` outcomes and the share of
+    failures (errors or calls slower than `slow_call_seconds`) reaches
+    `failure_rate`, the circuit opens.
+
+    Open: calls are rejected immediately for `open_seconds`.
+
+    Half-open: up to `half_open_probes` calls are let through to test
+    recovery. If they all succeed the circuit closes; any failure opens
+    it again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: Optional[float] = None,
+        min_calls: Optional[int] = None,
+        window: Optional[int] = None,
+        slow_call_seconds: Optional[float] = None,
+        open_seconds: Optional[float] = None,
+        half_open_probes: Optional[int] = None,
+        enabled: Optional[bool] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize a closed circuit"""
+        self.name = name
+        self.failure_rate = default(failure_rate, settings.CIRCUIT_FAILURE_RATE)
+        self.min_calls = default(min_calls, settings.CIRCUIT_MIN_CALLS)
+        self.slow_call_seconds = default(
+            slow_call_seconds, settings.CIRCUIT_SLOW_CALL_SECONDS
+        )
+        self.open_seconds = default(open_seconds, settings.CIRCUIT_OPEN_SECONDS)
+        self.half_open_probes = default(
+            half_open_probes, settings.CIRCUIT_HALF_OPEN_PROBES
+        )
+        self.enabled = default(enabled, settings.CIRCUIT_ENABLED)
+        self._clock = clock
+
+        self._outcomes: Deque[bool] = deque(
+            maxlen=default(window, settings.CIRCUIT_WINDOW)
+        )
+        self._failures = 0
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        # Bumped on every half-open period so late probes from an earlier
+        # period are ignored
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._opened_total = registry.counter(
+            "circuit_breaker_opened_total",
+            "Times a circuit breaker opened",
+            dependency=name,
+        )
+
+    @property
+    def state(self) -> str:
+        """Current state: closed, open or half_open"""
+        with self._lock:
+            return self._current_state()
+
+    def available(self) -> bool:
+        """Whether a call could be admitted now (cheap pre-check, reserves nothing)"""
+        return not self.enabled or self.state != OPEN
+
+    @contextmanager
+    def call(self) -> Iterator[None]:
+        """
+        Guard one call to the dependency
+
+        Raises:
+            CircuitOpenError: If the circuit is open or all half-open
+                probe slots are taken
+        """
+        if not self.enabled:
+            yield
+            return
+
+        probe = self._admit()
+        start = self._clock()
+        try:
+            yield
+        except Exception:
+            self._record(False, probe)
+            raise
+        except BaseException:
+            # Cancelled, not failed: free the probe slot without an outcome
+            with self._lock:
+                if probe is not None and probe == self._generation:
+                    self._probes_in_flight -= 1
+            raise
+        else:
+            self._record(self._clock() - start <= self.slow_call_seconds, probe)
+
+    def _admit(self) -> Optional[int]:
+        """Admit a call, returning its half-open period if it is a probe"""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return None
+            if state == HALF_OPEN and self._probes_in_flight < self.half_open_probes:
+                self._probes_in_flight += 1
+                return self._generation
+        raise CircuitOpenError(f"{self.name} circuit is open")
+
+    def _current_state(self) -> str:
+        """State, moving from open to half-open once the cool-down ends"""
+        if self._state == OPEN and self._clock() - self._opened_at >= self.open_seconds:
+            self._state = HALF_OPEN
+            self._generation += 1
+            self._probes_in_flight = 0
+            self._probe_successes = 0
+            logger.info("🔌 %s circuit half-open, probing recovery", self.name)
+        return self._state
+
+    def _record(self, ok: bool, probe: Optional[int]):
+        """Add a call outcome and change state if needed"""
+        with self._lock:
+            if probe is not None:
+                if probe != self._generation or self._state != HALF_OPEN:
+                    return
+                self._probes_in_flight -= 1
+                if not ok:
+                    self._open()
+                    return
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_probes:
+                    self._state = CLOSED
+                    self._outcomes.clear()
+                    self._failures = 0
+                    logger.info("✅ %s circuit closed", self.name)
+                return
+
+            if self._state != CLOSED:
+                return
+            if len(self._outcomes) == self._outcomes.maxlen and not self._outcomes[0]:
+                self._failures -= 1
+            self._outcomes.append(ok)
+            self._failures += not ok
+            if (
+                len(self._outcomes) >= self.min_calls
+                and self._failures / len(self._outcomes) >= self.failure_rate
+            ):
+                self._open()
+
+    def _open(self):
+        """Open the circuit (caller holds the lock)"""
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._opened_total.inc()
+        logger.warning(
+            "⚠️ %s circuit opened, failing fast for %ss", self.name, self.open_seconds
+        )
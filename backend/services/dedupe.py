@@ -0,0 +1,124 @@
+"""
+Index of recent submissions used to detect repeat leads
+"""
+
+import difflib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from config import get_settings
+from models.schemas import LeadInput
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+@dataclass
+class DuplicateEntry:
+    """A recently saved lead"""
+
+    record_id: str
+    message: str
+    result: Dict
+    seen_at: float
+
+
+class DuplicateIndex:
+    """
+    Recent leads keyed by normalized email
+
+    Only the same address counts as the same lead: colleagues at one
+    company are separate leads even when their messages look alike.
+
+    A lead submitted again within the dedupe window can be attached to
+    the existing record instead of being re-qualified and re-created.
+    Entries older than the window are evicted as new ones arrive.
+    """
+
+    def __init__(
+        self,
+        window_hours: float = settings.DEDUPE_WINDOW_HOURS,
+        similarity_threshold: float = settings.DEDUPE_SIMILARITY_THRESHOLD,
+    ):
+        """Initialize empty index"""
+        self.window_seconds = window_hours * 3600
+        self.similarity_threshold = similarity_threshold
+        self._entries: "OrderedDict[str, DuplicateEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+
+    def find(self, lead: LeadInput) -> Optional[DuplicateEntry]:
+        """
+        Find a recent submission this lead repeats
+
+        Args:
+            lead: Input lead data
+
+        Returns:
+            The earlier entry if the lead matches one inside the window
+            and its message has not materially changed, None otherwise
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._evict(now)
+            entry = self._entries.get(self._key(lead))
+            if entry is None or self.is_material_change(entry.message, lead.message):
+                return None
+            self.hits += 1
+            return entry
+
+    def remember(self, lead: LeadInput, record_id: str, result: Dict):
+        """
+        Index a saved lead
+
+        Args:
+            lead: Input lead data
+            record_id: Airtable record ID the lead was saved as
+            result: Qualification result (score, priority, analysis)
+        """
+        entry = DuplicateEntry(
+            record_id=record_id,
+            message=lead.message,
+            result=result,
+            seen_at=time.monotonic(),
+        )
+        with self._lock:
+            key = self._key(lead)
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._evict(entry.seen_at)
+
+    def is_material_change(self, previous: str, current: str) -> bool:
+        """Whether a new message differs enough to need re-qualification"""
+        ratio = difflib.SequenceMatcher(
+            None, self._normalize(previous), self._normalize(current)
+        ).ratio()
+        return ratio < self.similarity_threshold
+
+    def stats(self) -> Dict:
+        """Index size and duplicate hits"""
+        with self._lock:
+            return {"entries": len(self._entries), "duplicates": self.hits}
+
+    def _evict(self, now: float):
+        """Drop entries that fell out of the window (oldest first)"""
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if now - entry.seen_at < self.window_seconds:
+                return
+            del self._entries[key]
+
+    @staticmethod
+    def _key(lead: LeadInput) -> str:
+        """Index key for a lead: its normalized email"""
+        return lead.email.strip().lower()
+
+    @staticmethod
+    def _normalize(message: str) -> str:
+        """Lowercase and collapse whitespace"""
+        return " ".join(message.lower().split())
@@ -0,0 +1,222 @@
+"""
+Background dependency probes behind the /health endpoint
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime
+from typing import Callable, Deque, Dict, Optional, Set
+
+from config import default, get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Dependency states, from best to worst
+UP = "up"
+SLOW = "slow"
+STALE = "stale"
+UNKNOWN = "unknown"
+DOWN = "down"
+
+
+class ProbeState:
+    """
+    Rolling results of one dependency's probes
+
+    The error count over the window is kept alongside the window itself,
+    so reading the error rate never walks the window.
+    """
+
+    def __init__(self, window: int):
+        """Initialize with no results"""
+        self._results: Deque[bool] = deque(maxlen=window)
+        self._failures = 0
+        self.ok: Optional[bool] = None
+        self.last_latency_ms: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.last_checked: Optional[datetime] = None
+        self._checked_at: Optional[float] = None
+
+    def record(self, ok: bool, latency_ms: float, error: Optional[str] = None):
+        """Add the outcome of one probe"""
+        if len(self._results) == self._results.maxlen and not self._results[0]:
+            self._failures -= 1
+        self._results.append(ok)
+        self._failures += not ok
+
+        self.ok = ok
+        self.last_latency_ms = round(latency_ms, 1)
+        self.last_error = error
+        self.last_checked = datetime.utcnow()
+        self._checked_at = time.monotonic()
+
+    @property
+    def error_rate(self) -> float:
+        """Share of failed probes in the window"""
+        if not self._results:
+            return 0.0
+        return round(self._failures / len(self._results), 3)
+
+    def snapshot(self, stale_after: float, slow_after_ms: float) -> Dict:
+        """
+        Current health of the dependency
+
+        Args:
+            stale_after: Seconds after which the last result is stale
+            slow_after_ms: Latency above which a reachable dependency is slow
+
+        Returns:
+            Dict with status, last_latency_ms, error_rate,
+            staleness_seconds, last_checked and last_error
+        """
+        staleness = None
+        if self._checked_at is None:
+            status = UNKNOWN
+        else:
+            staleness = round(time.monotonic() - self._checked_at, 1)
+            if staleness > stale_after:
+                status = STALE
+            elif not self.ok:
+                status = DOWN
+            elif (self.last_latency_ms or 0.0) > slow_after_ms:
+                status = SLOW
+            else:
+                status = UP
+
+        return {
+            "status": status,
+            "last_latency_ms": self.last_latency_ms,
+            "error_rate": self.error_rate,
+            "staleness_seconds": staleness,
+            "last_checked": self.last_checked,
+            "last_error": self.last_error,
+        }
+
+
+class HealthProber:
+    """
+    Periodically checks dependencies and caches the results
+
+    Probes run in a background task, so serving /health only reads the
+    latest cached result per dependency and never waits on Gemini or
+    Airtable, however often it is polled. A down dependency degrades the
+    app; only a failure of the worker itself makes it unhealthy, unless
+    fail_on_dependency_down is set.
+    """
+
+    def __init__(
+        self,
+        probes: Dict[str, Callable[[], None]],
+        interval: Optional[float] = None,
+        timeout: Optional[float] = None,
+        stale_after: Optional[float] = None,
+        slow_after_ms: Optional[float] = None,
+        window: Optional[int] = None,
+        fail_on_dependency_down: Optional[bool] = None,
+    ):
+        """
+        Initialize prober
+
+        Args:
+            probes: Blocking callables by dependency name; a probe
+                succeeds if it returns and fails if it raises
+            interval: Seconds between probe rounds
+            timeout: Seconds before a probe counts as failed
+            stale_after: Seconds after which a result is reported stale
+            slow_after_ms: Latency above which a dependency is reported slow
+            window: Probe results kept for the error rate
+            fail_on_dependency_down: Report unhealthy, not degraded,
+                while a dependency is down
+        """
+        self.probes = probes
+        self.interval = default(interval, settings.HEALTH_PROBE_INTERVAL)
+        self.timeout = default(timeout, settings.HEALTH_PROBE_TIMEOUT)
+        self.stale_after = default(stale_after, settings.HEALTH_STALE_AFTER)
+        self.slow_after_ms = default(slow_after_ms, settings.HEALTH_SLOW_MS)
+        window = default(window, settings.HEALTH_PROBE_WINDOW)
+        self.fail_on_dependency_down = default(
+            fail_on_dependency_down, settings.HEALTH_FAIL_ON_DEPENDENCY_DOWN
+        )
+        self.states = {name: ProbeState(window) for name in probes}
+        # Probes whose thread is still running, possibly past its timeout
+        self._in_flight: Set[str] = set()
+        # Set when the probe loop dies, after which results only go stale
+        self.loop_error: Optional[str] = None
+
+    async def run(self):
+        """Probe every dependency each interval until cancelled"""
+        try:
+            while True:
+                await self.probe_all()
+                await asyncio.sleep(self.interval)
+        except Exception as e:
+            self.loop_error = str(e) or type(e).__name__
+            logger.error("❌ Health probe loop stopped: %s", self.loop_error)
+            raise
+
+    async def probe_all(self):
+        """Run one round of probes concurrently"""
+        await asyncio.gather(*(self._probe(name) for name in self.probes))
+
+    async def _probe(self, name: str):
+        """Run one probe and record its latency and outcome"""
+        if name in self._in_flight:
+            # A hung probe is not piled on with more threads; the
+            # dependency stays failed until that probe returns
+            error = "Previous probe still running"
+            self.states[name].record(False, self.timeout * 1000, error)
+            logger.warning("⚠️ Health probe %s failed: %s", name, error)
+            return
+
+        start = time.perf_counter()
+        self._in_flight.add(name)
+        try:
+            # A timed-out probe thread is left to finish on its own
+            await asyncio.wait_for(
+                asyncio.to_thread(self._call, name), timeout=self.timeout
+            )
+        except asyncio.TimeoutError:
+            error = f"Timed out after {self.timeout:g}s"
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        else:
+            error = None
+
+        latency_ms = (time.perf_counter() - start) * 1000
+        self.states[name].record(error is None, latency_ms, error)
+        if error:
+            logger.warning("⚠️ Health probe %s failed: %s", name, error)
+
+    def _call(self, name: str):
+        """Run a probe in a worker thread, marking it done when it returns"""
+        try:
+            self.probes[name]()
+        finally:
+            self._in_flight.discard(name)
+
+    def snapshot(self) -> Dict:
+        """
+        Cached health of the app and each dependency
+
+        Returns:
+            Dict with overall status (healthy, degraded or unhealthy) and
+            per-dependency details; unhealthy when the probe loop has
+            died, or a dependency is down and fail_on_dependency_down is set
+        """
+        dependencies = {
+            name: state.snapshot(self.stale_after, self.slow_after_ms)
+            for name, state in self.states.items()
+        }
+        statuses = {dependency["status"] for dependency in dependencies.values()}
+        if self.loop_error is not None:
+            status = "unhealthy"
+        elif DOWN in statuses and self.fail_on_dependency_down:
+            status = "unhealthy"
+        elif statuses - {UP}:
+            status = "degraded"
+        else:
+            status = "healthy"
+        return {"status": status, "dependencies": dependencies}
@@ -0,0 +1,149 @@
+"""
+Hedged requests: a budgeted backup call when the first one runs slow
+"""
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Optional, TypeVar
+
+from config import default, get_settings
+from services.metrics import HEDGE_WINS, HEDGES
+
+settings = get_settings()
+
+T = TypeVar("T")
+
+# Most backups that may be saved up for a burst of slow calls
+MAX_HEDGE_CREDITS = 10.0
+
+
+class HedgePolicy:
+    """
+    When to send a backup request, and how many may be sent
+
+    The hedge delay is a percentile of recently completed call latencies.
+    Every call earns `budget` credits and every backup spends one, so at
+    most a `budget` share of calls is ever hedged.
+    """
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        percentile: Optional[float] = None,
+        budget: Optional[float] = None,
+        min_samples: Optional[int] = None,
+        window: int = 200,
+    ):
+        """Initialize policy with no latency samples"""
+        self.enabled = default(enabled, settings.GEMINI_HEDGE_ENABLED)
+        self.percentile = default(percentile, settings.GEMINI_HEDGE_PERCENTILE)
+        self.budget = default(budget, settings.GEMINI_HEDGE_BUDGET)
+        self.min_samples = default(min_samples, settings.GEMINI_HEDGE_MIN_SAMPLES)
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._credits = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        """Add the latency of a completed call"""
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def delay(self) -> Optional[float]:
+        """
+        Seconds to wait before hedging a new call
+
+        Called once per call, which also earns the call's budget credit.
+
+        Returns:
+            The latency percentile of recent calls, or None if hedging is
+            disabled or there are too few samples yet
+        """
+        with self._lock:
+            if not self.enabled:
+                return None
+            self._credits = min(self._credits + self.budget, MAX_HEDGE_CREDITS)
+            if len(self._latencies) < self.min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        rank = max(1, math.ceil(self.percentile / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def try_hedge(self, admit: Callable[[], bool]) -> bool:
+        """
+        Spend a credit on a backup request if one is available
+
+        Args:
+            admit: Takes quota for the backup, returning False if there is
+                none to spare
+
+        Returns:
+            True if the backup may be sent
+        """
+        with self._lock:
+            if self._credits < 1 or not admit():
+                return False
+            self._credits -= 1
+            return True
+
+
+async def hedged(
+    call: Callable[[], Awaitable[T]],
+    policy: HedgePolicy,
+    admit: Callable[[], bool],
+) -> T:
+    """
+    Run a call, sending one backup if it outlasts the hedge delay
+
+    The first successful response wins and the other request is
+    cancelled. If one request fails while the other is still running,
+    the other one is awaited.
+
+    Args:
+        call: Starts one request (called once or twice)
+        policy: Hedge delay and budget
+        admit: Takes quota for a backup request
+
+    Returns:
+        Result of the first request to succeed
+
+    Raises:
+        Exception: The error of the last request to fail if none succeed
+    """
+
+    async def attempt() -> T:
+        started = time.perf_counter()
+        result = await call()
+        policy.record(time.perf_counter() - started)
+        return result
+
+    delay = policy.delay()
+    if delay is None:
+        return await attempt()
+
+    primary = asyncio.ensure_future(attempt())
+    tasks = [primary]
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if done or not policy.try_hedge(admit):
+            return await primary
+
+        HEDGES.inc()
+        tasks.append(asyncio.ensure_future(attempt()))
+        pending = set(tasks)
+        while True:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    if task is not primary:
+                        HEDGE_WINS.inc()
+                    return task.result()
+            if not pending:
+                return done.pop().result()
+    finally:
+        for task in tasks:
+            task.cancel()
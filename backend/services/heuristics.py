@@ -0,0 +1,220 @@
+"""
+Local rule-based pre-scoring of leads
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from config import get_settings
+from models.schemas import LeadInput
+
+settings = get_settings()
+
+URGENCY_HIGH = re.compile(
+    r"\b(urgent(ly)?|asap|immediately|right away|this week|deadline|"
+    r"as soon as possible|within \d+ (days?|weeks?))\b",
+    re.IGNORECASE,
+)
+URGENCY_LOW = re.compile(
+    r"\b(no rush|no hurry|someday|next year|eventually|not urgent|in the future)\b",
+    re.IGNORECASE,
+)
+
+INTENT_PATTERNS = [
+    (
+        "ready_to_buy",
+        re.compile(
+            r"\b(ready to (buy|purchase|sign|start)|budget (is )?approved|"
+            r"need to implement|looking to implement|sign the contract|"
+            r"purchase order|want to buy)\b",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        "just_browsing",
+        re.compile(
+            r"\b(just (browsing|curious|looking)|maybe interested|not sure (yet|if))\b",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        "evaluating",
+        re.compile(
+            r"\b(demo|trial|compar(e|ing)|evaluat(e|ing)|quote|pricing|proposal|"
+            r"alternatives?)\b",
+            re.IGNORECASE,
+        ),
+    ),
+]
+
+READY_TO_BUY = dict(INTENT_PATTERNS)["ready_to_buy"]
+
+# Negated buying language ("not ready to buy", "budget is not approved")
+NOT_READY = re.compile(
+    r"(\bnot|\bnever|n't)\s+(yet\s+)?(ready|approved|funded|interested|buying|"
+    r"looking to (buy|purchase))\b",
+    re.IGNORECASE,
+)
+NO_BUDGET = re.compile(
+    r"(\bno (budget|funding)\b|\bbudget (is ?|has ?)?(not|n't)( been)? approved\b|"
+    r"\bnot (yet )?(approved|funded)\b|(\$|€|£|usd\s?)\s?0\b(?![.,]\d*[1-9]))",
+    re.IGNORECASE,
+)
+
+BUDGET_AMOUNT = re.compile(
+    r"(\$|€|£|usd\s?)\s?\d[\d,]*(\.\d+)?\s?(k|m|million|thousand)?\b",
+    re.IGNORECASE,
+)
+BUDGET_WORDS = re.compile(r"\b(budget|funding|funded|approved)\b", re.IGNORECASE)
+DECISION_MAKER = re.compile(
+    r"\b(ceo|cto|cfo|coo|vp|vice president|director|head of|founder|owner)\b",
+    re.IGNORECASE,
+)
+TEAM_SIZE = re.compile(
+    r"\b(\d[\d,]*)[\s-]*(person|people|employees?|seats?|users?|reps?|agents?|members?)\b",
+    re.IGNORECASE,
+)
+
+PAIN_PATTERNS = re.compile(
+    r"\b(failing|losing( deals| customers)?|costing us|frustrat(ed|ing)|"
+    r"struggl(e|ing)|broken|too (slow|expensive)|manual(ly)?|outdated|"
+    r"inefficient|missing (leads|follow-ups?)|churn)\b",
+    re.IGNORECASE,
+)
+
+# Confidence weight of each dimension when explicitly matched
+WEIGHT_INTENT = 0.4
+WEIGHT_URGENCY = 0.3
+WEIGHT_BUDGET = 0.15
+WEIGHT_PAIN = 0.15
+
+
+@dataclass
+class HeuristicResult:
+    """Outcome of the local pre-scorer"""
+
+    analysis: Dict
+    confidence: float
+
+
+class HeuristicScorer:
+    """
+    Keyword and pattern rules that approximate the AI analysis
+
+    Produces the same fields _calculate_score consumes (urgency_level,
+    buying_intent, budget_signals, pain_points) plus a confidence in
+    [0, 1] reflecting how many of them were decided by explicit evidence
+    rather than defaults.
+    """
+
+    def analyze(self, lead: LeadInput) -> HeuristicResult:
+        """
+        Pre-score a lead from its message
+
+        Args:
+            lead: Input lead data
+
+        Returns:
+            HeuristicResult with analysis dict and confidence
+        """
+        message = lead.message
+        confidence = 0.0
+        conflicting = False
+
+        # Low and negated phrases are checked first and blanked out before
+        # the positive patterns run, so "not urgent" or "not ready to buy"
+        # never reads as urgency or intent
+        urgency_level = "medium"
+        if URGENCY_LOW.search(message):
+            urgency_level = "low"
+            confidence += WEIGHT_URGENCY
+            conflicting |= bool(URGENCY_HIGH.search(URGENCY_LOW.sub(" ", message)))
+        elif URGENCY_HIGH.search(message):
+            urgency_level = "high"
+            confidence += WEIGHT_URGENCY
+
+        no_budget = bool(NO_BUDGET.search(message))
+        positive = NOT_READY.sub(" ", NO_BUDGET.sub(" ", message))
+
+        buying_intent = "exploring"
+        if NOT_READY.search(message):
+            buying_intent = "just_browsing"
+            confidence += WEIGHT_INTENT
+            conflicting |= bool(READY_TO_BUY.search(positive))
+        else:
+            for intent, pattern in INTENT_PATTERNS:
+                if pattern.search(positive):
+                    buying_intent = intent
+                    confidence += WEIGHT_INTENT
+                    break
+
+        budget_signals = self._budget_signals(positive)
+        pain_points = self._unique_matches(PAIN_PATTERNS, message)
+        conflicting |= no_budget and bool(BUDGET_AMOUNT.search(positive))
+
+        if buying_intent == "just_browsing" or no_budget:
+            # For browsing leads, no budget or pain is consistent evidence
+            if not budget_signals:
+                confidence += WEIGHT_BUDGET
+        if buying_intent == "just_browsing" and not pain_points:
+            confidence += WEIGHT_PAIN
+        if budget_signals:
+            confidence += WEIGHT_BUDGET
+        if pain_points:
+            confidence += WEIGHT_PAIN
+
+        if conflicting:
+            # Mixed signals are left to Gemini
+            confidence = min(confidence, settings.HEURISTIC_MIN_CONFIDENCE / 2)
+
+        analysis = {
+            "industry": None,
+            "company_size": self._company_size(message),
+            "budget_signals": budget_signals,
+            "pain_points": pain_points,
+            "urgency_level": urgency_level,
+            "buying_intent": buying_intent,
+            "recommended_action": (
+                "Call within 1 hour - strong buying signals"
+                if buying_intent == "ready_to_buy"
+                else "Add to nurture sequence - low buying intent"
+            ),
+        }
+        return HeuristicResult(analysis=analysis, confidence=min(confidence, 1.0))
+
+    def _budget_signals(self, message: str) -> List[str]:
+        """Collect up to three budget/buying-power signals"""
+        signals = [match.group(0).strip() for match in BUDGET_AMOUNT.finditer(message)]
+        signals += self._unique_matches(BUDGET_WORDS, message)
+        signals += self._unique_matches(DECISION_MAKER, message)
+        team = TEAM_SIZE.search(message)
+        if team:
+            signals.append(team.group(0))
+        return signals[:3]
+
+    @staticmethod
+    def _company_size(message: str) -> Optional[str]:
+        """Estimate company size from a stated team size"""
+        team = TEAM_SIZE.search(message)
+        if not team:
+            return None
+
+        size = int(team.group(1).replace(",", ""))
+        if size < 10:
+            return "Startup"
+        if size < 50:
+            return "Small"
+        if size < 250:
+            return "Medium"
+        if size < 1000:
+            return "Large"
+        return "Enterprise"
+
+    @staticmethod
+    def _unique_matches(pattern: re.Pattern, message: str) -> List[str]:
+        """Distinct matched phrases, in order of appearance"""
+        seen: Dict[str, None] = {}
+        for match in pattern.finditer(message):
+            seen.setdefault(match.group(0).lower(), None)
+        return list(seen)
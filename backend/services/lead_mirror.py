@@ -0,0 +1,267 @@
+"""
+Local SQLite read replica of the Airtable leads table
+"""
+
+import base64
+import binascii
+import json
+import logging
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from utils import fast_json
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS leads (
+    id TEXT PRIMARY KEY,
+    created_time TEXT NOT NULL,
+    email TEXT,
+    priority TEXT,
+    score REAL,
+    fields TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_leads_priority ON leads (priority);
+CREATE INDEX IF NOT EXISTS idx_leads_score ON leads (score);
+CREATE INDEX IF NOT EXISTS idx_leads_email ON leads (email);
+CREATE INDEX IF NOT EXISTS idx_leads_created_time ON leads (created_time);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class LeadMirror:
+    """
+    SQLite copy of the leads table used to serve reads locally
+
+    Records are stored in Airtable's shape (id, createdTime, fields) with
+    indexed columns for the fields we filter and sort on. The mirror is
+    kept current by write-through from our own writes plus incremental
+    syncs of records modified in Airtable since the last sync.
+    """
+
+    def __init__(self, db_path: str):
+        """Open (or create) the mirror database"""
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.executescript(SCHEMA)
+        self._db.commit()
+        logger.info("✅ Lead mirror opened at %s", db_path)
+
+    def upsert(self, records: Iterable[Mapping[str, Any]]):
+        """
+        Insert or replace Airtable records
+
+        Args:
+            records: Airtable records with "id", "createdTime" and "fields"
+        """
+        rows = [self._row(record) for record in records]
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO leads "
+                "(id, created_time, email, priority, score, fields) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._db.commit()
+
+    def replace_all(self, records: Iterable[Mapping[str, Any]]):
+        """
+        Replace the mirror contents with a full table scan
+
+        Args:
+            records: Every Airtable record in the table
+        """
+        rows = [self._row(record) for record in records]
+        with self._lock:
+            self._db.execute("DELETE FROM leads")
+            self._db.executemany(
+                "INSERT INTO leads "
+                "(id, created_time, email, priority, score, fields) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._db.commit()
+
+    def get(self, record_id: str) -> Optional[Dict]:
+        """
+        Get a mirrored record
+
+        Args:
+            record_id: Airtable record ID
+
+        Returns:
+            Airtable-shaped record if mirrored, None otherwise
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT id, created_time, fields FROM leads WHERE id = ?",
+                (record_id,),
+            ).fetchone()
+        return self._record(row) if row else None
+
+    def list(self, priority: Optional[str] = None, limit: int = 100) -> List[Dict]:
+        """
+        List mirrored records, newest first
+
+        Args:
+            priority: Filter by priority (hot, warm, cold)
+            limit: Maximum number of records to return
+
+        Returns:
+            List of Airtable-shaped records
+        """
+        records, _ = self.page(priority=priority, limit=limit)
+        return records
+
+    def page(
+        self,
+        priority: Optional[str] = None,
+        min_score: Optional[float] = None,
+        max_score: Optional[float] = None,
+        created_after: Optional[str] = None,
+        created_before: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Get one page of mirrored records, newest first
+
+        Uses keyset pagination on (created_time, id), so each page is an
+        index range scan regardless of how deep the listing goes.
+
+        Args:
+            priority: Filter by priority (hot, warm, cold)
+            min_score: Minimum score (inclusive)
+            max_score: Maximum score (inclusive)
+            created_after: Only records created at or after this timestamp
+            created_before: Only records created before this timestamp
+            cursor: Opaque cursor from a previous page
+            limit: Maximum number of records to return
+
+        Returns:
+            Tuple of (records, next_cursor); next_cursor is None on the last page
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        clauses = []
+        params: list = []
+
+        if priority:
+            clauses.append("priority = ?")
+            params.append(priority.lower())
+        if min_score is not None:
+            clauses.append("score >= ?")
+            params.append(min_score)
+        if max_score is not None:
+            clauses.append("score <= ?")
+            params.append(max_score)
+        if created_after:
+            clauses.append("created_time >= ?")
+            params.append(created_after)
+        if created_before:
+            clauses.append("created_time < ?")
+            params.append(created_before)
+        if cursor:
+            created_time, record_id = decode_cursor(cursor)
+            clauses.append("(created_time < ? OR (created_time = ? AND id < ?))")
+            params.extend([created_time, created_time, record_id])
+
+        query = "SELECT id, created_time, fields FROM leads"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        # Fetch one extra row to know whether another page exists
+        query += " ORDER BY created_time DESC, id DESC LIMIT ?"
+        params.append(limit + 1)
+
+        with self._lock:
+            rows = self._db.execute(query, params).fetchall()
+
+        records = [self._record(row) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            last = records[-1]
+            next_cursor = encode_cursor(last["createdTime"], last["id"])
+        return records, next_cursor
+
+    def iter_pages(self, page_size: int = 100, **filters) -> Iterator[List[Dict]]:
+        """
+        Iterate over matching records one page at a time
+
+        Args:
+            page_size: Records per page
+            **filters: Same filters as page()
+
+        Yields:
+            Lists of Airtable-shaped records
+        """
+        cursor = None
+        while True:
+            records, cursor = self.page(cursor=cursor, limit=page_size, **filters)
+            if records:
+                yield records
+            if cursor is None:
+                return
+
+    def get_watermark(self) -> Optional[str]:
+        """Timestamp of the last successful sync, if any"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value FROM sync_state WHERE key = 'last_synced_at'"
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_watermark(self, timestamp: str):
+        """Record the timestamp of a successful sync"""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO sync_state (key, value) "
+                "VALUES ('last_synced_at', ?)",
+                (timestamp,),
+            )
+            self._db.commit()
+
+    @staticmethod
+    def _row(record: Mapping[str, Any]) -> tuple:
+        """Convert an Airtable record to a table row"""
+        fields = record["fields"]
+        score = fields.get("Score")
+        return (
+            record["id"],
+            record.get("createdTime", ""),
+            (fields.get("Email") or "").strip().lower() or None,
+            (fields.get("Priority") or "").lower() or None,
+            float(score) if score is not None else None,
+            fast_json.dumps(fields),
+        )
+
+    @staticmethod
+    def _record(row: tuple) -> Dict:
+        """Convert a table row back to an Airtable-shaped record"""
+        return {"id": row[0], "createdTime": row[1], "fields": fast_json.loads(row[2])}
+
+
+def encode_cursor(created_time: str, record_id: str) -> str:
+    """Encode a page position as an opaque cursor"""
+    raw = json.dumps([created_time, record_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """
+    Decode a cursor produced by encode_cursor()
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        created_time, record_id = json.loads(base64.urlsafe_b64decode(cursor))
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+    return str(created_time), str(record_id)
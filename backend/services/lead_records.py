@@ -0,0 +1,64 @@
+"""
+Conversion of qualified leads to the shapes we store
+"""
+
+from typing import Dict
+
+from models.schemas import LeadInput, QualifiedLead
+
+
+def build_qualified_lead(lead: LeadInput, result: Dict) -> QualifiedLead:
+    """
+    Combine lead input with its qualification result
+
+    Args:
+        lead: Input lead data
+        result: Qualification result with score, priority and analysis
+
+    Returns:
+        QualifiedLead
+    """
+    return QualifiedLead(
+        name=lead.name,
+        email=lead.email,
+        phone=lead.phone,
+        company=lead.company,
+        website=str(lead.website) if lead.website else None,
+        message=lead.message,
+        source=lead.source,
+        score=result["score"],
+        priority=result["priority"],
+        analysis=result["analysis"],
+    )
+
+
+def build_lead_data(qualified_lead: QualifiedLead) -> Dict:
+    """
+    Flatten a qualified lead into the dict AirtableClient writes
+
+    Args:
+        qualified_lead: Lead with its AI analysis
+
+    Returns:
+        Lead data dict accepted by create_lead/create_leads
+    """
+    return {
+        "name": qualified_lead.name,
+        "email": qualified_lead.email,
+        "phone": qualified_lead.phone,
+        "company": qualified_lead.company,
+        "website": qualified_lead.website,
+        "message": qualified_lead.message,
+        "source": qualified_lead.source.value,
+        "score": qualified_lead.score,
+        "priority": qualified_lead.priority.value,
+        "analysis": {
+            "industry": qualified_lead.analysis.industry,
+            "company_size": qualified_lead.analysis.company_size,
+            "urgency_level": qualified_lead.analysis.urgency_level,
+            "buying_intent": qualified_lead.analysis.buying_intent,
+            "pain_points": qualified_lead.analysis.pain_points,
+            "budget_signals": qualified_lead.analysis.budget_signals,
+            "recommended_action": qualified_lead.analysis.recommended_action,
+        },
+    }
@@ -0,0 +1,96 @@
+"""
+Running lead statistics maintained from our own writes
+"""
+
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+PRIORITIES = ("hot", "warm", "cold")
+
+
+class LeadStats:
+    """
+    Running aggregates for the leads table
+
+    Counts per priority and the score sum/count are adjusted whenever a
+    lead is created or updated, so reading them is O(1). The last known
+    priority and score of each record are kept so an update can replace
+    its previous contribution. reset() rebuilds everything from a full
+    table scan to correct drift from edits made outside this service.
+    """
+
+    def __init__(self):
+        """Initialize empty aggregates"""
+        self._lock = threading.Lock()
+        self._records: Dict[str, Tuple[str, Optional[float]]] = {}
+        self._counts = {priority: 0 for priority in PRIORITIES}
+        self._score_sum = 0.0
+        self._score_count = 0
+        self.reconciled_at: Optional[datetime] = None
+
+    def record(self, record_id: str, fields: Dict):
+        """
+        Apply a created or updated Airtable record
+
+        Args:
+            record_id: Airtable record ID
+            fields: Record fields as returned by Airtable
+        """
+        with self._lock:
+            previous = self._records.pop(record_id, None)
+            if previous is not None:
+                self._apply(*previous, sign=-1)
+
+            entry = self._entry(fields)
+            self._records[record_id] = entry
+            self._apply(*entry, sign=1)
+
+    def reset(self, records: Iterable[Mapping[str, Any]]):
+        """
+        Rebuild aggregates from a full list of Airtable records
+
+        Args:
+            records: Airtable records with "id" and "fields"
+        """
+        with self._lock:
+            self._records = {}
+            self._counts = {priority: 0 for priority in PRIORITIES}
+            self._score_sum = 0.0
+            self._score_count = 0
+
+            for record in records:
+                entry = self._entry(record["fields"])
+                self._records[record["id"]] = entry
+                self._apply(*entry, sign=1)
+
+            self.reconciled_at = datetime.utcnow()
+
+    def snapshot(self) -> Dict:
+        """Current statistics in the /leads/stats format"""
+        with self._lock:
+            return {
+                "total": len(self._records),
+                **self._counts,
+                "avg_score": (
+                    self._score_sum / self._score_count if self._score_count else 0.0
+                ),
+                "reconciled_at": (
+                    self.reconciled_at.isoformat() if self.reconciled_at else None
+                ),
+            }
+
+    @staticmethod
+    def _entry(fields: Dict) -> Tuple[str, Optional[float]]:
+        """Extract the priority and score a record contributes"""
+        priority = (fields.get("Priority") or "").lower()
+        score = fields.get("Score")
+        return priority, float(score) if score else None
+
+    def _apply(self, priority: str, score: Optional[float], sign: int):
+        """Add (sign=1) or remove (sign=-1) one record's contribution"""
+        if priority in self._counts:
+            self._counts[priority] += sign
+        if score is not None:
+            self._score_sum += sign * score
+            self._score_count += sign
@@ -0,0 +1,184 @@
+"""
+Write-behind buffer that batches lead creation in Airtable
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Protocol, Tuple
+
+from config import get_settings
+from services.airtable_client import AIRTABLE_MAX_BATCH
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Airtable answers 422 when a record in the batch has an invalid value
+HTTP_UNPROCESSABLE = 422
+
+
+class LeadCreator(Protocol):
+    """Anything that can batch create leads, such as AirtableClient"""
+
+    def create_leads(self, leads: List[Dict]) -> List[str]:
+        """Create leads and return their record IDs in input order"""
+        ...
+
+
+class LeadWriteBuffer:
+    """
+    Groups pending lead writes into Airtable batch creates
+
+    Records are queued by request handlers and flushed by a background
+    task (running only while records are pending) as soon as no more are waiting, once a full batch is pending, or
+    once the flush interval has elapsed, whichever comes first. A lone
+    request is written straight away; under load, records that queue up
+    while a batch is being written share the next one. Each queued record
+    gets a future that resolves
+    to its Airtable record ID, or raises if that record could not be written.
+    """
+
+    def __init__(
+        self,
+        client: LeadCreator,
+        batch_size: int = settings.AIRTABLE_BATCH_SIZE,
+        flush_interval: float = settings.AIRTABLE_FLUSH_INTERVAL,
+    ):
+        """Initialize write buffer"""
+        self.client = client
+        self.batch_size = max(1, min(batch_size, AIRTABLE_MAX_BATCH))
+        self.flush_interval = flush_interval
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def start(self):
+        """Bind the write buffer to the running loop"""
+        self._ensure_worker()
+        logger.info("✅ Airtable write buffer started")
+
+    async def stop(self):
+        """Flush pending records and stop the background task"""
+        worker, queue = self._worker, self._queue
+        if worker is None or queue is None:
+            return
+
+        await queue.join()
+        worker.cancel()
+        try:
+            await worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+        logger.info("👋 Airtable write buffer stopped")
+
+    def enqueue(self, lead_data: Dict) -> asyncio.Future:
+        """
+        Queue a lead for creation without waiting for the write
+
+        Args:
+            lead_data: Lead information including analysis
+
+        Returns:
+            Future resolving to the Airtable record ID
+        """
+        queue = self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        queue.put_nowait((lead_data, future))
+        return future
+
+    async def create_lead(self, lead_data: Dict) -> str:
+        """
+        Queue a lead and wait for its record ID
+
+        Args:
+            lead_data: Lead information including analysis
+
+        Returns:
+            Airtable record ID
+        """
+        return await self.enqueue(lead_data)
+
+    @property
+    def pending(self) -> int:
+        """Number of records waiting to be flushed"""
+        return self._queue.qsize() if self._queue else 0
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        """Start the flush task in the running loop unless it is running"""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        if queue is None or self._loop is not loop:
+            self._loop = loop
+            queue = self._queue = asyncio.Queue()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run(queue))
+        return queue
+
+    async def _run(self, queue: asyncio.Queue):
+        """Collect batches from the queue and flush them until it drains"""
+        while not queue.empty():
+            batch = [queue.get_nowait()]
+            deadline = asyncio.get_running_loop().time() + self.flush_interval
+
+            # Only linger while more records are actually queued
+            while len(batch) < self.batch_size:
+                if queue.empty():
+                    # Let requests that are about to enqueue catch this batch
+                    await asyncio.sleep(0)
+                    if queue.empty():
+                        break
+                batch.append(queue.get_nowait())
+                if asyncio.get_running_loop().time() >= deadline:
+                    break
+
+            try:
+                await self._flush(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _flush(self, batch: List[Tuple[Dict, asyncio.Future]]):
+        """
+        Write one batch to Airtable and resolve its futures
+
+        Airtable rejects a whole batch with 422 when any one record is
+        invalid, so such a batch is retried record by record and only the
+        records that still fail see the error. Other failures (already
+        retried by the client's adapter) fail the whole batch.
+        """
+        try:
+            record_ids = await asyncio.to_thread(
+                self.client.create_leads, [lead_data for lead_data, _ in batch]
+            )
+        except Exception as e:
+            logger.error("❌ Failed to flush Airtable write buffer: %s", str(e))
+            if len(batch) == 1 or _status_code(e) != HTTP_UNPROCESSABLE:
+                for _, future in batch:
+                    self._resolve(future, error=e)
+                return
+            for item in batch:
+                await self._flush([item])
+            return
+
+        for (_, future), record_id in zip(batch, record_ids):
+            self._resolve(future, record_id=record_id)
+
+    @staticmethod
+    def _resolve(
+        future: asyncio.Future,
+        record_id: Optional[str] = None,
+        error: Optional[BaseException] = None,
+    ):
+        """Settle a caller's future unless it was already cancelled"""
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(record_id)
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    """HTTP status of a failed Airtable request, if it got a response"""
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
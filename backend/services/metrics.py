@@ -0,0 +1,342 @@
+"""
+Lightweight Prometheus-format metrics for the qualification pipeline
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+# Seconds; spans sub-millisecond local stages up to slow Gemini calls
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+# queue: waiting for quota admission and a concurrency slot before Gemini
+STAGES = ("prompt", "queue", "llm", "parse", "score", "storage")
+
+
+def _format_labels(
+    labels: Dict[str, str], extra: Optional[Tuple[str, str]] = None
+) -> str:
+    """Render a label set as {key="value",...}"""
+    items = list(labels.items())
+    if extra:
+        items.append(extra)
+    if not items:
+        return ""
+    return "{" + ",".join(f'{key}="{value}"' for key, value in items) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value, integers without a decimal part"""
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+class Counter:
+    """Monotonically increasing count"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Dict[str, str]):
+        """Initialize counter at zero"""
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        """Increase the count"""
+        with self._lock:
+            self.value += amount
+
+    def samples(self) -> List[str]:
+        """Exposition lines for this counter"""
+        return [f"{self.name}{_format_labels(self.labels)} {_format_value(self.value)}"]
+
+
+class Histogram:
+    """Distribution of observed values in fixed buckets"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Dict[str, str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """Initialize empty histogram"""
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self.buckets = tuple(sorted(buckets))
+        # One slot per bucket plus +Inf; counts are per bucket, not cumulative
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        """Record one observation"""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the duration of the wrapped block in seconds"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def samples(self) -> List[str]:
+        """Exposition lines for this histogram"""
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            labels = _format_labels(self.labels, ("le", le))
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = _format_labels(self.labels)
+        lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+        lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+Metric = Union[Counter, Histogram]
+MetricT = TypeVar("MetricT", Counter, Histogram)
+# Metric name plus its sorted (label, value) pairs
+MetricKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class MetricsRegistry:
+    """Holds metrics and renders them in the Prometheus text format"""
+
+    def __init__(self):
+        """Initialize empty registry"""
+        self._metrics: Dict[MetricKey, Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, **labels: str) -> Counter:
+        """Get or create a counter with the given labels"""
+        return self._get(Counter, name, documentation, labels)
+
+    def histogram(self, name: str, documentation: str, **labels: str) -> Histogram:
+        """Get or create a histogram with the given labels"""
+        return self._get(Histogram, name, documentation, labels)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines: List[str] = []
+        seen: Set[str] = set()
+        for metric in sorted(metrics, key=lambda m: m.name):
+            if metric.name not in seen:
+                seen.add(metric.name)
+                lines.append(f"# HELP {metric.name} {metric.documentation}")
+                lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+    def _get(
+        self,
+        cls: Type[MetricT],
+        name: str,
+        documentation: str,
+        labels: Dict[str, str],
+    ) -> MetricT:
+        """Return the registered metric for name and labels, creating it once"""
+        key: MetricKey = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            metric = self._metrics.get(key)
+            if metric is None:
+                metric = cls(name, documentation, labels)
+                self._metrics[key] = metric
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} is already a {metric.kind}")
+            return metric
+
+
+registry = MetricsRegistry()
+
+STAGE_SECONDS = {
+    stage: registry.histogram(
+        "lead_stage_duration_seconds",
+        "Time spent in each lead qualification stage",
+        stage=stage,
+    )
+    for stage in STAGES
+}
+FALLBACKS = registry.counter(
+    "lead_fallbacks_total", "Leads given the default score because AI analysis failed"
+)
+# Parse failure rate: lead_parse_failures_total / lead_parse_attempts_total
+PARSE_ATTEMPTS = registry.counter(
+    "lead_parse_attempts_total", "Gemini analysis replies parsed"
+)
+PARSE_FAILURES = registry.counter(
+    "lead_parse_failures_total", "Gemini replies that could not be parsed"
+)
+PARSE_REPAIRS = registry.counter(
+    "lead_parse_repairs_total", "Malformed Gemini replies sent back for repair"
+)
+GEMINI_TIMEOUTS = registry.counter(
+    "gemini_timeouts_total", "Gemini calls abandoned at the call deadline"
+)
+HEDGES = registry.counter(
+    "gemini_hedged_requests_total", "Backup Gemini requests sent for slow calls"
+)
+HEDGE_WINS = registry.counter(
+    "gemini_hedge_wins_total", "Hedged calls answered by the backup request"
+)
+
+
+# Stages answered without calling Gemini, by scoring path
+_MODEL_STAGES = ("prompt", "queue", "llm", "parse")
+_MODEL_STAGE_STATUS = {
+    "cache": "cached",
+    "near_duplicate": "cached",
+    "duplicate": "cached",
+    "heuristic": "skipped",
+    "circuit_open": "skipped",
+    "fallback": "fallback",
+}
+
+
+class RequestTimings:
+    """Stage durations collected while serving one HTTP request"""
+
+    def __init__(self):
+        """Start timing a request"""
+        self.started_at = time.perf_counter()
+        self.stages: Dict[str, float] = {}
+
+    def add(self, stage: str, seconds: float):
+        """Add time spent in a stage (summed when a stage repeats)"""
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def header(self) -> str:
+        """Server-Timing header value with durations in milliseconds"""
+        elapsed = time.perf_counter() - self.started_at
+        entries = [
+            f"{stage};dur={self.stages[stage] * 1000:.1f}"
+            for stage in STAGES
+            if stage in self.stages
+        ]
+        entries.append(f"total;dur={elapsed * 1000:.1f}")
+        return ", ".join(entries)
+
+    def breakdown(self, scoring_path: Optional[str]) -> Dict:
+        """
+        Per-stage durations and how each stage was satisfied
+
+        Args:
+            scoring_path: Path that produced the lead's score
+
+        Returns:
+            Dict with "stages" ({stage: {duration_ms, status}}) and
+            "total_ms"; status is ran, cached, skipped or fallback
+        """
+        model_status = _MODEL_STAGE_STATUS.get(scoring_path or "", "ran")
+        stages = {}
+        for stage in STAGES:
+            status = "ran"
+            if stage in _MODEL_STAGES:
+                status = model_status
+            elif stage == "score" and scoring_path in ("duplicate", "fallback"):
+                status = model_status
+            stages[stage] = {
+                "duration_ms": round(self.stages.get(stage, 0.0) * 1000, 3),
+                "status": status,
+            }
+        return {
+            "stages": stages,
+            "total_ms": round((time.perf_counter() - self.started_at) * 1000, 3),
+        }
+
+
+_request_timings: ContextVar[Optional[RequestTimings]] = ContextVar(
+    "request_timings", default=None
+)
+
+
+def start_request_timings() -> RequestTimings:
+    """Begin collecting stage timings for the current request context"""
+    timings = RequestTimings()
+    _request_timings.set(timings)
+    return timings
+
+
+def current_request_timings() -> Optional[RequestTimings]:
+    """Timings of the request being served, if any"""
+    return _request_timings.get()
+
+
+def observe_stage(stage: str, seconds: float):
+    """Record a stage duration in the histogram and the current request"""
+    STAGE_SECONDS[stage].observe(seconds)
+    timings = _request_timings.get()
+    if timings is not None:
+        timings.add(stage, seconds)
+
+
+@contextmanager
+def time_stage(stage: str) -> Iterator[None]:
+    """Time the wrapped block as one pipeline stage"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(stage, time.perf_counter() - start)
+
+
+def count_scoring_path(path: str):
+    """Count a lead by the path that produced its score"""
+    registry.counter(
+        "lead_scoring_path_total", "Leads scored, by scoring path", path=path
+    ).inc()
+
+
+def count_airtable_error(operation: str):
+    """Count a failed Airtable operation"""
+    registry.counter(
+        "airtable_errors_total", "Failed Airtable operations", operation=operation
+    ).inc()
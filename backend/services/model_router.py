@@ -0,0 +1,141 @@
+"""
+Routing of leads to Gemini model tiers
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import List, Optional
+
+from config import get_settings
+from models.schemas import LeadInput, LeadSource
+from services.heuristics import HeuristicScorer
+from services.metrics import registry
+from services.scheduler import QualificationScheduler
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+TIER_STRONG = "strong"
+TIER_FAST = "fast"
+
+
+@dataclass
+class ModelTier:
+    """A Gemini model leads can be routed to"""
+
+    name: str
+    model_name: str
+    cost_per_1k_tokens: float
+    # Requests per minute before leads fall back to the next tier down
+    rpm_limit: Optional[int] = None
+
+
+class ModelRouter:
+    """
+    Picks the fastest adequate model tier for each lead
+
+    Referrals, long messages and leads with budget or decision-maker
+    signals go to the strong tier; everything else, mostly short or
+    low-information messages, goes to the fast tier. A tier that has used
+    its per-minute budget hands its leads to the next tier down.
+    """
+
+    def __init__(self, tiers: Optional[List[ModelTier]] = None):
+        """
+        Initialize router
+
+        Args:
+            tiers: Tiers from strongest to fastest; the last one has no
+                budget of its own
+        """
+        self.tiers = tiers or [
+            ModelTier(
+                TIER_STRONG,
+                settings.GEMINI_STRONG_MODEL,
+                settings.GEMINI_STRONG_COST_PER_1K_TOKENS,
+                settings.GEMINI_STRONG_RPM_LIMIT,
+            ),
+            ModelTier(
+                TIER_FAST,
+                settings.GEMINI_FAST_MODEL,
+                settings.GEMINI_FAST_COST_PER_1K_TOKENS,
+            ),
+        ]
+        self.heuristics = HeuristicScorer()
+        # Only used for their non-blocking budget checks
+        self._budgets = {
+            tier.name: QualificationScheduler(
+                rpm_limit=tier.rpm_limit, tpm_limit=10**12
+            )
+            for tier in self.tiers
+            if tier.rpm_limit
+        }
+
+    @property
+    def default_tier(self) -> ModelTier:
+        """Strongest tier, used when routing is disabled"""
+        return self.tiers[0]
+
+    def route(self, lead: LeadInput) -> str:
+        """
+        Name of the tier a lead should be analyzed with
+
+        Args:
+            lead: Input lead data
+
+        Returns:
+            Tier name, before any budget fallback
+        """
+        if not settings.GEMINI_ROUTING_ENABLED:
+            return self.default_tier.name
+        if lead.source == LeadSource.REFERRAL:
+            return TIER_STRONG
+        if len(lead.message.split()) >= settings.GEMINI_STRONG_MIN_WORDS:
+            return TIER_STRONG
+        if self.heuristics.analyze(lead).analysis["budget_signals"]:
+            return TIER_STRONG
+        return TIER_FAST
+
+    def route_pack(self, leads: List[LeadInput]) -> str:
+        """Tier for a packed request: the strongest any of its leads needs"""
+        wanted = {self.route(lead) for lead in leads}
+        for tier in self.tiers:
+            if tier.name in wanted:
+                return tier.name
+        return self.tiers[-1].name
+
+    def select(self, wanted: str, tokens: int) -> ModelTier:
+        """
+        Take budget on the wanted tier, or the next tier down that has some
+
+        Args:
+            wanted: Tier name from route()
+            tokens: Estimated tokens of the request
+
+        Returns:
+            Tier to call
+        """
+        names = [tier.name for tier in self.tiers]
+        start = names.index(wanted) if wanted in names else 0
+        for tier in self.tiers[start:-1]:
+            budget = self._budgets.get(tier.name)
+            if budget is None or budget.try_acquire(tokens):
+                return tier
+            logger.info("⬇️ %s model tier over budget, falling back", tier.name)
+        return self.tiers[-1]
+
+    def record(self, tier: ModelTier, seconds: float, tokens: int):
+        """Record the latency and estimated cost of one call to a tier"""
+        registry.histogram(
+            "gemini_tier_latency_seconds",
+            "Gemini call latency by model tier",
+            tier=tier.name,
+        ).observe(seconds)
+        registry.counter(
+            "gemini_tier_requests_total", "Gemini calls by model tier", tier=tier.name
+        ).inc()
+        registry.counter(
+            "gemini_tier_cost_total",
+            "Estimated Gemini spend by model tier",
+            tier=tier.name,
+        ).inc(tokens / 1000 * tier.cost_per_1k_tokens)
@@ -0,0 +1,163 @@
+"""
+Content-addressed cache for AI qualification results
+"""
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from config import get_settings
+from models.schemas import LeadInput
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class QualificationCache:
+    """
+    Two-tier cache of Gemini analyses keyed on normalized lead content
+
+    - Memory tier: LRU with per-entry TTL, answers in microseconds
+    - Disk tier: optional local SQLite file that survives restarts
+
+    Only the parsed analysis is cached; score and priority are recomputed
+    on a hit so threshold changes take effect immediately.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = settings.QUALIFICATION_CACHE_SIZE,
+        ttl_seconds: float = settings.QUALIFICATION_CACHE_TTL,
+        db_path: str = settings.QUALIFICATION_CACHE_PATH,
+    ):
+        """Initialize cache tiers"""
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._memory: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS qualification_cache ("
+                "key TEXT PRIMARY KEY, analysis TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._db.commit()
+            logger.info("✅ Qualification cache persisted to %s", db_path)
+
+    @staticmethod
+    def make_key(lead: LeadInput) -> str:
+        """
+        Hash the lead fields that influence the analysis
+
+        Case and whitespace are normalized, and website scheme, "www." and
+        trailing slashes are ignored, so trivially different resubmissions
+        share a key.
+        """
+
+        def normalize(value: Optional[str]) -> str:
+            return re.sub(r"\s+", " ", (value or "").strip().lower())
+
+        website = normalize(str(lead.website) if lead.website else "")
+        website = re.sub(r"^https?://(www\.)?", "", website).rstrip("/")
+
+        content = "\x1f".join(
+            [
+                normalize(lead.message),
+                normalize(lead.company),
+                website,
+                lead.source.value,
+            ]
+        )
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a cached analysis
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Analysis dict if cached and fresh, None otherwise
+        """
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, analysis = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return dict(analysis)
+                del self._memory[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT analysis, expires_at FROM qualification_cache WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is not None and row[1] > now:
+                    analysis = json.loads(row[0])
+                    self._remember(key, analysis, row[1])
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return dict(analysis)
+
+            self.misses += 1
+            return None
+
+    def set(self, key: str, analysis: Dict):
+        """
+        Store an analysis in both tiers
+
+        Args:
+            key: Cache key from make_key()
+            analysis: Parsed analysis dict
+        """
+        expires_at = time.time() + self.ttl_seconds
+
+        with self._lock:
+            self._remember(key, dict(analysis), expires_at)
+
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO qualification_cache "
+                        "(key, analysis, expires_at) VALUES (?, ?, ?)",
+                        (key, json.dumps(analysis), expires_at),
+                    )
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.error("❌ Failed to persist cached analysis: %s", str(e))
+
+    def stats(self) -> Dict:
+        """Hit/miss counters and tier sizes"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "persistent": self._db is not None,
+        }
+
+    def _remember(self, key: str, analysis: Dict, expires_at: float):
+        """Insert into the memory tier, evicting least recently used entries"""
+        self._memory[key] = (expires_at, analysis)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
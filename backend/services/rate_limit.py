@@ -0,0 +1,189 @@
+"""
+Request pacing and retry for the Airtable API
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Dict
+
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import ConnectTimeout
+from urllib3.exceptions import NewConnectionError
+
+logger = logging.getLogger(__name__)
+
+# Status codes worth retrying: rate limited or transient server errors
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Methods safe to replay after a server error. A 5xx on a POST may come
+# after the record was written, so creates are only retried on 429 or when
+# the connection failed before the request went out
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket
+
+    Refills at `rate` tokens per second up to `capacity`. acquire() blocks
+    until a token is available, so callers are paced rather than rejected.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        """Initialize a full bucket"""
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+        self.waiting = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+
+    def acquire(self):
+        """Take one token, sleeping until one is available"""
+        waited = False
+        start = time.monotonic()
+
+        with self._lock:
+            self.waiting += 1
+
+        try:
+            while True:
+                with self._lock:
+                    now = time.monotonic()
+                    self._tokens = min(
+                        self.capacity,
+                        self._tokens + (now - self._updated_at) * self.rate,
+                    )
+                    self._updated_at = now
+
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        if waited:
+                            self.throttled += 1
+                            self.total_wait += now - start
+                        return
+
+                    delay = (1 - self._tokens) / self.rate
+
+                waited = True
+                time.sleep(delay)
+
+        finally:
+            with self._lock:
+                self.waiting -= 1
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    HTTP adapter that paces requests and retries throttled ones
+
+    Every outgoing request (including each page of a paginated listing)
+    takes a token from the shared bucket. Rate-limited responses, server
+    errors on idempotent requests and connections that failed before the
+    request was sent are retried with exponential backoff and full jitter,
+    honouring Retry-After when Airtable sends it.
+    """
+
+    def __init__(
+        self,
+        bucket: TokenBucket,
+        max_retries: int,
+        backoff_base: float,
+        backoff_max: float,
+    ):
+        """Initialize adapter"""
+        super().__init__()
+        self.bucket = bucket
+        self.retry_limit = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retries = 0
+        self.rate_limited = 0
+        self.server_errors = 0
+        self.connection_errors = 0
+
+    def send(self, request, **kwargs):  # pylint: disable=arguments-differ
+        """Send a request under the rate limit, retrying when it is safe"""
+        attempt = 0
+        while True:
+            self.bucket.acquire()
+            try:
+                response = super().send(request, **kwargs)
+            except RequestsConnectionError as e:
+                if not self._not_sent(e) or attempt >= self.retry_limit:
+                    raise
+                self.connection_errors += 1
+                delay = self._backoff(attempt, None)
+                logger.warning(
+                    "⏳ Airtable connection failed, retrying in %.2fs: %s",
+                    delay,
+                    str(e),
+                )
+                self.retries += 1
+                attempt += 1
+                time.sleep(delay)
+                continue
+
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                return response
+
+            if response.status_code == 429:
+                self.rate_limited += 1
+            else:
+                self.server_errors += 1
+                if request.method not in IDEMPOTENT_METHODS:
+                    return response
+
+            if attempt >= self.retry_limit:
+                logger.error(
+                    "❌ Airtable request failed after %s retries (HTTP %s)",
+                    attempt,
+                    response.status_code,
+                )
+                return response
+
+            delay = self._backoff(attempt, response.headers.get("Retry-After"))
+            logger.warning(
+                "⏳ Airtable returned HTTP %s, retrying in %.2fs",
+                response.status_code,
+                delay,
+            )
+            response.close()
+            self.retries += 1
+            attempt += 1
+            time.sleep(delay)
+
+    @staticmethod
+    def _not_sent(error: RequestsConnectionError) -> bool:
+        """Whether a connection error happened before any bytes were sent"""
+        if isinstance(error, ConnectTimeout):
+            return True
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return isinstance(reason, NewConnectionError)
+
+    def metrics(self) -> Dict:
+        """Queue depth, throttling and retry counters"""
+        return {
+            "rate_per_second": self.bucket.rate,
+            "queue_depth": self.bucket.waiting,
+            "throttled_requests": self.bucket.throttled,
+            "throttle_wait_seconds": round(self.bucket.total_wait, 3),
+            "retries": self.retries,
+            "rate_limited_responses": self.rate_limited,
+            "server_error_responses": self.server_errors,
+            "connection_errors": self.connection_errors,
+        }
+
+    def _backoff(self, attempt: int, retry_after) -> float:
+        """Jittered exponential backoff, at least Retry-After if given"""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+        try:
+            return max(delay, float(retry_after)) if retry_after else delay
+        except ValueError:
+            return delay
@@ -0,0 +1,215 @@
+"""
+Quota-aware priority scheduling of Gemini requests
+"""
+
+import asyncio
+import itertools
+import logging
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Set, Tuple
+
+from config import get_settings
+from models.schemas import LeadInput, LeadSource
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Lower value = served first
+PRIORITY_REFERRAL = 0
+PRIORITY_PHONE = 1
+PRIORITY_EMAIL = 2
+PRIORITY_DEFAULT = 3
+
+# Rough output size of one analysis, added to the prompt estimate
+ESTIMATED_RESPONSE_TOKENS = 300
+
+WINDOW_SECONDS = 60.0
+
+
+def lead_priority(lead: LeadInput) -> int:
+    """Scheduling priority of a lead: referrals, then phone leads, then the rest"""
+    if lead.source == LeadSource.REFERRAL:
+        return PRIORITY_REFERRAL
+    if lead.source == LeadSource.PHONE or lead.phone:
+        return PRIORITY_PHONE
+    if lead.source == LeadSource.EMAIL:
+        return PRIORITY_EMAIL
+    return PRIORITY_DEFAULT
+
+
+def estimate_tokens(prompt: str) -> int:
+    """Approximate tokens a request will consume (about 4 characters per token)"""
+    return len(prompt) // 4 + ESTIMATED_RESPONSE_TOKENS
+
+
+class QualificationScheduler:
+    """
+    Admits Gemini requests by priority within RPM/TPM budgets
+
+    Requests wait in a priority queue and a background dispatcher admits
+    them only while the rolling window (one minute by default) has request
+    and token budget left. When saturated, high-value leads are admitted
+    first and low-value ones wait; a request that waits longer than the
+    queue timeout is rejected so the caller can fall back. The dispatcher
+    only runs while requests are queued and exits once the queue drains.
+    """
+
+    def __init__(
+        self,
+        rpm_limit: int = settings.GEMINI_RPM_LIMIT,
+        tpm_limit: int = settings.GEMINI_TPM_LIMIT,
+        queue_timeout: float = settings.GEMINI_QUEUE_TIMEOUT,
+        window_seconds: float = WINDOW_SECONDS,
+    ):
+        """Initialize scheduler"""
+        self.rpm_limit = rpm_limit
+        self.tpm_limit = tpm_limit
+        self.queue_timeout = queue_timeout
+        self.window_seconds = window_seconds
+        self._window: Deque[Tuple[float, int]] = deque()
+        self._window_tokens = 0
+        self._sequence = itertools.count()
+        # Sequence numbers of queued requests already counted as throttled
+        self._throttled_sequences: Set[int] = set()
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.admitted = 0
+        self.rejected = 0
+        self.throttled = 0
+
+    async def acquire(self, priority: int, tokens: int):
+        """
+        Wait until a request may be sent to Gemini
+
+        Args:
+            priority: Scheduling priority (lower is served first)
+            tokens: Estimated tokens the request will consume
+
+        Raises:
+            asyncio.TimeoutError: If not admitted within the queue timeout
+        """
+        queue = self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        queue.put_nowait((priority, next(self._sequence), tokens, future))
+
+        try:
+            await asyncio.wait_for(future, self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            logger.warning("⏳ Gemini quota queue timeout (priority %s)", priority)
+            raise
+
+    def try_acquire(self, tokens: int) -> bool:
+        """
+        Take budget for a request only if it is free right now
+
+        Never waits and never overtakes queued requests, so optional
+        traffic (such as hedged backups) only uses spare quota.
+
+        Args:
+            tokens: Estimated tokens the request will consume
+
+        Returns:
+            True if the request was admitted
+        """
+        if (self._queue is not None and not self._queue.empty()) or (
+            self._budget_delay(tokens) > 0
+        ):
+            return False
+        self._record(tokens)
+        self.admitted += 1
+        return True
+
+    def stats(self) -> Dict:
+        """Queue depth and budget usage"""
+        self._expire(time.monotonic())
+        return {
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "requests_in_window": len(self._window),
+            "tokens_in_window": self._window_tokens,
+            "rpm_limit": self.rpm_limit,
+            "tpm_limit": self.tpm_limit,
+            "admitted": self.admitted,
+            "throttled": self.throttled,
+            "rejected": self.rejected,
+        }
+
+    async def stop(self):
+        """Cancel the dispatcher task"""
+        worker = self._worker
+        if worker is None:
+            return
+
+        worker.cancel()
+        try:
+            await worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+    def _ensure_worker(self) -> asyncio.PriorityQueue:
+        """Start the dispatcher in the running loop unless it is running"""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        if queue is None or self._loop is not loop:
+            self._loop = loop
+            queue = self._queue = asyncio.PriorityQueue()
+            self._throttled_sequences.clear()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run(queue))
+        return queue
+
+    async def _run(self, queue: asyncio.PriorityQueue):
+        """Admit queued requests in priority order as budget frees up"""
+        while not queue.empty():
+            item = queue.get_nowait()
+            _, sequence, tokens, future = item
+            if future.done():
+                # Caller timed out or was cancelled while queued
+                self._throttled_sequences.discard(sequence)
+                continue
+
+            delay = self._budget_delay(tokens)
+            if delay > 0:
+                # Requeue so a higher-priority arrival can overtake it
+                if sequence not in self._throttled_sequences:
+                    self._throttled_sequences.add(sequence)
+                    self.throttled += 1
+                queue.put_nowait(item)
+                await asyncio.sleep(delay)
+                continue
+
+            self._throttled_sequences.discard(sequence)
+            self._record(tokens)
+            self.admitted += 1
+            future.set_result(None)
+
+    def _budget_delay(self, tokens: int) -> float:
+        """Seconds until the window has room for this request (0 if now)"""
+        now = time.monotonic()
+        self._expire(now)
+
+        if not self._window:
+            return 0.0
+
+        over_requests = len(self._window) >= self.rpm_limit
+        over_tokens = self._window_tokens + tokens > self.tpm_limit
+        if not over_requests and not over_tokens:
+            return 0.0
+
+        oldest, _ = self._window[0]
+        return max(oldest + self.window_seconds - now, 0.001)
+
+    def _record(self, tokens: int):
+        """Count an admitted request against the window"""
+        self._window.append((time.monotonic(), tokens))
+        self._window_tokens += tokens
+
+    def _expire(self, now: float):
+        """Drop window entries older than the budget window"""
+        while self._window and self._window[0][0] <= now - self.window_seconds:
+            _, tokens = self._window.popleft()
+            self._window_tokens -= tokens
@@ -0,0 +1,36 @@
+"""
+ASGI middleware adding a Server-Timing header to every response
+"""
+
+from services.metrics import start_request_timings
+
+
+class ServerTimingMiddleware:
+    """
+    Collects per-stage timings for each request and reports them
+
+    Stage durations recorded through services.metrics while the request
+    is handled are sent as a Server-Timing header. The header goes out
+    with the response start, so streamed responses only report the
+    stages that finished before their first byte.
+    """
+
+    def __init__(self, app):
+        """Wrap an ASGI app"""
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = start_request_timings()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", timings.header().encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_timing)
@@ -5,8 +5,20 @@ Pytest configuration and fixtures
 import pytest
 from fastapi.testclient import TestClient
 
+import main
+from benchmarks.fakes import FakeAirtableClient, FakeGeminiModel, LatencyProfile
+from config import get_settings
 from example_main import app
 from models.schemas import LeadSource
+from services.dedupe import DuplicateIndex
+from services.qualification_cache import QualificationCache
+from utils.minhash import MinHashIndex
+
+
+@pytest.fixture(autouse=True)
+def in_memory_lead_mirror(monkeypatch):
+    """Keep Airtable clients built by tests from creating leads_mirror.db"""
+    monkeypatch.setattr(get_settings(), "LEAD_MIRROR_PATH", ":memory:")
 
 
 @pytest.fixture(scope="session")
@@ -21,6 +33,32 @@ def client():
     return TestClient(app)
 
 
+@pytest.fixture
+def fake_model(monkeypatch):
+    """Fake Gemini model behind main's agent, with an empty cache"""
+    model = FakeGeminiModel(LatencyProfile())
+    monkeypatch.setattr(main.agent, "model", model)
+    monkeypatch.setattr(main.agent, "cache", QualificationCache(db_path=""))
+    monkeypatch.setattr(main.agent, "near_duplicates", MinHashIndex())
+    return model
+
+
+@pytest.fixture
+def fake_airtable(monkeypatch):
+    """Fake Airtable client behind main's writes, with an empty dedupe index"""
+    airtable = FakeAirtableClient(LatencyProfile())
+    monkeypatch.setattr(main.lead_writer, "client", airtable)
+    monkeypatch.setattr(main, "airtable", airtable)
+    monkeypatch.setattr(main, "dedupe", DuplicateIndex(window_hours=1))
+    return airtable
+
+
+@pytest.fixture
+def app_client(fake_model, fake_airtable):
+    """Test client for main app with fake Gemini and Airtable"""
+    return TestClient(main.app)
+
+
 @pytest.fixture
 def sample_lead():
     """Sample lead data for testing"""
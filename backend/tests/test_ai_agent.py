@@ -2,16 +2,23 @@
 Tests for AI Agent
 """
 
+import asyncio
+import json
+from types import SimpleNamespace
+
 import pytest
+import pytest_asyncio
 
 from models.schemas import LeadInput, LeadPriority, LeadSource
 from services.ai_agent import LeadQualificationAgent
 
 
-@pytest.fixture
-def agent():
-    """Create AI agent instance"""
-    return LeadQualificationAgent()
+@pytest_asyncio.fixture
+async def agent():
+    """Create AI agent instance, stopping its scheduler afterwards"""
+    agent = LeadQualificationAgent()
+    yield agent
+    await agent.scheduler.stop()
 
 
 @pytest.mark.asyncio
@@ -106,3 +113,272 @@ async def test_priority_determination(agent):
     assert agent._determine_priority(85) == LeadPriority.HOT
     assert agent._determine_priority(70) == LeadPriority.WARM
     assert agent._determine_priority(50) == LeadPriority.COLD
+
+
+class SlowFakeModel:
+    """Async stand-in for the Gemini model that tracks concurrency"""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+
+    async def generate_content_async(self, prompt, **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return SimpleNamespace(
+            text=json.dumps(
+                {
+                    "urgency_level": "high",
+                    "buying_intent": "evaluating",
+                    "pain_points": ["slow follow-up"],
+                    "recommended_action": "Call today",
+                }
+            )
+        )
+
+
+@pytest.mark.asyncio
+async def test_qualify_leads_concurrently(agent):
+    """Test Gemini calls run in parallel and respect the concurrency cap"""
+    agent.model = SlowFakeModel()
+    agent._semaphore = asyncio.Semaphore(3)
+    leads = [
+        LeadInput(
+            name=f"Lead {i}",
+            email=f"lead{i}@example.com",
+            message="We need a CRM for our sales team soon.",
+        )
+        for i in range(6)
+    ]
+
+    results = await asyncio.gather(*(agent.qualify_lead(lead) for lead in leads))
+
+    assert len(results) == 6
+    assert all(r["analysis"].recommended_action == "Call today" for r in results)
+    assert agent.model.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_packed_qualification_falls_back_for_malformed_entry(agent):
+    """Test packed replies are split per lead and bad entries retried alone"""
+    packed_reply = [
+        {"lead_index": 0, "urgency_level": "high", "recommended_action": "Call"},
+        {"lead_index": 1, "urgency_level": "low"},  # missing recommended_action
+        {"lead_index": 2, "buying_intent": "evaluating", "recommended_action": "Demo"},
+    ]
+    prompts = []
+
+    class PackedFakeModel:
+        async def generate_content_async(self, prompt, **kwargs):
+            prompts.append(prompt)
+            if len(prompts) == 1:
+                return SimpleNamespace(text=json.dumps(packed_reply))
+            return SimpleNamespace(
+                text=json.dumps({"recommended_action": "Retried alone"})
+            )
+
+    agent.model = PackedFakeModel()
+    leads = [
+        LeadInput(
+            name=f"Lead {i}",
+            email=f"lead{i}@example.com",
+            message="We need a CRM for our sales team soon.",
+        )
+        for i in range(3)
+    ]
+
+    results = await agent._qualify_pack(leads)
+
+    assert len(prompts) == 2
+    assert "JSON array" in prompts[0]
+    assert [r["analysis"].recommended_action for r in results] == [
+        "Call",
+        "Retried alone",
+        "Demo",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_repeat_lead_served_from_cache(agent):
+    """Test resubmitting the same lead does not call Gemini again"""
+    agent.model = SlowFakeModel(delay=0)
+    lead = LeadInput(
+        name="Repeat Lead",
+        email="repeat@example.com",
+        message="We need a CRM for our sales team soon.",
+    )
+
+    first = await agent.qualify_lead(lead)
+    second = await agent.qualify_lead(lead)
+
+    assert second["score"] == first["score"]
+    assert agent.model.calls == 1
+    assert agent.cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stream_lead_emits_fields_then_result(agent):
+    """Test streamed qualification reports fields before the final score"""
+    reply = json.dumps(
+        {
+            "industry": "Retail",
+            "urgency_level": "high",
+            "buying_intent": "ready_to_buy",
+            "recommended_action": "Call today",
+        }
+    )
+
+    class StreamingFakeModel:
+        async def generate_content_async(self, prompt, stream=False, **kwargs):
+            async def chunks():
+                for i in range(0, len(reply), 10):
+                    yield SimpleNamespace(text=reply[i : i + 10])
+
+            return chunks()
+
+    agent.model = StreamingFakeModel()
+    lead = LeadInput(
+        name="Streamed Lead",
+        email="stream@example.com",
+        message="We need a CRM for our stores right away.",
+    )
+
+    events = [event async for event in agent.stream_lead(lead)]
+
+    assert [kind for kind, _ in events] == ["field"] * 4 + ["result"]
+    assert events[0][1] == ("industry", "Retail")
+    assert events[-1][1]["score"] == 70.0
+
+
+@pytest.mark.asyncio
+async def test_confident_heuristic_skips_gemini(agent):
+    """Test an obvious browsing lead is scored locally"""
+    agent.model = SlowFakeModel(delay=0)
+    lead = LeadInput(
+        name="Browsing Lead",
+        email="browse@example.com",
+        message="Just browsing, no rush at all.",
+    )
+
+    result = await agent.qualify_lead(lead)
+
+    assert result["scoring_path"] == "heuristic"
+    assert result["priority"] == LeadPriority.COLD
+    assert agent.model.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_ambiguous_lead_goes_to_gemini(agent):
+    """Test leads the heuristics cannot decide are sent to Gemini"""
+    agent.model = SlowFakeModel(delay=0)
+    lead = LeadInput(
+        name="Ambiguous Lead",
+        email="ambiguous@example.com",
+        message="We need a CRM for our sales team soon.",
+    )
+
+    result = await agent.qualify_lead(lead)
+
+    assert result["scoring_path"] == "llm"
+    assert agent.model.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_near_duplicate_message_reuses_analysis(agent):
+    """Test an almost identical message from another lead skips Gemini"""
+    agent.model = SlowFakeModel(delay=0)
+    message = (
+        "Hello, we are a growing agency looking at CRM tools for our account "
+        "managers and want to understand what your platform offers {}."
+    )
+
+    first = await agent.qualify_lead(
+        LeadInput(name="First", email="a@one.com", message=message.format("today"))
+    )
+    second = await agent.qualify_lead(
+        LeadInput(name="Second", email="b@two.com", message=message.format("now"))
+    )
+
+    assert first["scoring_path"] == "llm"
+    assert second["scoring_path"] == "near_duplicate"
+    assert second["score"] == first["score"]
+    assert agent.model.calls == 1
+
+
+class FailingModel:
+    """Gemini stand-in whose calls always fail"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_content_async(self, prompt, **kwargs):
+        self.calls += 1
+        raise ConnectionError("Gemini unavailable")
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast_to_heuristics(agent):
+    """Test leads skip Gemini and get a heuristic score once the circuit opens"""
+    agent.model = FailingModel()
+    agent.breaker.min_calls = 3
+    leads = [
+        LeadInput(
+            name=f"Lead {i}",
+            email=f"lead{i}@example.com",
+            message=f"We need a CRM for our sales team soon, ticket {i}.",
+        )
+        for i in range(6)
+    ]
+
+    results = [await agent.qualify_lead(lead) for lead in leads]
+
+    assert [r["scoring_path"] for r in results] == ["fallback"] * 3 + [
+        "circuit_open"
+    ] * 3
+    assert agent.model.calls == 3
+    assert agent.breaker.state == "open"
+
+
+@pytest.mark.asyncio
+async def test_structured_reply_is_validated_and_repaired_once(agent):
+    """Test JSON mode is requested and a malformed reply gets one repair"""
+    replies = [
+        '{"urgency_level": "high"}',
+        json.dumps(
+            {
+                "industry": "Retail",
+                "company_size": "Small",
+                "budget_signals": [],
+                "pain_points": ["stock-outs"],
+                "urgency_level": "high",
+                "buying_intent": "evaluating",
+                "recommended_action": "Book a demo",
+            }
+        ),
+    ]
+    configs = []
+
+    class ScriptedModel:
+        async def generate_content_async(self, prompt, generation_config=None, **_):
+            configs.append(generation_config)
+            return SimpleNamespace(text=replies[len(configs) - 1])
+
+    agent.model = ScriptedModel()
+    result = await agent.qualify_lead(
+        LeadInput(
+            name="Structured Lead",
+            email="structured@example.com",
+            message="We need a CRM for our sales team soon.",
+        )
+    )
+
+    assert len(configs) == 2
+    assert configs[0]["response_mime_type"] == "application/json"
+    assert "recommended_action" in configs[0]["response_schema"]["required"]
+    assert result["scoring_path"] == "llm"
+    assert result["analysis"].recommended_action == "Book a demo"
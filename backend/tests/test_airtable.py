@@ -6,6 +6,7 @@ Tests for Airtable integration
 
 import pytest
 
+from config import get_settings
 from services.airtable_client import AirtableClient
 
 
@@ -46,6 +47,17 @@ def test_airtable_client_initialization(airtable_client):
     assert airtable_client.table is not None
 
 
+def test_missing_credentials_fail_on_first_use(monkeypatch):
+    """Test the client builds without credentials and fails when used"""
+    monkeypatch.setattr(get_settings(), "AIRTABLE_API_KEY", "")
+
+    client = AirtableClient()
+
+    assert client.configured is False
+    with pytest.raises(RuntimeError):
+        client.probe()
+
+
 @pytest.mark.skip(reason="Requires actual Airtable credentials")
 def test_create_lead(airtable_client, sample_lead_data):
     """Test creating a lead in Airtable"""
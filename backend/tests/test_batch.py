@@ -0,0 +1,51 @@
+"""
+Tests for the batch qualification endpoint
+"""
+
+import main
+
+
+def _lead(i: int) -> dict:
+    return {
+        "name": f"Lead {i}",
+        "email": f"lead{i}@example.com",
+        "message": "We need a CRM for our sales team this quarter.",
+    }
+
+
+def test_batch_returns_results_in_order(app_client, fake_airtable, fake_model):
+    """Test batch results keep input order and work is grouped"""
+    response = app_client.post("/leads/batch", json=[_lead(i) for i in range(12)])
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["total"] == 12
+    assert data["succeeded"] == 12
+    assert [fake_airtable.created[r["lead_id"]]["name"] for r in data["results"]] == [
+        f"Lead {i}" for i in range(12)
+    ]
+    assert fake_airtable.batches < 12
+    # 12 leads packed 5 per prompt
+    assert fake_model.calls == 3
+
+
+def test_batch_reports_per_lead_errors(app_client, monkeypatch):
+    """Test one failing lead does not fail the whole batch"""
+
+    async def failing_save(lead, result, start_time, **kwargs):
+        if "FAIL" in lead.message:
+            raise RuntimeError("boom")
+        return await original_save(lead, result, start_time, **kwargs)
+
+    original_save = main._save_lead
+    monkeypatch.setattr(main, "_save_lead", failing_save)
+
+    leads = [_lead(0), {**_lead(1), "message": "FAIL this lead please"}, _lead(2)]
+    response = app_client.post("/leads/batch", json=leads)
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["success"] is False
+    assert data["failed"] == 1
+    assert [r["success"] for r in data["results"]] == [True, False, True]
+    assert "boom" in data["results"][1]["error"]
@@ -0,0 +1,52 @@
+"""
+Smoke tests for the load-testing benchmark suite
+"""
+
+from typing import Any, cast
+
+import httpx
+import pytest
+
+import main
+from benchmarks.load_test import percentile, run_level
+from services.scheduler import QualificationScheduler
+
+
+def test_percentile_uses_nearest_rank():
+    """Test percentiles pick an observed sample"""
+    samples = [float(i) for i in range(1, 101)]
+
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 95) == 95.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([], 99) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_run_level_against_app(monkeypatch, fake_model, fake_airtable):
+    """Test the driver measures POST /leads against fake backends"""
+    monkeypatch.setattr(main.agent, "scheduler", QualificationScheduler())
+    monkeypatch.setattr(main.lead_writer, "flush_interval", 0.01)
+    # Every lead takes the Gemini path, as in a cold benchmark run
+    monkeypatch.setattr(main.settings, "HEURISTIC_ENABLED", False)
+    monkeypatch.setattr(main.settings, "NEAR_DUPLICATE_ENABLED", False)
+
+    transport = httpx.ASGITransport(app=cast(Any, main.app))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        result = await run_level(client, "leads", concurrency=2, total=4)
+        response = await client.post(
+            "/leads",
+            json={
+                "name": "Single Lead",
+                "email": "single@example.com",
+                "message": "Comparing CRM options for our sales team.",
+            },
+        )
+
+    assert response.json()["scoring_path"] == "llm"
+    assert fake_model.calls == 5
+    assert result["requests"] == 4
+    assert result["errors"] == 0
+    assert result["rps"] > 0
+    assert result["p50_ms"] <= result["p99_ms"]
+    assert len(fake_airtable.created) == 5
@@ -0,0 +1,117 @@
+"""
+Tests for the circuit breaker
+"""
+
+import pytest
+
+from services.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_breaker(clock, **overrides):
+    options = {
+        "failure_rate": 0.5,
+        "min_calls": 4,
+        "window": 10,
+        "slow_call_seconds": 5.0,
+        "open_seconds": 30.0,
+        "half_open_probes": 2,
+        "enabled": True,
+    }
+    options.update(overrides)
+    return CircuitBreaker("test", clock=clock, **options)
+
+
+def succeed(breaker, duration=0.0):
+    with breaker.call():
+        breaker._clock.now += duration
+
+
+def fail(breaker):
+    with pytest.raises(ConnectionError):
+        with breaker.call():
+            raise ConnectionError("down")
+
+
+def test_opens_at_failure_rate_after_min_calls():
+    """Test the circuit stays closed until enough calls have failed"""
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+
+    fail(breaker)
+    fail(breaker)
+    succeed(breaker)
+    assert breaker.state == "closed"
+
+    fail(breaker)
+
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        with breaker.call():
+            pass
+
+
+def test_slow_calls_count_as_failures():
+    """Test calls over the latency limit open the circuit"""
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+
+    for _ in range(4):
+        succeed(breaker, duration=6.0)
+
+    assert breaker.state == "open"
+
+
+def test_half_open_probes_close_circuit_on_success():
+    """Test a limited number of probes test recovery after the cool-down"""
+    clock = FakeClock()
+    breaker = make_breaker(clock, min_calls=1)
+    fail(breaker)
+    assert not breaker.available()
+
+    clock.now += 30
+    assert breaker.state == "half_open"
+
+    with breaker.call():
+        with breaker.call():
+            # Both probe slots are taken
+            with pytest.raises(CircuitOpenError):
+                with breaker.call():
+                    pass
+
+    assert breaker.state == "closed"
+
+
+def test_failed_probe_reopens_circuit():
+    """Test a failing probe starts a new cool-down"""
+    clock = FakeClock()
+    breaker = make_breaker(clock, min_calls=1)
+    fail(breaker)
+    clock.now += 30
+
+    fail(breaker)
+
+    assert breaker.state == "open"
+    clock.now += 29
+    assert breaker.state == "open"
+    clock.now += 1
+    assert breaker.state == "half_open"
+
+
+def test_disabled_breaker_never_opens():
+    """Test CIRCUIT_ENABLED=False lets every call through"""
+    breaker = make_breaker(FakeClock(), min_calls=1, enabled=False)
+
+    for _ in range(5):
+        fail(breaker)
+
+    assert breaker.available()
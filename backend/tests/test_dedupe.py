@@ -0,0 +1,86 @@
+"""
+Tests for the duplicate-lead index
+"""
+
+import time
+
+from models.schemas import LeadInput
+from services.dedupe import DuplicateIndex
+
+RESULT = {"score": 70.0}
+
+
+def _lead(**overrides) -> LeadInput:
+    data = {
+        "name": "Repeat Lead",
+        "email": "Repeat@BigCorp.com",
+        "message": "We need a CRM for our sales team soon.",
+    }
+    data.update(overrides)
+    return LeadInput.model_validate(data)
+
+
+def test_repeat_email_is_found():
+    """Test a resubmission with the same email matches, case-insensitively"""
+    index = DuplicateIndex(window_hours=1)
+    index.remember(_lead(), "rec1", RESULT)
+
+    entry = index.find(_lead(email="repeat@bigcorp.com"))
+
+    assert entry is not None
+    assert entry.record_id == "rec1"
+    assert index.stats()["duplicates"] == 1
+
+
+def test_colleague_at_same_company_is_a_new_lead():
+    """Test another address at the same company creates a new record"""
+    index = DuplicateIndex(window_hours=1)
+    index.remember(_lead(), "rec1", RESULT)
+
+    assert index.find(_lead(email="colleague@bigcorp.com")) is None
+
+
+def test_material_message_change_is_not_a_duplicate():
+    """Test a substantially different message is re-qualified"""
+    index = DuplicateIndex(window_hours=1)
+    index.remember(_lead(), "rec1", RESULT)
+
+    assert index.find(_lead(message="We need a CRM for our sales team soon!"))
+    assert index.find(_lead(message="Actually we want a quote for 500 seats.")) is None
+
+
+def test_entries_expire_after_window():
+    """Test leads outside the dedupe window are not matched"""
+    index = DuplicateIndex(window_hours=1)
+    index.remember(_lead(), "rec1", RESULT)
+    for entry in index._entries.values():
+        entry.seen_at = time.monotonic() - 7200
+
+    assert index.find(_lead()) is None
+    assert index.stats()["entries"] == 0
+
+
+def test_repeat_submission_updates_existing_record(
+    app_client, fake_airtable, fake_model
+):
+    """Test a repeat submission attaches to the first record"""
+    lead = {
+        "name": "Repeat Lead",
+        "email": "repeat@bigcorp.com",
+        "message": "We need a CRM for our sales team soon.",
+    }
+
+    first = app_client.post("/leads", json=lead).json()
+    second = app_client.post("/leads", json={**lead, "phone": "+1234567890"}).json()
+
+    assert fake_model.calls == 1
+    assert len(fake_airtable.created) == 1
+    assert second["lead_id"] == first["lead_id"]
+    assert second["scoring_path"] == "duplicate"
+    assert second["qualified_lead"]["score"] == first["qualified_lead"]["score"]
+    assert fake_airtable.updates == [
+        (
+            first["lead_id"],
+            {"Message": lead["message"], "Phone": "+1234567890"},
+        )
+    ]
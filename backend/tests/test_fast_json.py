@@ -0,0 +1,42 @@
+"""
+Tests for the opt-in orjson backend
+"""
+
+import json
+
+import pytest
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from utils import fast_json
+
+
+@pytest.fixture(params=[False, True], ids=["json", "orjson"])
+def backend(request, monkeypatch):
+    """Run a test against both JSON backends"""
+    monkeypatch.setattr(fast_json, "ENABLED", request.param)
+    return request.param
+
+
+def test_round_trip_matches_stdlib(backend):
+    """Test both backends produce equivalent JSON"""
+    data = {"pain_points": ["Manual follow-ups", "Lost deals"], "score": 87.5}
+
+    encoded = fast_json.dumps(data)
+
+    assert isinstance(encoded, str)
+    assert json.loads(encoded) == data
+    assert fast_json.loads(encoded) == data
+    assert fast_json.loads(encoded.encode("utf-8")) == data
+
+
+def test_invalid_json_raises_stdlib_error(backend):
+    """Test callers can keep catching json.JSONDecodeError"""
+    with pytest.raises(json.JSONDecodeError):
+        fast_json.loads("not json")
+
+
+def test_response_class_follows_backend(backend):
+    """Test FastAPI responses use ORJSONResponse only when enabled"""
+    expected = ORJSONResponse if backend else JSONResponse
+
+    assert fast_json.response_class() is expected
@@ -0,0 +1,42 @@
+"""
+Tests for Gemini response schemas
+"""
+
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from models.schemas import AIAnalysis
+from utils.gemini_schema import response_schema
+
+
+def test_analysis_schema_requires_every_field():
+    """Test the AIAnalysis schema lists all fields with Gemini types"""
+    schema = response_schema(AIAnalysis)
+
+    assert schema["type"] == "object"
+    assert set(schema["required"]) == set(AIAnalysis.model_fields)
+    assert schema["properties"]["industry"] == {"type": "string", "nullable": True}
+    assert schema["properties"]["pain_points"] == {
+        "type": "array",
+        "items": {"type": "string"},
+    }
+
+
+def test_nested_models_are_inlined():
+    """Test referenced models are inlined instead of left as $ref"""
+
+    class Contact(BaseModel):
+        email: str
+
+    class Account(BaseModel):
+        contacts: List[Contact]
+        owner: Optional[Contact] = None
+
+    schema = response_schema(Account)
+
+    assert schema["properties"]["contacts"]["items"]["properties"] == {
+        "email": {"type": "string"}
+    }
+    assert schema["properties"]["owner"]["nullable"] is True
+    assert "$ref" not in str(schema)
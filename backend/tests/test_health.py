@@ -0,0 +1,195 @@
+"""
+Tests for background dependency probes and /health
+"""
+
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from services.health import HealthProber, ProbeState
+
+
+def _ok():
+    pass
+
+
+def _fail():
+    raise ConnectionError("connection refused")
+
+
+def _slow():
+    time.sleep(0.2)
+
+
+@pytest.fixture
+def health_client(monkeypatch):
+    """Client for the real app with a prober built from given probes"""
+
+    def make(probes):
+        prober = HealthProber(probes, timeout=0.5)
+        monkeypatch.setitem(vars(main), "health", prober)
+        return prober, TestClient(main.app)
+
+    return make
+
+
+def test_probe_state_error_rate_over_window():
+    """Test the error rate only counts results inside the window"""
+    state = ProbeState(window=4)
+    for ok in (False, False, True, True):
+        state.record(ok, 10.0)
+    assert state.error_rate == 0.5
+
+    state.record(True, 10.0)
+    state.record(True, 10.0)
+
+    assert state.error_rate == 0.0
+
+
+def test_probe_state_reports_staleness():
+    """Test an old result is reported stale"""
+    state = ProbeState(window=4)
+    assert state.snapshot(60, 1000)["status"] == "unknown"
+
+    state.record(True, 12.34)
+    fresh = state.snapshot(60, 1000)
+    assert fresh["status"] == "up"
+    assert fresh["last_latency_ms"] == 12.3
+
+    state._checked_at = time.monotonic() - 120
+    stale = state.snapshot(60, 1000)
+    assert stale["status"] == "stale"
+    assert stale["staleness_seconds"] >= 120
+
+
+def test_explicit_zero_overrides_settings():
+    """Test a 0 argument is used rather than replaced by the setting"""
+    prober = HealthProber({"ok": _ok}, interval=0, slow_after_ms=0)
+
+    assert prober.interval == 0
+    assert prober.slow_after_ms == 0
+
+
+@pytest.mark.asyncio
+async def test_probe_all_records_failures_and_timeouts():
+    """Test failing and hanging probes are recorded as down"""
+    prober = HealthProber(
+        {"ok": _ok, "broken": _fail, "hung": _slow}, timeout=0.05, slow_after_ms=1000
+    )
+
+    await prober.probe_all()
+    snapshot = prober.snapshot()
+
+    assert snapshot["status"] == "degraded"
+    deps = snapshot["dependencies"]
+    assert deps["ok"]["status"] == "up"
+    assert deps["broken"]["status"] == "down"
+    assert deps["broken"]["last_error"] == "connection refused"
+    assert deps["broken"]["error_rate"] == 1.0
+    assert deps["hung"]["status"] == "down"
+    assert "Timed out" in deps["hung"]["last_error"]
+
+
+@pytest.mark.asyncio
+async def test_hung_probe_is_not_started_again():
+    """Test a probe still running past its timeout is not run concurrently"""
+    calls = []
+
+    def hung():
+        calls.append(time.monotonic())
+        time.sleep(0.2)
+
+    prober = HealthProber({"hung": hung}, timeout=0.05)
+
+    await prober.probe_all()
+    await prober.probe_all()
+
+    assert len(calls) == 1
+    state = prober.snapshot()["dependencies"]["hung"]
+    assert state["status"] == "down"
+    assert state["last_error"] == "Previous probe still running"
+
+
+@pytest.mark.asyncio
+async def test_slow_dependency_degrades_health():
+    """Test a reachable but slow dependency reports degraded"""
+    prober = HealthProber({"ok": _ok, "slow": _slow}, slow_after_ms=100)
+
+    await prober.probe_all()
+
+    assert prober.snapshot()["status"] == "degraded"
+    assert prober.snapshot()["dependencies"]["slow"]["status"] == "slow"
+
+
+def test_health_serves_cached_results_without_probing(health_client):
+    """Test /health reads the cache and never runs a probe"""
+    calls = []
+    prober, client = health_client({"gemini": lambda: calls.append(1), "airtable": _ok})
+    prober.states["gemini"].record(True, 120.0)
+    prober.states["airtable"].record(True, 80.0)
+
+    for _ in range(5):
+        response = client.get("/health")
+
+    assert calls == []
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "healthy"
+    assert data["services"]["gemini_api"] == "up"
+    assert data["dependencies"]["airtable"]["last_latency_ms"] == 80.0
+    assert data["dependencies"]["airtable"]["staleness_seconds"] is not None
+
+
+def test_health_before_first_probe_is_degraded(health_client):
+    """Test unknown dependencies are reported, not assumed connected"""
+    _, client = health_client({"gemini": _ok, "airtable": _ok})
+
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "degraded"
+    assert response.json()["services"]["airtable"] == "unknown"
+
+
+def test_health_stays_up_when_dependency_down(health_client):
+    """Test a down dependency degrades /health without failing the container"""
+    prober, client = health_client({"gemini": _ok, "airtable": _fail})
+    prober.states["gemini"].record(True, 100.0)
+    prober.states["airtable"].record(False, 5.0, "connection refused")
+
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "degraded"
+    assert data["dependencies"]["airtable"]["last_error"] == "connection refused"
+
+
+def test_health_returns_503_when_configured_for_dependencies(health_client):
+    """Test HEALTH_FAIL_ON_DEPENDENCY_DOWN makes a down dependency fail /health"""
+    prober, client = health_client({"gemini": _ok, "airtable": _fail})
+    prober.fail_on_dependency_down = True
+    prober.states["gemini"].record(True, 100.0)
+    prober.states["airtable"].record(False, 5.0, "connection refused")
+
+    response = client.get("/health")
+
+    assert response.status_code == 503
+    assert response.json()["status"] == "unhealthy"
+
+
+@pytest.mark.asyncio
+async def test_dead_probe_loop_is_unhealthy(monkeypatch):
+    """Test the worker reports unhealthy once its probe loop has died"""
+    prober = HealthProber({"ok": _ok})
+
+    async def crash():
+        raise RuntimeError("probe loop crashed")
+
+    monkeypatch.setattr(prober, "probe_all", crash)
+    with pytest.raises(RuntimeError):
+        await prober.run()
+
+    assert prober.snapshot()["status"] == "unhealthy"
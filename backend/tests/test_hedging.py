@@ -0,0 +1,103 @@
+"""
+Tests for hedged Gemini requests and call deadlines
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from models.schemas import LeadInput
+from services import ai_agent
+from services.ai_agent import LeadQualificationAgent
+from services.hedging import HedgePolicy, hedged
+
+
+def make_policy(**overrides):
+    options = {"enabled": True, "percentile": 95, "budget": 1.0, "min_samples": 5}
+    options.update(overrides)
+    policy = HedgePolicy(**options)
+    for _ in range(5):
+        policy.record(0.01)
+    return policy
+
+
+class ScriptedCalls:
+    """Requests whose latencies are taken from a script"""
+
+    def __init__(self, *delays):
+        self.delays = list(delays)
+        self.started = 0
+
+    async def __call__(self):
+        delay = self.delays[self.started]
+        self.started += 1
+        await asyncio.sleep(delay)
+        return f"reply after {delay}"
+
+
+@pytest.mark.asyncio
+async def test_slow_call_is_hedged_and_backup_wins():
+    """Test a call past the observed p95 gets a backup whose reply is used"""
+    calls = ScriptedCalls(5.0, 0.01)
+
+    result = await asyncio.wait_for(
+        hedged(calls, make_policy(), lambda: True), timeout=1
+    )
+
+    assert result == "reply after 0.01"
+    assert calls.started == 2
+
+
+@pytest.mark.asyncio
+async def test_fast_call_is_not_hedged():
+    """Test calls that finish within the hedge delay send one request"""
+    calls = ScriptedCalls(0.0)
+
+    assert await hedged(calls, make_policy(), lambda: True) == "reply after 0.0"
+    assert calls.started == 1
+
+
+@pytest.mark.asyncio
+async def test_hedges_stay_within_budget_and_quota():
+    """Test no backup is sent without budget credit or spare quota"""
+    no_budget = ScriptedCalls(0.1, 0.0)
+    await hedged(no_budget, make_policy(budget=0.0), lambda: True)
+
+    no_quota = ScriptedCalls(0.1, 0.0)
+    await hedged(no_quota, make_policy(), lambda: False)
+
+    assert no_budget.started == 1
+    assert no_quota.started == 1
+
+
+@pytest.mark.asyncio
+async def test_no_hedging_before_enough_samples():
+    """Test the hedge delay needs a latency history first"""
+    policy = HedgePolicy(enabled=True, budget=1.0, min_samples=50)
+    policy.record(0.01)
+
+    assert policy.delay() is None
+
+
+@pytest.mark.asyncio
+async def test_stuck_gemini_call_hits_deadline(monkeypatch):
+    """Test a call past GEMINI_TIMEOUT_SECONDS falls back instead of hanging"""
+
+    class StuckModel:
+        async def generate_content_async(self, prompt, **kwargs):
+            await asyncio.sleep(60)
+            return SimpleNamespace(text="{}")
+
+    monkeypatch.setattr(ai_agent.settings, "GEMINI_TIMEOUT_SECONDS", 0.05)
+    agent = LeadQualificationAgent()
+    agent.model = StuckModel()
+    lead = LeadInput(
+        name="Stuck Lead",
+        email="stuck@example.com",
+        message="We need a CRM for our sales team soon.",
+    )
+
+    result = await asyncio.wait_for(agent.qualify_lead(lead), timeout=2)
+
+    assert result["scoring_path"] == "fallback"
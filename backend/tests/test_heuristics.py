@@ -0,0 +1,73 @@
+"""
+Tests for the heuristic pre-scorer
+"""
+
+from config import get_settings
+from models.schemas import LeadInput
+from services.heuristics import HeuristicScorer
+
+settings = get_settings()
+
+
+def _lead(message: str) -> LeadInput:
+    return LeadInput(name="Test Lead", email="lead@example.com", message=message)
+
+
+def test_browsing_lead_is_confident_and_low():
+    """Test explicit browsing language is detected with high confidence"""
+    result = HeuristicScorer().analyze(
+        _lead("Just curious about your product. No rush.")
+    )
+
+    assert result.analysis["buying_intent"] == "just_browsing"
+    assert result.analysis["urgency_level"] == "low"
+    assert result.analysis["budget_signals"] == []
+    assert result.confidence == 1.0
+
+
+def test_high_intent_lead_extracts_signals():
+    """Test urgency, budget amounts, team size and pain are extracted"""
+    result = HeuristicScorer().analyze(
+        _lead(
+            "We urgently need a CRM solution for our 200-person sales team. "
+            "We have budget approved for $100k and need to implement ASAP. "
+            "Our current system is failing and costing us deals."
+        )
+    )
+
+    assert result.analysis["urgency_level"] == "high"
+    assert result.analysis["buying_intent"] == "ready_to_buy"
+    assert result.analysis["company_size"] == "Medium"
+    assert "$100k" in result.analysis["budget_signals"]
+    assert len(result.analysis["budget_signals"]) == 3
+    assert result.analysis["pain_points"] == ["failing", "costing us"]
+    assert result.confidence == 1.0
+
+
+def test_ambiguous_lead_has_low_confidence():
+    """Test a vague message is not trusted by the pre-scorer"""
+    result = HeuristicScorer().analyze(_lead("Tell me more about what you offer."))
+
+    assert result.analysis["buying_intent"] == "exploring"
+    assert result.analysis["urgency_level"] == "medium"
+    assert result.confidence == 0.0
+
+
+def test_negated_signals_do_not_read_as_hot():
+    """Test negated urgency, intent and budget are scored as low"""
+    result = HeuristicScorer().analyze(
+        _lead("Not urgent. We're not ready to buy, budget is not approved, $0 spend.")
+    )
+
+    assert result.analysis["urgency_level"] == "low"
+    assert result.analysis["buying_intent"] == "just_browsing"
+    assert result.analysis["budget_signals"] == []
+
+
+def test_conflicting_signals_lower_confidence():
+    """Test a lead with both high and low signals is left to Gemini"""
+    result = HeuristicScorer().analyze(
+        _lead("No rush on our side, but the CEO wants it ASAP. Budget approved.")
+    )
+
+    assert result.confidence < settings.HEURISTIC_MIN_CONFIDENCE
@@ -0,0 +1,138 @@
+"""
+Tests for the bulk lead importer
+"""
+
+import io
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+import pytest
+
+import import_leads
+from import_leads import Checkpoint, LeadImporter, iter_rows
+from models.schemas import AIAnalysis, LeadPriority
+
+SAMPLE_LEADS = Path(__file__).resolve().parents[2] / "demo" / "sample_leads.json"
+
+
+def _row(i: int) -> dict:
+    return {
+        "name": f"Lead {i}",
+        "email": f"lead{i}@example.com",
+        "message": "We need a CRM for our sales team this quarter.",
+    }
+
+
+def test_json_array_is_streamed_in_small_reads(monkeypatch):
+    """Test array elements are decoded across read boundaries"""
+    monkeypatch.setattr(import_leads, "READ_SIZE", 7)
+    text = SAMPLE_LEADS.read_text(encoding="utf-8")
+
+    rows = list(iter_rows(io.StringIO(text), "json"))
+
+    assert rows == json.loads(text)
+
+
+def test_csv_and_ndjson_rows():
+    """Test CSV empty cells are dropped and blank NDJSON lines skipped"""
+    csv_text = "name,email,phone,message\nAna,ana@example.com,,Hello there team\n"
+    ndjson_text = (
+        json.dumps(_row(1)) + "\n\n" + '{"name": "broken\n' + json.dumps(_row(2)) + "\n"
+    )
+
+    csv_rows = list(iter_rows(io.StringIO(csv_text), "csv"))
+    ndjson_rows = list(iter_rows(io.StringIO(ndjson_text), "ndjson"))
+
+    assert csv_rows == [
+        {"name": "Ana", "email": "ana@example.com", "message": "Hello there team"}
+    ]
+    assert ndjson_rows == [_row(1), None, _row(2)]
+
+
+class FakeAgent:
+    """Scores every lead the same way without Gemini"""
+
+    async def qualify_leads(self, leads):
+        return [
+            {
+                "score": 70.0,
+                "priority": LeadPriority.WARM,
+                "analysis": AIAnalysis(recommended_action="Call"),
+            }
+            for _ in leads
+        ]
+
+
+class FlakyAirtableClient:
+    """Records batch creates, failing the chosen call"""
+
+    def __init__(self, fail_on_call=None):
+        self.batches = []
+        self.calls = 0
+        self.fail_on_call = fail_on_call
+
+    def create_leads(self, leads):
+        self.calls += 1
+        if self.calls == self.fail_on_call:
+            raise RuntimeError("Airtable unavailable")
+        self.batches.append([lead["name"] for lead in leads])
+        return [f"rec{i}" for i in range(len(leads))]
+
+
+@pytest.mark.asyncio
+async def test_import_skips_invalid_rows_and_resumes(tmp_path):
+    """Test an interrupted import resumes after the last written chunk"""
+    rows = [_row(i) for i in range(5)]
+    rows.insert(2, {"name": "No email", "message": "Missing the email field"})
+    checkpoint_path = str(tmp_path / "leads.checkpoint")
+
+    flaky = FlakyAirtableClient(fail_on_call=2)
+    importer = LeadImporter(
+        FakeAgent(), flaky, Checkpoint(checkpoint_path, "leads.json"), chunk_size=2
+    )
+    with pytest.raises(RuntimeError):
+        await importer.run(iter(rows))
+
+    assert flaky.batches == [["Lead 0", "Lead 1"]]
+
+    airtable = FlakyAirtableClient()
+    checkpoint = Checkpoint(checkpoint_path, "leads.json")
+    assert checkpoint.rows_done == 2
+    await LeadImporter(FakeAgent(), airtable, checkpoint, chunk_size=2).run(iter(rows))
+
+    assert airtable.batches == [["Lead 2"], ["Lead 3", "Lead 4"]]
+    assert checkpoint.imported == 5
+    assert checkpoint.invalid == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_resumes_inside_chunk(tmp_path):
+    """Test batches already written in a failed chunk are not re-created"""
+    rows: List[Optional[Dict]] = [_row(i) for i in range(25)]
+    rows.insert(12, None)
+    checkpoint_path = str(tmp_path / "leads.checkpoint")
+
+    importer = LeadImporter(
+        FakeAgent(),
+        FlakyAirtableClient(fail_on_call=2),
+        Checkpoint(checkpoint_path, "leads.ndjson"),
+        chunk_size=100,
+    )
+    with pytest.raises(RuntimeError):
+        await importer.run(iter(rows))
+
+    checkpoint = Checkpoint(checkpoint_path, "leads.ndjson")
+    assert checkpoint.rows_done == 10
+    assert checkpoint.imported == 10
+
+    airtable = FlakyAirtableClient()
+    await LeadImporter(FakeAgent(), airtable, checkpoint, chunk_size=100).run(
+        iter(rows)
+    )
+
+    assert airtable.batches[0][0] == "Lead 10"
+    assert [len(batch) for batch in airtable.batches] == [10, 5]
+    assert checkpoint.imported == 25
+    assert checkpoint.invalid == 1
@@ -0,0 +1,90 @@
+"""
+Tests for the local leads mirror
+"""
+
+# pylint: disable=redefined-outer-name
+
+import pytest
+
+from services.lead_mirror import LeadMirror
+
+
+def _record(record_id: str, created: str, priority: str, score: float) -> dict:
+    return {
+        "id": record_id,
+        "createdTime": created,
+        "fields": {
+            "Name": record_id,
+            "Email": f"{record_id}@Example.com",
+            "Priority": priority,
+            "Score": score,
+        },
+    }
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    """Create mirror backed by a temporary database"""
+    return LeadMirror(str(tmp_path / "mirror.db"))
+
+
+def test_upsert_and_get(mirror):
+    """Test records round-trip and updates replace earlier versions"""
+    mirror.upsert([_record("rec1", "2024-01-01T00:00:00.000Z", "warm", 70)])
+    mirror.upsert([_record("rec1", "2024-01-01T00:00:00.000Z", "hot", 90)])
+
+    record = mirror.get("rec1")
+    assert record["fields"]["Priority"] == "hot"
+    assert mirror.get("missing") is None
+
+
+def test_list_filters_and_orders_newest_first(mirror):
+    """Test listing by priority, newest first, with a limit"""
+    mirror.upsert(
+        [
+            _record("rec1", "2024-01-01T00:00:00.000Z", "hot", 90),
+            _record("rec2", "2024-01-02T00:00:00.000Z", "cold", 30),
+            _record("rec3", "2024-01-03T00:00:00.000Z", "hot", 85),
+        ]
+    )
+
+    assert [r["id"] for r in mirror.list()] == ["rec3", "rec2", "rec1"]
+    assert [r["id"] for r in mirror.list(priority="HOT")] == ["rec3", "rec1"]
+    assert len(mirror.list(limit=1)) == 1
+
+
+def test_replace_all_and_watermark_persist(tmp_path):
+    """Test a full snapshot replaces contents and sync state survives reopen"""
+    db_path = str(tmp_path / "mirror.db")
+    mirror = LeadMirror(db_path)
+    mirror.upsert([_record("stale", "2024-01-01T00:00:00.000Z", "hot", 90)])
+    mirror.replace_all([_record("rec1", "2024-01-02T00:00:00.000Z", "warm", 65)])
+    mirror.set_watermark("2024-01-02T00:00:00.000Z")
+
+    reopened = LeadMirror(db_path)
+    assert reopened.get("stale") is None
+    assert reopened.get("rec1") is not None
+    assert reopened.get_watermark() == "2024-01-02T00:00:00.000Z"
+
+
+def test_page_walks_cursor_with_filters(mirror):
+    """Test keyset pages cover every match exactly once"""
+    mirror.upsert(
+        [
+            _record(f"rec{i:02d}", f"2024-01-{i + 1:02d}T00:00:00.000Z", "warm", 50 + i)
+            for i in range(10)
+        ]
+    )
+
+    seen, cursor = [], None
+    while True:
+        records, cursor = mirror.page(min_score=52, cursor=cursor, limit=3)
+        seen.extend(r["id"] for r in records)
+        if cursor is None:
+            break
+
+    assert seen == [f"rec{i:02d}" for i in range(9, 1, -1)]
+    assert [len(p) for p in mirror.iter_pages(page_size=4)] == [4, 4, 2]
+
+    with pytest.raises(ValueError):
+        mirror.page(cursor="not-a-cursor")
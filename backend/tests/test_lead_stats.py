@@ -0,0 +1,47 @@
+"""
+Tests for running lead statistics
+"""
+
+from services.lead_stats import LeadStats
+
+
+def test_record_and_update_adjust_aggregates():
+    """Test creates add and updates replace a record's contribution"""
+    stats = LeadStats()
+    stats.record("rec1", {"Priority": "hot", "Score": 90})
+    stats.record("rec2", {"Priority": "cold", "Score": 30})
+
+    snapshot = stats.snapshot()
+    assert snapshot["total"] == 2
+    assert snapshot["hot"] == 1
+    assert snapshot["cold"] == 1
+    assert snapshot["avg_score"] == 60.0
+
+    stats.record("rec2", {"Priority": "warm", "Score": 70})
+
+    snapshot = stats.snapshot()
+    assert snapshot["total"] == 2
+    assert snapshot["cold"] == 0
+    assert snapshot["warm"] == 1
+    assert snapshot["avg_score"] == 80.0
+
+
+def test_reset_rebuilds_from_full_scan():
+    """Test reconciliation replaces drifted aggregates"""
+    stats = LeadStats()
+    stats.record("stale", {"Priority": "hot", "Score": 95})
+
+    stats.reset(
+        [
+            {"id": "rec1", "fields": {"Priority": "Warm", "Score": 65}},
+            {"id": "rec2", "fields": {"Priority": "cold"}},
+        ]
+    )
+
+    snapshot = stats.snapshot()
+    assert snapshot["total"] == 2
+    assert snapshot["hot"] == 0
+    assert snapshot["warm"] == 1
+    assert snapshot["cold"] == 1
+    assert snapshot["avg_score"] == 65.0
+    assert snapshot["reconciled_at"] is not None
@@ -0,0 +1,132 @@
+"""
+Tests for the Airtable write-behind buffer
+"""
+
+# pylint: disable=redefined-outer-name
+
+import asyncio
+
+import pytest
+import requests
+
+from services.lead_writer import LeadWriteBuffer
+
+
+class FakeAirtableClient:
+    """Records batch creates instead of calling Airtable"""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.batches = []
+
+    def create_leads(self, leads):
+        if self.fail:
+            raise RuntimeError("Airtable unavailable")
+        self.batches.append(leads)
+        return [f"rec{lead['name']}" for lead in leads]
+
+
+class RejectingAirtableClient(FakeAirtableClient):
+    """Fails any batch containing the lead named "bad" with an HTTP error"""
+
+    def __init__(self, status: int):
+        super().__init__()
+        self.status = status
+        self.attempts = 0
+
+    def create_leads(self, leads):
+        self.attempts += 1
+        if any(lead["name"] == "bad" for lead in leads):
+            response = requests.Response()
+            response.status_code = self.status
+            raise requests.HTTPError(f"HTTP {self.status}", response=response)
+        return super().create_leads(leads)
+
+
+@pytest.fixture
+def fake_client():
+    """Create fake Airtable client"""
+    return FakeAirtableClient()
+
+
+@pytest.mark.asyncio
+async def test_flush_on_batch_size(fake_client):
+    """Test pending records are grouped into batches of 10"""
+    writer = LeadWriteBuffer(fake_client, batch_size=10, flush_interval=0.1)
+
+    record_ids = await asyncio.gather(
+        *(writer.create_lead({"name": str(i)}) for i in range(25))
+    )
+    await writer.stop()
+
+    assert record_ids == [f"rec{i}" for i in range(25)]
+    assert [len(batch) for batch in fake_client.batches] == [10, 10, 5]
+
+
+@pytest.mark.asyncio
+async def test_flush_on_interval(fake_client):
+    """Test a partial batch is flushed once the interval elapses"""
+    writer = LeadWriteBuffer(fake_client, batch_size=10, flush_interval=0.01)
+
+    futures = [writer.enqueue({"name": str(i)}) for i in range(3)]
+    record_ids = await asyncio.wait_for(asyncio.gather(*futures), timeout=1.0)
+    await writer.stop()
+
+    assert record_ids == ["rec0", "rec1", "rec2"]
+    assert len(fake_client.batches) == 1
+
+
+@pytest.mark.asyncio
+async def test_flush_failure_propagates():
+    """Test callers see the error when a batch cannot be written"""
+    writer = LeadWriteBuffer(FakeAirtableClient(fail=True), flush_interval=0.01)
+
+    with pytest.raises(RuntimeError):
+        await writer.create_lead({"name": "lost"})
+    await writer.stop()
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_only_fails_rejected_records():
+    """Test one invalid record does not fail the rest of its batch"""
+
+    client = RejectingAirtableClient(status=422)
+    writer = LeadWriteBuffer(client, batch_size=10, flush_interval=0.05)
+
+    results = await asyncio.gather(
+        *(writer.create_lead({"name": name}) for name in ("a", "bad", "c")),
+        return_exceptions=True,
+    )
+    await writer.stop()
+
+    assert results[0] == "reca"
+    assert isinstance(results[1], requests.HTTPError)
+    assert results[2] == "recc"
+    assert client.batches == [[{"name": "a"}], [{"name": "c"}]]
+
+
+@pytest.mark.asyncio
+async def test_server_error_fails_batch_without_splitting():
+    """Test a batch failing with 5xx is not retried record by record"""
+    client = RejectingAirtableClient(status=503)
+    writer = LeadWriteBuffer(client, batch_size=10, flush_interval=0.05)
+
+    results = await asyncio.gather(
+        *(writer.create_lead({"name": name}) for name in ("a", "bad", "c")),
+        return_exceptions=True,
+    )
+    await writer.stop()
+
+    assert all(isinstance(result, requests.HTTPError) for result in results)
+    assert client.attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_lone_record_is_not_held_for_the_interval(fake_client):
+    """Test a single pending record is written without waiting to batch"""
+    writer = LeadWriteBuffer(fake_client, batch_size=10, flush_interval=5.0)
+
+    record_id = await asyncio.wait_for(writer.create_lead({"name": "solo"}), 1.0)
+    await writer.stop()
+
+    assert record_id == "recsolo"
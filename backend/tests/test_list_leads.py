@@ -0,0 +1,58 @@
+"""
+Tests for the lead listing endpoint
+"""
+
+# pylint: disable=redefined-outer-name
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from services.lead_mirror import LeadMirror
+
+
+@pytest.fixture
+def list_client(tmp_path, monkeypatch):
+    """Test client for main app reading from a temporary mirror"""
+    mirror = LeadMirror(str(tmp_path / "mirror.db"))
+    mirror.upsert(
+        [
+            {
+                "id": f"rec{i}",
+                "createdTime": f"2024-01-0{i + 1}T00:00:00.000Z",
+                "fields": {"Name": f"Lead {i}", "Priority": "hot", "Score": 80 + i},
+            }
+            for i in range(5)
+        ]
+    )
+    monkeypatch.setattr(main.airtable, "mirror", mirror)
+    return TestClient(main.app)
+
+
+def test_list_leads_paginates(list_client):
+    """Test cursor pages and date filters"""
+    first = list_client.get("/leads", params={"limit": 2}).json()
+    assert [lead["id"] for lead in first["leads"]] == ["rec4", "rec3"]
+
+    second = list_client.get(
+        "/leads", params={"limit": 2, "cursor": first["next_cursor"]}
+    ).json()
+    assert [lead["id"] for lead in second["leads"]] == ["rec2", "rec1"]
+
+    recent = list_client.get(
+        "/leads", params={"created_after": "2024-01-04T00:00:00"}
+    ).json()
+    assert [lead["id"] for lead in recent["leads"]] == ["rec4", "rec3"]
+
+    assert list_client.get("/leads", params={"cursor": "bogus"}).status_code == 400
+
+
+def test_list_leads_streams_ndjson(list_client):
+    """Test streaming mode returns one JSON record per line"""
+    response = list_client.get("/leads", params={"stream": True, "limit": 2})
+
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [record["id"] for record in lines] == [f"rec{i}" for i in range(4, -1, -1)]
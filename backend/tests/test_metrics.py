@@ -0,0 +1,86 @@
+"""
+Tests for pipeline metrics
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from models.schemas import LeadInput
+from services.ai_agent import LeadQualificationAgent
+from services.metrics import (
+    PARSE_FAILURES,
+    PARSE_REPAIRS,
+    STAGE_SECONDS,
+    MetricsRegistry,
+)
+
+
+def test_histogram_renders_cumulative_buckets():
+    """Test histogram exposition has cumulative buckets, sum and count"""
+    registry = MetricsRegistry()
+    histogram = registry.histogram("demo_seconds", "Demo", stage="llm")
+    for value in (0.2, 0.7, 3.0):
+        histogram.observe(value)
+
+    text = registry.render()
+
+    assert "# TYPE demo_seconds histogram" in text
+    assert 'demo_seconds_bucket{stage="llm",le="0.25"} 1' in text
+    assert 'demo_seconds_bucket{stage="llm",le="1.0"} 2' in text
+    assert 'demo_seconds_bucket{stage="llm",le="+Inf"} 3' in text
+    assert 'demo_seconds_count{stage="llm"} 3' in text
+    assert 'demo_seconds_sum{stage="llm"} 3.9' in text
+
+
+def test_labelled_counters_share_one_header():
+    """Test counters with the same name are grouped under one HELP/TYPE"""
+    registry = MetricsRegistry()
+    registry.counter("errors_total", "Errors", operation="create").inc()
+    registry.counter("errors_total", "Errors", operation="update").inc(2)
+
+    text = registry.render()
+
+    assert text.count("# TYPE errors_total counter") == 1
+    assert 'errors_total{operation="create"} 1' in text
+    assert 'errors_total{operation="update"} 2' in text
+
+
+@pytest.mark.asyncio
+async def test_agent_records_stages_and_parse_failures():
+    """Test a Gemini call is timed per stage and bad replies are counted"""
+
+    class BrokenModel:
+        async def generate_content_async(self, prompt, **kwargs):
+            return SimpleNamespace(text="not json")
+
+    agent = LeadQualificationAgent()
+    agent.model = BrokenModel()
+    llm_before = STAGE_SECONDS["llm"]._counts[:]
+    failures_before = PARSE_FAILURES.value
+    repairs_before = PARSE_REPAIRS.value
+
+    await agent.qualify_lead(
+        LeadInput(
+            name="Metrics Lead",
+            email="metrics@example.com",
+            message="We need a CRM for our sales team soon.",
+        )
+    )
+
+    # The bad reply and the one repair attempt
+    assert sum(STAGE_SECONDS["llm"]._counts) == sum(llm_before) + 2
+    assert PARSE_REPAIRS.value == repairs_before + 1
+    assert PARSE_FAILURES.value == failures_before + 1
+
+
+def test_metrics_endpoint_serves_prometheus_text():
+    """Test /metrics exposes stage histograms in text format"""
+    response = TestClient(main.app).get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'lead_stage_duration_seconds_bucket{stage="llm",le="+Inf"}' in response.text
+    assert "lead_fallbacks_total" in response.text
@@ -0,0 +1,52 @@
+"""
+Tests for the MinHash near-duplicate index
+"""
+
+from utils.minhash import MinHashIndex
+
+TEMPLATE = (
+    "Hi, I am reaching out on behalf of our partner network. We help "
+    "companies like yours grow revenue with qualified referrals and would "
+    "love to set up a call with your team next week. Regards, {name}"
+)
+
+
+def test_near_identical_messages_match():
+    """Test templated messages that differ in a few words are matched"""
+    index = MinHashIndex(threshold=0.7)
+    index.add("a", TEMPLATE.format(name="Alice Smith"), {"industry": "Marketing"})
+
+    match = index.query(TEMPLATE.format(name="Bob Jones"))
+
+    assert match is not None
+    payload, similarity = match
+    assert payload == {"industry": "Marketing"}
+    assert similarity >= 0.7
+
+
+def test_unrelated_message_does_not_match():
+    """Test a different message is not treated as a near duplicate"""
+    index = MinHashIndex(threshold=0.7)
+    index.add("a", TEMPLATE.format(name="Alice Smith"), {"industry": "Marketing"})
+
+    assert index.query("We urgently need a CRM for our 50-person sales team.") is None
+
+
+def test_index_is_bounded_and_evicts_oldest():
+    """Test the index never exceeds max_entries"""
+    index = MinHashIndex(max_entries=2)
+    index.add("a", "first message about crm pricing for teams", 1)
+    index.add("b", "second message about marketing automation tools", 2)
+    index.add("c", "third message about helpdesk software options", 3)
+
+    assert len(index) == 2
+    assert index.query("first message about crm pricing for teams") is None
+    match = index.query("third message about helpdesk software options")
+    assert match is not None
+    assert match[0] == 3
+    assert all(
+        key != "a"
+        for bucket in index._buckets
+        for keys in bucket.values()
+        for key in keys
+    )
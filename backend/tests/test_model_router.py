@@ -0,0 +1,87 @@
+"""
+Tests for model tier routing
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from models.schemas import LeadInput, LeadSource
+from services.ai_agent import LeadQualificationAgent
+from services.model_router import ModelRouter, ModelTier
+
+
+def make_lead(message, **fields):
+    return LeadInput(name="Lead", email="lead@example.com", message=message, **fields)
+
+
+def test_short_lead_routes_to_fast_tier():
+    """Test short, low-information messages use the fast model"""
+    assert ModelRouter().route(make_lead("Can you send me pricing info?")) == "fast"
+
+
+def test_valuable_leads_route_to_strong_tier():
+    """Test referrals, long messages and budget signals use the strong model"""
+    router = ModelRouter()
+    long_message = " ".join(["We are reviewing how our team tracks customers."] * 10)
+
+    assert (
+        router.route(make_lead("Can you send pricing?", source=LeadSource.REFERRAL))
+        == "strong"
+    )
+    assert router.route(make_lead(long_message)) == "strong"
+    assert router.route(make_lead("Our budget is $40k for a new CRM.")) == "strong"
+
+
+def test_over_budget_tier_falls_back_to_next_tier():
+    """Test the strong tier hands leads down once its budget is used"""
+    router = ModelRouter(
+        [
+            ModelTier("strong", "models/strong", 0.3, rpm_limit=1),
+            ModelTier("fast", "models/fast", 0.1),
+        ]
+    )
+
+    assert router.select("strong", 100).name == "strong"
+    assert router.select("strong", 100).name == "fast"
+    assert router.select("fast", 100).name == "fast"
+
+
+class TierModel:
+    """Gemini stand-in that records which tier was called"""
+
+    def __init__(self, name, calls):
+        self.name = name
+        self.calls = calls
+
+    async def generate_content_async(self, prompt, **kwargs):
+        self.calls.append(self.name)
+        return SimpleNamespace(
+            text=json.dumps(
+                {
+                    "urgency_level": "medium",
+                    "buying_intent": "evaluating",
+                    "pain_points": ["slow follow-up"],
+                    "recommended_action": "Call this week",
+                }
+            )
+        )
+
+
+@pytest.mark.asyncio
+async def test_agent_reports_model_tier():
+    """Test each lead is answered by its tier's model and reports the tier"""
+    agent = LeadQualificationAgent()
+    calls = []
+    for tier in agent.router.tiers:
+        agent._models[tier.name] = TierModel(tier.name, calls)
+
+    fast = await agent.qualify_lead(make_lead("We need a CRM for our sales team."))
+    strong = await agent.qualify_lead(
+        make_lead("We need a CRM for our agency team.", source=LeadSource.REFERRAL)
+    )
+
+    assert calls == ["fast", "strong"]
+    assert fast["model_tier"] == "fast"
+    assert strong["model_tier"] == "strong"
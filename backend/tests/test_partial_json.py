@@ -0,0 +1,44 @@
+"""
+Tests for incremental JSON field parsing
+"""
+
+import json
+
+from utils.partial_json import IncrementalObjectParser
+
+
+def test_fields_emitted_as_they_complete():
+    """Test each field is reported once, as soon as it is complete"""
+    text = (
+        "```json\n"
+        + json.dumps(
+            {
+                "industry": "Software",
+                "pain_points": ["slow sales", "manual work"],
+                "urgency_level": "high",
+                "score_hint": 42,
+            }
+        )
+        + "\n```"
+    )
+    parser = IncrementalObjectParser()
+
+    emitted = []
+    for i in range(0, len(text), 7):
+        emitted.extend(parser.feed(text[i : i + 7]))
+
+    assert emitted == [
+        ("industry", "Software"),
+        ("pain_points", ["slow sales", "manual work"]),
+        ("urgency_level", "high"),
+        ("score_hint", 42),
+    ]
+
+
+def test_partial_values_are_held_back():
+    """Test truncated strings and numbers wait for more input"""
+    parser = IncrementalObjectParser()
+
+    assert parser.feed('{"industry": "Soft') == []
+    assert parser.feed('ware", "count": 12') == [("industry", "Software")]
+    assert parser.feed("3}") == [("count", 123)]
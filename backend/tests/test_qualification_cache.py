@@ -0,0 +1,84 @@
+"""
+Tests for the qualification result cache
+"""
+
+import time
+
+from models.schemas import LeadInput, LeadSource
+from services.qualification_cache import QualificationCache
+
+ANALYSIS = {"urgency_level": "high", "recommended_action": "Call today"}
+
+
+def _lead(**overrides) -> LeadInput:
+    data = {
+        "name": "Sarah Johnson",
+        "email": "sarah@bigcorp.com",
+        "company": "BigCorp Inc",
+        "website": "https://bigcorp.com",
+        "message": "We urgently need a CRM for our sales team.",
+        "source": LeadSource.REFERRAL,
+    }
+    data.update(overrides)
+    return LeadInput(**data)
+
+
+def test_key_ignores_formatting_differences():
+    """Test normalized content produces the same key"""
+    key = QualificationCache.make_key(_lead())
+    resubmitted = _lead(
+        name="Sarah J.",
+        email="other@bigcorp.com",
+        company="  bigcorp inc ",
+        website="http://www.bigcorp.com/",
+        message="We urgently need a CRM   for our sales team.",
+    )
+
+    assert QualificationCache.make_key(resubmitted) == key
+    assert QualificationCache.make_key(_lead(source=LeadSource.EMAIL)) != key
+    assert QualificationCache.make_key(_lead(message="Different message here")) != key
+
+
+def test_hit_miss_counters():
+    """Test lookups are counted"""
+    cache = QualificationCache(max_entries=10, ttl_seconds=60, db_path="")
+    key = cache.make_key(_lead())
+
+    assert cache.get(key) is None
+    cache.set(key, ANALYSIS)
+    assert cache.get(key) == ANALYSIS
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_lru_eviction_and_ttl():
+    """Test least recently used and expired entries are dropped"""
+    cache = QualificationCache(max_entries=2, ttl_seconds=60, db_path="")
+    cache.set("a", ANALYSIS)
+    cache.set("b", ANALYSIS)
+    cache.get("a")
+    cache.set("c", ANALYSIS)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+    expiring = QualificationCache(max_entries=2, ttl_seconds=0.01, db_path="")
+    expiring.set("a", ANALYSIS)
+    time.sleep(0.02)
+    assert expiring.get("a") is None
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    """Test analyses persisted to SQLite are served by a new instance"""
+    db_path = str(tmp_path / "cache.db")
+    QualificationCache(max_entries=10, ttl_seconds=60, db_path=db_path).set(
+        "key", ANALYSIS
+    )
+
+    restarted = QualificationCache(max_entries=10, ttl_seconds=60, db_path=db_path)
+
+    assert restarted.get("key") == ANALYSIS
+    assert restarted.stats()["disk_hits"] == 1
@@ -0,0 +1,145 @@
+"""
+Tests for Airtable request pacing and retry
+"""
+
+import io
+import time
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from services.rate_limit import RateLimitedAdapter, TokenBucket
+
+
+def _response(status: int) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response.raw = io.BytesIO(b"")
+    return response
+
+
+def test_token_bucket_paces_bursts():
+    """Test requests beyond the burst wait for refill"""
+    bucket = TokenBucket(rate=50, capacity=2)
+
+    start = time.monotonic()
+    for _ in range(5):
+        bucket.acquire()
+    elapsed = time.monotonic() - start
+
+    # 2 immediate, 3 more at 50/s
+    assert elapsed >= 0.05
+    assert bucket.throttled == 3
+    assert bucket.waiting == 0
+
+
+def test_adapter_retries_throttled_responses(monkeypatch):
+    """Test 429 and 5xx responses are retried until success"""
+    statuses = iter([429, 503, 200])
+    monkeypatch.setattr(
+        HTTPAdapter, "send", lambda self, request, **kwargs: _response(next(statuses))
+    )
+    adapter = RateLimitedAdapter(
+        TokenBucket(rate=1000, capacity=10),
+        max_retries=5,
+        backoff_base=0.001,
+        backoff_max=0.01,
+    )
+
+    response = adapter.send(
+        requests.Request("GET", "https://api.airtable.com").prepare()
+    )
+
+    assert response.status_code == 200
+    metrics = adapter.metrics()
+    assert metrics["retries"] == 2
+    assert metrics["rate_limited_responses"] == 1
+    assert metrics["server_error_responses"] == 1
+
+
+def test_adapter_gives_up_after_max_retries(monkeypatch):
+    """Test a persistent 429 is returned to the caller after the retry limit"""
+    monkeypatch.setattr(
+        HTTPAdapter, "send", lambda self, request, **kwargs: _response(429)
+    )
+    adapter = RateLimitedAdapter(
+        TokenBucket(rate=1000, capacity=10),
+        max_retries=2,
+        backoff_base=0.001,
+        backoff_max=0.01,
+    )
+
+    response = adapter.send(
+        requests.Request("GET", "https://api.airtable.com").prepare()
+    )
+
+    assert response.status_code == 429
+    assert adapter.retries == 2
+
+
+def test_adapter_does_not_retry_server_errors_on_create(monkeypatch):
+    """Test a 5xx on a POST is returned, since the record may exist"""
+    statuses = iter([503, 200])
+    monkeypatch.setattr(
+        HTTPAdapter, "send", lambda self, request, **kwargs: _response(next(statuses))
+    )
+    adapter = RateLimitedAdapter(
+        TokenBucket(rate=1000, capacity=10),
+        max_retries=5,
+        backoff_base=0.001,
+        backoff_max=0.01,
+    )
+
+    response = adapter.send(
+        requests.Request("POST", "https://api.airtable.com").prepare()
+    )
+
+    assert response.status_code == 503
+    assert adapter.retries == 0
+
+
+def test_adapter_retries_create_when_connection_never_opened(monkeypatch):
+    """Test a POST is retried on 429 and on a connect timeout"""
+    outcomes = iter([requests.exceptions.ConnectTimeout("connect"), 429, 200])
+
+    def send(self, request, **kwargs):
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return _response(outcome)
+
+    monkeypatch.setattr(HTTPAdapter, "send", send)
+    adapter = RateLimitedAdapter(
+        TokenBucket(rate=1000, capacity=10),
+        max_retries=5,
+        backoff_base=0.001,
+        backoff_max=0.01,
+    )
+
+    response = adapter.send(
+        requests.Request("POST", "https://api.airtable.com").prepare()
+    )
+
+    assert response.status_code == 200
+    assert adapter.metrics()["connection_errors"] == 1
+    assert adapter.retries == 2
+
+
+def test_adapter_does_not_retry_create_after_send(monkeypatch):
+    """Test a connection dropped mid-request is raised, not replayed"""
+
+    def send(self, request, **kwargs):
+        raise requests.exceptions.ConnectionError("connection reset")
+
+    monkeypatch.setattr(HTTPAdapter, "send", send)
+    adapter = RateLimitedAdapter(
+        TokenBucket(rate=1000, capacity=10),
+        max_retries=5,
+        backoff_base=0.001,
+        backoff_max=0.01,
+    )
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        adapter.send(requests.Request("POST", "https://api.airtable.com").prepare())
+    assert adapter.retries == 0
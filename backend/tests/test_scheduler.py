@@ -0,0 +1,88 @@
+"""
+Tests for the Gemini quota scheduler
+"""
+
+import asyncio
+
+import pytest
+
+from models.schemas import LeadInput, LeadSource
+from services.scheduler import (
+    PRIORITY_DEFAULT,
+    PRIORITY_PHONE,
+    PRIORITY_REFERRAL,
+    QualificationScheduler,
+    lead_priority,
+)
+
+
+def test_lead_priority_ordering():
+    """Test referrals and phone leads outrank web forms"""
+    base = {"name": "Lead", "email": "lead@example.com", "message": "Need a CRM soon"}
+
+    referral = LeadInput.model_validate({**base, "source": LeadSource.REFERRAL})
+    phone = LeadInput.model_validate({**base, "phone": "+123456789"})
+
+    assert lead_priority(referral) == PRIORITY_REFERRAL
+    assert lead_priority(phone) == PRIORITY_PHONE
+    assert lead_priority(LeadInput.model_validate(base)) == PRIORITY_DEFAULT
+
+
+@pytest.mark.asyncio
+async def test_saturated_budget_serves_high_priority_first():
+    """Test queued requests are admitted by priority once budget frees up"""
+    scheduler = QualificationScheduler(
+        rpm_limit=1, tpm_limit=10**6, queue_timeout=5, window_seconds=0.05
+    )
+    await scheduler.acquire(PRIORITY_DEFAULT, 10)
+
+    order = []
+
+    async def request(priority, name):
+        await scheduler.acquire(priority, 10)
+        order.append(name)
+
+    await asyncio.gather(
+        request(PRIORITY_DEFAULT, "web_form"),
+        request(PRIORITY_REFERRAL, "referral"),
+    )
+
+    assert order == ["referral", "web_form"]
+    assert scheduler.stats()["throttled"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_queue_timeout_rejects_request():
+    """Test a request that cannot be admitted in time is rejected"""
+    scheduler = QualificationScheduler(rpm_limit=1, tpm_limit=10**6, queue_timeout=0.05)
+    await scheduler.acquire(PRIORITY_DEFAULT, 10)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await scheduler.acquire(PRIORITY_DEFAULT, 10)
+    assert scheduler.stats()["rejected"] == 1
+    await scheduler.stop()
+
+
+@pytest.mark.asyncio
+async def test_try_acquire_only_uses_spare_budget():
+    """Test optional requests are admitted only while budget is free"""
+    scheduler = QualificationScheduler(rpm_limit=2, tpm_limit=10**6, queue_timeout=1)
+
+    assert scheduler.try_acquire(10)
+    await scheduler.acquire(PRIORITY_DEFAULT, 10)
+
+    assert not scheduler.try_acquire(10)
+
+
+@pytest.mark.asyncio
+async def test_throttled_counts_each_request_once():
+    """Test a request requeued while waiting is counted as throttled once"""
+    scheduler = QualificationScheduler(
+        rpm_limit=1, tpm_limit=10**6, queue_timeout=5, window_seconds=0.05
+    )
+    await scheduler.acquire(PRIORITY_DEFAULT, 10)
+    await scheduler.acquire(PRIORITY_DEFAULT, 10)
+
+    assert scheduler.stats()["throttled"] == 1
+    await scheduler.stop()
+    assert scheduler.stats()["admitted"] == 2
@@ -0,0 +1,28 @@
+"""
+Tests for per-request stage timings
+"""
+
+
+def test_lead_response_reports_stage_timings(app_client):
+    """Test Server-Timing and the timing breakdown cover the request stages"""
+    lead = {
+        "name": "Timed Lead",
+        "email": "timed@bigcorp.com",
+        "message": "We need a CRM for our sales team soon.",
+    }
+
+    first = app_client.post("/leads", json=lead)
+    second = app_client.post("/leads", json=lead)
+
+    header = first.headers["server-timing"]
+    for stage in ("llm", "parse", "score", "storage", "total"):
+        assert f"{stage};dur=" in header
+
+    stages = first.json()["timing"]["stages"]
+    assert stages["llm"]["status"] == "ran"
+    assert stages["storage"]["duration_ms"] > 0
+
+    stages = second.json()["timing"]["stages"]
+    assert stages["llm"]["status"] == "cached"
+    assert stages["llm"]["duration_ms"] == 0
+    assert "llm;dur=" not in second.headers["server-timing"]
@@ -0,0 +1,46 @@
+"""
+Tests for lazy service initialization
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+def test_import_needs_no_credentials_or_sdks():
+    """Test main imports without API keys and defers the heavy SDKs"""
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if key not in ("GEMINI_API_KEY", "AIRTABLE_API_KEY", "AIRTABLE_BASE_ID")
+    }
+    code = (
+        "import sys, main; "
+        "print('google.generativeai' in sys.modules, 'pyairtable' in sys.modules, "
+        "'agent' in vars(main))"
+    )
+
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert output.stdout.split() == ["False", "False", "False"]
+
+
+def test_services_are_created_once_on_first_use():
+    """Test service getters build each service lazily and reuse it"""
+    import main
+
+    agent = main.get_agent()
+
+    assert main.get_agent() is agent
+    assert main.agent is agent
+    assert main.get_lead_writer().client is main.get_airtable()
@@ -0,0 +1,55 @@
+"""
+JSON encoding with an opt-in orjson backend
+"""
+
+import json
+import logging
+from typing import Any, Union
+
+from config import get_settings
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# orjson when it is configured and installed, else None
+_orjson = orjson if settings.JSON_BACKEND == "orjson" else None
+if settings.JSON_BACKEND == "orjson" and orjson is None:
+    logger.warning("⚠️ JSON_BACKEND=orjson but orjson is not installed, using json")
+ENABLED = _orjson is not None
+
+
+def dumps(obj: Any) -> str:
+    """Serialize to a JSON string with the configured backend"""
+    if _orjson is not None:
+        return _orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON with the configured backend
+
+    Raises:
+        json.JSONDecodeError: If the input is not valid JSON (orjson's
+            error is a subclass)
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def response_class():
+    """FastAPI response class matching the configured backend"""
+    if ENABLED:
+        from fastapi.responses import ORJSONResponse
+
+        return ORJSONResponse
+
+    from fastapi.responses import JSONResponse
+
+    return JSONResponse
@@ -0,0 +1,56 @@
+"""
+Gemini response schemas derived from Pydantic models
+"""
+
+from typing import Any, Dict, Type
+
+from pydantic import BaseModel
+
+# JSON Schema keywords Gemini's OpenAPI subset understands
+_COPIED_KEYS = ("description", "enum", "format")
+
+
+def response_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Gemini response schema for a Pydantic model
+
+    References are inlined, Optional fields become nullable and every
+    property is required, so the model always emits the full object.
+
+    Args:
+        model: Pydantic model the reply must validate against
+
+    Returns:
+        Schema dict for generation_config["response_schema"]
+    """
+    json_schema = model.model_json_schema()
+    return _convert(json_schema, json_schema.get("$defs", {}))
+
+
+def _convert(node: Dict[str, Any], defs: Dict[str, Any]) -> Dict[str, Any]:
+    """Translate one JSON Schema node"""
+    if "$ref" in node:
+        return _convert(defs[node["$ref"].rsplit("/", 1)[-1]], defs)
+
+    if "anyOf" in node:
+        options = [option for option in node["anyOf"] if option.get("type") != "null"]
+        schema = _convert(options[0], defs)
+        if len(options) < len(node["anyOf"]):
+            schema["nullable"] = True
+        return schema
+
+    schema = {"type": node["type"]}
+    for key in _COPIED_KEYS:
+        if key in node:
+            schema[key] = node[key]
+
+    if node["type"] == "object":
+        schema["properties"] = {
+            name: _convert(child, defs)
+            for name, child in node.get("properties", {}).items()
+        }
+        schema["required"] = list(schema["properties"])
+    elif node["type"] == "array":
+        schema["items"] = _convert(node["items"], defs)
+
+    return schema
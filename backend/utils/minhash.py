@@ -0,0 +1,149 @@
+"""
+MinHash signatures and an LSH index for near-duplicate text lookup
+"""
+
+import random
+import re
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# Mersenne prime used for the universal hash family
+_PRIME = (1 << 61) - 1
+_WORD = re.compile(r"\w+")
+
+
+def shingles(text: str, size: int = 3) -> Set[int]:
+    """
+    Hashed word n-grams of a text
+
+    Args:
+        text: Input text
+        size: Words per shingle
+
+    Returns:
+        Set of 32-bit shingle hashes (a single shingle for short texts)
+    """
+    words = _WORD.findall(text.lower())
+    if len(words) <= size:
+        return {zlib.crc32(" ".join(words).encode("utf-8"))}
+    return {
+        zlib.crc32(" ".join(words[i : i + size]).encode("utf-8"))
+        for i in range(len(words) - size + 1)
+    }
+
+
+class MinHashIndex:
+    """
+    Bounded LSH index that finds stored texts similar to a query
+
+    Each text is reduced to a MinHash signature of `num_perm` values,
+    split into `bands` bands; texts sharing any band are candidates and
+    are confirmed by their estimated Jaccard similarity. The index keeps
+    at most `max_entries` items and evicts the least recently used.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 64,
+        bands: int = 16,
+        max_entries: int = 10000,
+        seed: int = 1,
+    ):
+        """Initialize an empty index"""
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.max_entries = max_entries
+
+        rng = random.Random(seed)
+        self._params = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME))
+            for _ in range(num_perm)
+        ]
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, ...], Any]]" = OrderedDict()
+        self._buckets: List[Dict[Tuple[int, ...], Set[str]]] = [
+            {} for _ in range(bands)
+        ]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def signature(self, text: str) -> Tuple[int, ...]:
+        """MinHash signature of a text"""
+        hashes = shingles(text)
+        return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in self._params)
+
+    def add(self, key: str, text: str, payload: Any):
+        """
+        Index a text, replacing any entry with the same key
+
+        Args:
+            key: Unique identifier of the text
+            text: Text to index
+            payload: Value returned by query() on a match
+        """
+        if key in self._entries:
+            self._remove(key)
+
+        signature = self.signature(text)
+        self._entries[key] = (signature, payload)
+        for band, bucket in zip(self._bands(signature), self._buckets):
+            bucket.setdefault(band, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def query(self, text: str) -> Optional[Tuple[Any, float]]:
+        """
+        Find the most similar indexed text above the threshold
+
+        Args:
+            text: Text to look up
+
+        Returns:
+            (payload, estimated Jaccard similarity) of the best match, or
+            None if nothing is similar enough
+        """
+        signature = self.signature(text)
+
+        candidates: Set[str] = set()
+        for band, bucket in zip(self._bands(signature), self._buckets):
+            candidates.update(bucket.get(band, ()))
+
+        best_key, best_similarity = None, 0.0
+        for key in candidates:
+            stored, _ = self._entries[key]
+            similarity = (
+                sum(1 for x, y in zip(signature, stored) if x == y) / self.num_perm
+            )
+            if similarity > best_similarity:
+                best_key, best_similarity = key, similarity
+
+        if best_key is None or best_similarity < self.threshold:
+            return None
+
+        self._entries.move_to_end(best_key)
+        return self._entries[best_key][1], best_similarity
+
+    def _bands(self, signature: Tuple[int, ...]) -> List[Tuple[int, ...]]:
+        """Split a signature into its LSH bands"""
+        return [
+            signature[i : i + self.rows] for i in range(0, self.num_perm, self.rows)
+        ]
+
+    def _remove(self, key: str):
+        """Drop an entry and its bucket memberships"""
+        signature, _ = self._entries.pop(key)
+        for band, bucket in zip(self._bands(signature), self._buckets):
+            members = bucket.get(band)
+            if members is None:
+                continue
+            members.discard(key)
+            if not members:
+                del bucket[band]
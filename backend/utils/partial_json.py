@@ -0,0 +1,88 @@
+"""
+Incremental parsing of a JSON object that arrives in chunks
+"""
+
+import json
+from typing import Any, Dict, List, Tuple
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+
+
+class IncrementalObjectParser:
+    """
+    Extracts top-level fields of a JSON object as soon as they are complete
+
+    Feed streamed model output chunk by chunk; each call returns the
+    (key, value) pairs that became fully parseable with that chunk. Text
+    before the opening brace (such as a markdown fence) is ignored.
+    """
+
+    def __init__(self):
+        """Initialize empty parser state"""
+        self._buffer = ""
+        self._pos = -1
+        self.fields: Dict[str, Any] = {}
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Add a chunk of text and return newly completed fields
+
+        Args:
+            chunk: Next piece of the streamed JSON text
+
+        Returns:
+            List of (key, value) pairs completed by this chunk
+        """
+        self._buffer += chunk
+        completed: List[Tuple[str, Any]] = []
+
+        if self._pos < 0:
+            start = self._buffer.find("{")
+            if start < 0:
+                return completed
+            self._pos = start + 1
+
+        while True:
+            field = self._next_field()
+            if field is None:
+                return completed
+            key, value, end = field
+            self.fields[key] = value
+            completed.append((key, value))
+            self._pos = end
+
+    def _next_field(self):
+        """Parse the next complete key/value pair, or None if not ready"""
+        buffer = self._buffer
+        i = self._skip(self._pos, _WHITESPACE + ",")
+        if i >= len(buffer) or buffer[i] == "}":
+            return None
+
+        try:
+            key, i = _decoder.raw_decode(buffer, i)
+        except ValueError:
+            return None
+
+        i = self._skip(i, _WHITESPACE)
+        if i >= len(buffer) or buffer[i] != ":":
+            return None
+
+        i = self._skip(i + 1, _WHITESPACE)
+        try:
+            value, end = _decoder.raw_decode(buffer, i)
+        except ValueError:
+            return None
+
+        # Numbers and literals are only final once a delimiter follows
+        if not isinstance(value, (str, list, dict)):
+            if self._skip(end, _WHITESPACE) >= len(buffer):
+                return None
+
+        return str(key), value, end
+
+    def _skip(self, i: int, chars: str) -> int:
+        """Advance past any of the given characters"""
+        while i < len(self._buffer) and self._buffer[i] in chars:
+            i += 1
+        return i
@@ -1,6 +1,6 @@
 import { Loader2, Send } from "lucide-react";
 import { useState } from "react";
-import { qualifyLead } from "../services/api";
+import { qualifyLeadStream } from "../services/api";
 
 export default function LeadForm({ onLeadQualified }) {
   const [formData, setFormData] = useState({
@@ -15,14 +15,18 @@ export default function LeadForm({ onLeadQualified }) {
 
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState(null);
+  const [partial, setPartial] = useState({});
 
   const handleSubmit = async (e) => {
     e.preventDefault();
     setLoading(true);
     setError(null);
+    setPartial({});
 
     try {
-      const result = await qualifyLead(formData);
+      const result = await qualifyLeadStream(formData, (field, value) =>
+        setPartial((fields) => ({ ...fields, [field]: value }))
+      );
       onLeadQualified(result);
 
       // Reset form
@@ -36,9 +40,10 @@ export default function LeadForm({ onLeadQualified }) {
         source: "web_form",
       });
     } catch (err) {
-      setError(err.response?.data?.detail || "Failed to qualify lead");
+      setError(err.message || "Failed to qualify lead");
     } finally {
       setLoading(false);
+      setPartial({});
     }
   };
 
@@ -168,6 +173,21 @@ export default function LeadForm({ onLeadQualified }) {
           </div>
         </div>
 
+        {loading && Object.keys(partial).length > 0 && (
+          <div className="p-4 bg-blue-50 border border-blue-200 rounded-lg text-sm text-gray-700 space-y-1">
+            {["industry", "company_size", "urgency_level", "buying_intent"]
+              .filter((field) => partial[field])
+              .map((field) => (
+                <p key={field}>
+                  <span className="font-medium capitalize">
+                    {field.replace("_", " ")}:
+                  </span>{" "}
+                  {partial[field]}
+                </p>
+              ))}
+          </div>
+        )}
+
         <button
           type="submit"
           disabled={loading}
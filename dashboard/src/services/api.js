@@ -14,6 +14,49 @@ export const qualifyLead = async (leadData) => {
   return response.data;
 };
 
+// Streams qualification progress as Server-Sent Events.
+// onField is called with (field, value) as each analysis field arrives;
+// resolves with the final LeadResponse.
+export const qualifyLeadStream = async (leadData, onField) => {
+  const response = await fetch(`${API_URL}/leads/stream`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify(leadData),
+  });
+
+  if (!response.ok) {
+    const body = await response.json().catch(() => ({}));
+    throw new Error(
+      typeof body.detail === "string" ? body.detail : "Failed to qualify lead"
+    );
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let boundary;
+    while ((boundary = buffer.indexOf("\n\n")) >= 0) {
+      const message = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+
+      const event = message.match(/^event: (.*)$/m)?.[1];
+      const data = JSON.parse(message.match(/^data: (.*)$/m)?.[1] || "null");
+
+      if (event === "field") onField?.(data.field, data.value);
+      if (event === "result") return data;
+      if (event === "error") throw new Error(data.detail);
+    }
+  }
+
+  throw new Error("Stream ended before a result was received");
+};
+
 export const healthCheck = async () => {
   const response = await api.get("/health");
   return response.data;